@@ -27,6 +27,10 @@ class TimeSuite:
         for i in range(10000):
             arr = ds[i * 10:(i + 1) * 10]
 
+    def time_read_many(self):
+        ds = self.f['a']
+        arrs = ds.read_many([np.s_[i * 10:(i + 1) * 10] for i in range(10000)])
+
 class WritingTimeSuite:
     """Based on example in GitHub issue 492:
     https://github.com/h5py/h5py/issues/492
@@ -55,3 +59,52 @@ class WritingTimeSuite:
         data = np.zeros(self.shape[:2])
         for i in range(self.shape[2]):
             ds[..., i:i+1] = data[..., np.newaxis]
+
+class FancyIndexingSuite:
+    """Fancy indexing along the first axis with index arrays of various sizes
+
+    Runs of consecutive indices ('contiguous') are cheaper to select than
+    isolated ones ('strided', 'random').
+    """
+    params = ([10, 1000, 100_000, 1_000_000], ['contiguous', 'strided', 'random'])
+    param_names = ['n_indices', 'pattern']
+    timeout = 300
+
+    def setup(self, n, pattern):
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        nrows = 4_000_000
+        with h5py.File(path, 'w') as f:
+            f.create_dataset('a', data=np.ones((nrows, 4), dtype=np.uint8),
+                             chunks=(65536, 4))
+
+        if pattern == 'contiguous':
+            self.idx = np.arange(n)
+        elif pattern == 'strided':
+            self.idx = np.arange(0, 3 * n, 3)
+        else:
+            rng = np.random.default_rng(0)
+            self.idx = np.sort(rng.choice(nrows, n, replace=False))
+
+        self.f = h5py.File(path, 'r')
+
+    def teardown(self, n, pattern):
+        self.f.close()
+        self._td.cleanup()
+
+    def time_select(self, n, pattern):
+        ds = self.f['a']
+        ds._selector.make_selection((self.idx, slice(None)))
+
+    def time_read(self, n, pattern):
+        self.f['a'][self.idx, :]
+
+
+class ImportSuite:
+    """ Time `import h5py` in a fresh interpreter """
+    def timeraw_import_h5py(self):
+        return """
+        import h5py
+        """, """
+        import numpy
+        """
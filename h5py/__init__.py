@@ -53,9 +53,10 @@ _register_lzf()
 
 # --- Public API --------------------------------------------------------------
 
-from . import h5a, h5d, h5ds, h5f, h5fd, h5g, h5r, h5s, h5t, h5p, h5z, h5pl
+from . import h5a, h5d, h5f, h5fd, h5g, h5r, h5s, h5t, h5p, h5z
 
 from ._hl import filters
+from ._hl.chunks import decoded_chunk_cache
 from ._hl.base import is_hdf5, HLObject, Empty
 from ._hl.files import (
     File,
@@ -83,6 +84,21 @@ from .h5s import UNLIMITED
 from .version import version as __version__
 
 
+# Rarely used low-level modules, imported on first access (PEP 562)
+_lazy_modules = {'h5ds', 'h5pl'}
+
+
+def __getattr__(name):
+    if name in _lazy_modules:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_modules)
+
+
 def run_tests(args=''):
     """Run tests with pytest and returns the exit status as an int.
     """
@@ -14,7 +14,6 @@
 """
 include "config.pxi"
 
-from logging import getLogger
 
 from .h5 import get_config
 from .h5r cimport Reference, RegionReference, hobj_ref_t, hdset_reg_ref_t
@@ -30,6 +29,7 @@ cimport numpy as cnp
 from numpy cimport npy_intp, NPY_ARRAY_WRITEABLE, NPY_ARRAY_C_CONTIGUOUS, NPY_ARRAY_OWNDATA, PyArray_DATA
 cnp._import_array()
 import numpy as np
+import sys
 
 from cpython.buffer cimport (
     PyObject_GetBuffer, PyBuffer_ToContiguous, PyBuffer_Release, PyBUF_INDIRECT
@@ -37,7 +37,6 @@ from cpython.buffer cimport (
 from cpython.object cimport PyObject
 from cpython.ref cimport Py_INCREF, Py_XDECREF, Py_XINCREF
 
-logger = getLogger(__name__)
 
 cdef PyObject* Py_None = <PyObject*> None
 
@@ -120,7 +119,11 @@ cdef herr_t generic_converter(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,
 # Helper functions
 
 cdef void log_convert_registered(hid_t src, hid_t dst):
-    logger.debug("Creating converter from %s to %s", H5Tget_class(src), H5Tget_class(dst))
+    # Converters are created while h5py is imported: don't import logging
+    # for them.  If it isn't imported yet, it can't be set to show this.
+    logging = sys.modules.get('logging')
+    if logging is not None:
+        logging.getLogger(__name__).debug("Creating converter from %s to %s", H5Tget_class(src), H5Tget_class(dst))
 
 
 # =============================================================================
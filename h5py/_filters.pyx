@@ -0,0 +1,190 @@
+# cython: language_level=3
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Implementations of the built-in shuffle, fletcher32 and LZF filters
+    which work on raw chunk buffers outside the HDF5 library.
+
+    These are used together with DatasetID.read_direct_chunk and
+    write_direct_chunk to encode and decode chunks in Python threads.  All
+    of them release the GIL while they work.  DEFLATE is not implemented
+    here, as the zlib module in the standard library also releases the GIL.
+
+    The output must be byte-for-byte identical to what the HDF5 filter
+    pipeline produces, so files written either way are interchangeable.
+"""
+
+from libc.stdint cimport uint8_t, uint32_t
+from libc.string cimport memcpy
+from libc.errno cimport errno, E2BIG
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+
+cdef extern from "lzf.h":
+    unsigned int _lzf_compress "lzf_compress" (
+        const void *in_data, unsigned int in_len,
+        void *out_data, unsigned int out_len) nogil
+    unsigned int _lzf_decompress "lzf_decompress" (
+        const void *in_data, unsigned int in_len,
+        void *out_data, unsigned int out_len) nogil
+
+
+cdef void _shuffle(const uint8_t* src, uint8_t* dst, size_t nbytes,
+                   size_t elsize, bint reverse) noexcept nogil:
+    # Byte transposition as done by H5Z__filter_shuffle.  Trailing bytes
+    # which don't make up a whole element are copied unchanged.
+    cdef size_t nelem = nbytes // elsize
+    cdef size_t i, j
+
+    if elsize <= 1 or nelem <= 1:
+        memcpy(dst, src, nbytes)
+        return
+
+    if reverse:
+        for i in range(elsize):
+            for j in range(nelem):
+                dst[j * elsize + i] = src[i * nelem + j]
+    else:
+        for i in range(elsize):
+            for j in range(nelem):
+                dst[i * nelem + j] = src[j * elsize + i]
+
+    memcpy(dst + nelem * elsize, src + nelem * elsize, nbytes - nelem * elsize)
+
+
+cdef uint32_t _fletcher32(const uint8_t* data, size_t nbytes) noexcept nogil:
+    # Same algorithm and byte order as H5_checksum_fletcher32
+    cdef size_t length = nbytes // 2
+    cdef size_t tlen
+    cdef uint32_t sum1 = 0, sum2 = 0
+
+    while length:
+        tlen = 360 if length > 360 else length
+        length -= tlen
+        while tlen:
+            sum1 += ((<uint32_t>data[0]) << 8) | (<uint32_t>data[1])
+            data += 2
+            sum2 += sum1
+            tlen -= 1
+        sum1 = (sum1 & 0xffff) + (sum1 >> 16)
+        sum2 = (sum2 & 0xffff) + (sum2 >> 16)
+
+    if nbytes % 2:
+        sum1 += (<uint32_t>data[0]) << 8
+        sum2 += sum1
+        sum1 = (sum1 & 0xffff) + (sum1 >> 16)
+        sum2 = (sum2 & 0xffff) + (sum2 >> 16)
+
+    sum1 = (sum1 & 0xffff) + (sum1 >> 16)
+    sum2 = (sum2 & 0xffff) + (sum2 >> 16)
+
+    return (sum2 << 16) | sum1
+
+
+def shuffle(const uint8_t[::1] data not None, size_t elsize):
+    """ (BUFFER data, UINT elsize) => BYTEARRAY
+
+    Apply the shuffle filter to data made of elements of elsize bytes.
+    """
+    cdef size_t nbytes = data.shape[0]
+    cdef object out = PyByteArray_FromStringAndSize(NULL, nbytes)
+    cdef uint8_t* dst = <uint8_t*>PyByteArray_AS_STRING(out)
+
+    if nbytes:
+        with nogil:
+            _shuffle(&data[0], dst, nbytes, elsize, False)
+    return out
+
+
+def unshuffle(const uint8_t[::1] data not None, size_t elsize):
+    """ (BUFFER data, UINT elsize) => BYTEARRAY
+
+    Reverse the shuffle filter for data made of elements of elsize bytes.
+    """
+    cdef size_t nbytes = data.shape[0]
+    cdef object out = PyByteArray_FromStringAndSize(NULL, nbytes)
+    cdef uint8_t* dst = <uint8_t*>PyByteArray_AS_STRING(out)
+
+    if nbytes:
+        with nogil:
+            _shuffle(&data[0], dst, nbytes, elsize, True)
+    return out
+
+
+def fletcher32(const uint8_t[::1] data not None):
+    """ (BUFFER data) => INT checksum
+
+    Compute the Fletcher-32 checksum of data, as the fletcher32 filter
+    does.  The filter stores it little-endian after the data.
+    """
+    cdef uint32_t checksum = 0
+    cdef size_t nbytes = data.shape[0]
+
+    if nbytes:
+        with nogil:
+            checksum = _fletcher32(&data[0], nbytes)
+    return checksum
+
+
+def lzf_compress(const uint8_t[::1] data not None):
+    """ (BUFFER data) => BYTES or None
+
+    Compress data with LZF.  Like the LZF filter, this gives up and returns
+    None if the compressed data would not be smaller than the input; the
+    chunk should then be stored with the filter marked as skipped.
+    """
+    cdef unsigned int nbytes = data.shape[0]
+    cdef unsigned int status = 0
+    cdef object out
+    cdef char* dst
+
+    if nbytes == 0:
+        return None
+
+    out = PyBytes_FromStringAndSize(NULL, nbytes)
+    dst = PyBytes_AS_STRING(out)
+    with nogil:
+        status = _lzf_compress(&data[0], nbytes, dst, nbytes)
+    if status == 0:
+        return None
+    return out[:status]
+
+
+def lzf_decompress(const uint8_t[::1] data not None, size_t nbytes):
+    """ (BUFFER data, UINT nbytes) => BYTEARRAY
+
+    Decompress LZF data.  nbytes is the expected size of the output; the
+    buffer is grown if that turns out to be too small.
+    """
+    cdef unsigned int insize = data.shape[0]
+    cdef unsigned int status = 0
+    cdef int err = 0
+    cdef size_t outsize = nbytes if nbytes > 0 else insize
+    cdef object out
+    cdef char* dst
+
+    if insize == 0:
+        return bytearray()
+
+    while True:
+        out = PyByteArray_FromStringAndSize(NULL, outsize)
+        dst = PyByteArray_AS_STRING(out)
+        with nogil:
+            status = _lzf_decompress(&data[0], insize, dst, outsize)
+            err = errno
+        if status != 0:
+            break
+        if err != E2BIG:
+            raise ValueError("Invalid data for LZF decompression")
+        outsize += insize
+
+    if status != outsize:
+        del out[status:]
+    return out
@@ -15,7 +15,6 @@
 """
 
 import numpy
-import uuid
 
 from .. import h5, h5s, h5t, h5a, h5p
 from . import base
@@ -53,7 +52,11 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
     def __getitem__(self, name):
         """ Read the value of an attribute.
         """
-        attr = h5a.open(self._id, self._e(name))
+        return self._read(h5a.open(self._id, self._e(name)))
+
+    @staticmethod
+    def _read(attr):
+        """ Read the value of an open attribute (an AttrID) """
         shape = attr.shape
 
         # shape is None for empty dataspaces
@@ -64,7 +67,7 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
 
         # Do this first, as we'll be fiddling with the dtype for top-level
         # array types
-        htype = h5t.py_create(dtype)
+        htype = h5t.py_create_cached(dtype)
 
         # NumPy doesn't support top-level array types, so we have to "fake"
         # the correct type and shape for the array.  For example, consider
@@ -88,6 +91,22 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
             return arr[()]
         return arr
 
+    def read_all(self):
+        """ Read all attributes into a dict, in the order of iterating over
+        them.
+
+        This reads the attributes in one pass, holding the lock throughout,
+        so it's faster than reading them one by one (e.g. ``dict(obj.attrs)``).
+        """
+        values = {}
+        with phil:
+            def read_cb(name):
+                """ Callback to read each attribute """
+                values[self._d(name)] = self._read(h5a.open(self._id, name))
+
+            h5a.iterate(self._id, read_cb, index_type=self._index_type())
+        return values
+
     def get_id(self, name):
         """Get a low-level AttrID object for the named attribute.
         """
@@ -209,6 +228,25 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
                 raise
             attr.close()
 
+    def update_many(self, mapping=(), **kwargs):
+        """ Create or overwrite several attributes, taking names & values
+        like dict.update(): from a mapping or an iterable of (name, value)
+        pairs, and keyword arguments.
+
+        The lock is held throughout, and all values are converted to arrays
+        (with an HDF5 type) before any attribute is written, so that if one
+        can't be stored, the attributes are left unchanged.
+        """
+        with phil:
+            items = []
+            for name, value in dict(mapping, **kwargs).items():
+                if not isinstance(value, Empty):
+                    value = base.array_for_new_object(value)
+                    h5t.py_create_cached(value.dtype, logical=True)
+                items.append((name, value))
+            for name, value in items:
+                self.create(name, value)
+
     def modify(self, name, value):
         """ Change the value of an attribute while preserving its type.
 
@@ -253,19 +291,20 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
                 """ Callback to gather attribute names """
                 attrlist.append(self._d(name))
 
-            cpl = self._id.get_create_plist()
-            crt_order = cpl.get_attr_creation_order()
-            cpl.close()
-            if crt_order & h5p.CRT_ORDER_TRACKED:
-                idx_type = h5.INDEX_CRT_ORDER
-            else:
-                idx_type = h5.INDEX_NAME
-
-            h5a.iterate(self._id, iter_cb, index_type=idx_type)
+            h5a.iterate(self._id, iter_cb, index_type=self._index_type())
 
         for name in attrlist:
             yield name
 
+    def _index_type(self):
+        """ Index to iterate over: creation order if tracked, else name """
+        cpl = self._id.get_create_plist()
+        crt_order = cpl.get_attr_creation_order()
+        cpl.close()
+        if crt_order & h5p.CRT_ORDER_TRACKED:
+            return h5.INDEX_CRT_ORDER
+        return h5.INDEX_NAME
+
     @with_phil
     def __contains__(self, name):
         """ Determine if an attribute exists, by name. """
@@ -0,0 +1,390 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Chunk-level I/O which bypasses the HDF5 filter pipeline.
+
+    Raw chunks are read and written by HDF5 with read_direct_chunk and
+    write_direct_chunk, one at a time, while the (de)compression is done by
+    FilterPipeline on a pool of threads.  Undocumented and subject to change
+    without warning.
+
+    The functions here should be called without holding phil.  Each HDF5
+    call takes it separately, so other threads can use h5py while chunks
+    are being (de)compressed.
+"""
+
+from collections import deque, OrderedDict
+import itertools
+import os
+import threading
+
+import numpy
+
+from .base import phil, product
+from .selections import SimpleSelection
+from .. import h5o
+
+
+def chunk_slices(start, count, step, chunk):
+    """ Split a strided selection along one axis into per-chunk pieces.
+
+    Yields (chunk_start, chunk_sel, out_sel) for each chunk containing
+    selected points: chunk_sel indexes the chunk and out_sel the array of
+    count selected points.
+    """
+    i = 0
+    while i < count:
+        first = start + i * step
+        c0 = first - first % chunk
+        # Index just past the last selected point inside this chunk
+        i_end = min(count, -((start - c0 - chunk) // step))
+        yield (
+            c0,
+            slice(first - c0, first - c0 + (i_end - i - 1) * step + 1, step),
+            slice(i, i_end),
+        )
+        i = i_end
+
+
+def touched_chunks(start, count, step, chunks):
+    """ Iterate over (offset, chunk_sel, out_sel) for every chunk touched by
+    a strided selection, given its start, count and step on each axis.
+    """
+    per_axis = [list(chunk_slices(*args)) for args in zip(start, count, step, chunks)]
+    for pieces in itertools.product(*per_axis):
+        yield (
+            tuple(p[0] for p in pieces),
+            tuple(p[1] for p in pieces),
+            tuple(p[2] for p in pieces),
+        )
+
+
+def _touched_chunks(selection, chunks):
+    """ touched_chunks for a SimpleSelection """
+    start, count, step, _ = selection._sel
+    return touched_chunks(start, count, step, chunks)
+
+
+def default_workers(max_workers):
+    """ Number of threads to use if the caller didn't say """
+    if max_workers is None:
+        return os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    return max_workers
+
+
+def _imap(func, args_iter, max_workers, window=None, ordered=True):
+    """ Call func(*args) for each item of args_iter on a pool of threads,
+    yielding the results in order, or as they complete if not ordered.
+
+    args_iter is consumed lazily on the calling thread, with at most
+    window (default 2 * max_workers) calls in flight or waiting to be
+    yielded, so memory use stays bounded.  With a window of 0, or by
+    default with one worker, the calls are made on the calling thread.
+    """
+    if window is None:
+        window = 2 * max_workers if max_workers > 1 else 0
+    if window == 0:
+        for args in args_iter:
+            yield func(*args)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pending = deque()
+
+    def next_result():
+        if ordered:
+            return pending.popleft().result()
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        fut = next(f for f in pending if f in done)
+        pending.remove(fut)
+        return fut.result()
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        try:
+            for args in args_iter:
+                if len(pending) >= window:
+                    yield next_result()
+                pending.append(executor.submit(func, *args))
+            while pending:
+                yield next_result()
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
+class DecodedChunkCache:
+
+    """ A least-recently-used cache of decoded chunks, shared by all datasets
+    in all files.
+
+    Unlike HDF5's chunk cache, which belongs to one open dataset, chunks
+    stay cached when datasets and files are closed and opened again.  The
+    cache is used when reading slices from datasets that read_parallel can
+    handle, in files opened with the 'sec2' or 'stdio' drivers.  It is
+    disabled until given a size in bytes::
+
+        h5py.decoded_chunk_cache.resize(256 * 1024**2)
+
+    Datasets are identified by the device and inode of the file, its
+    modification time when the dataset was opened, and the address of the
+    dataset in the file.  Cached chunks are discarded when the dataset is
+    written to, resized or refreshed through h5py, or opened for writing.
+    Changes made through the low-level API (e.g. write_direct_chunk) are
+    not noticed.
+    """
+
+    def __init__(self, capacity=0):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (ident, version, offset) -> array
+        self._by_dataset = {}          # ident -> set of keys
+        self._generation = {}          # ident -> count of invalidations
+        self._capacity = capacity
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return "<DecodedChunkCache: %d chunks, %d/%d bytes>" % (
+            len(self), self.nbytes, self._capacity)
+
+    @property
+    def capacity(self):
+        """ Maximum size of the cached chunks in bytes; 0 means disabled """
+        return self._capacity
+
+    def resize(self, capacity):
+        """ Change the capacity in bytes, discarding chunks to fit """
+        if capacity < 0:
+            raise ValueError("Cache capacity can't be negative")
+        with self._lock:
+            self._capacity = capacity
+            self._evict()
+
+    def clear(self):
+        """ Discard all cached chunks """
+        with self._lock:
+            self._entries.clear()
+            self._by_dataset.clear()
+            self.nbytes = 0
+
+    def reset_stats(self):
+        """ Set the hits, misses and evictions counters to 0 """
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        """ Return the cached chunk array, or None """
+        with self._lock:
+            arr = self._entries.get(key)
+            if arr is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return arr
+
+    def generation(self, ident):
+        """ Count of invalidations for a dataset; see put() """
+        with self._lock:
+            return self._generation.get(ident, 0)
+
+    def put(self, key, arr, generation):
+        """ Add a chunk, evicting others as needed.
+
+        generation is the value of self.generation(ident) from before the
+        chunk was read.  If the dataset has been invalidated since, the
+        chunk may be stale and isn't stored.  Neither are chunks bigger than
+        the whole cache.
+        """
+        with self._lock:
+            if arr.nbytes > self._capacity:
+                return
+            if self._generation.get(key[0], 0) != generation:
+                return
+            arr.flags.writeable = False
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = arr
+            self._by_dataset.setdefault(key[0], set()).add(key)
+            self.nbytes += arr.nbytes
+            self._evict()
+
+    def invalidate(self, ident):
+        """ Discard the cached chunks of one dataset """
+        with self._lock:
+            self._generation[ident] = self._generation.get(ident, 0) + 1
+            for key in self._by_dataset.pop(ident, ()):
+                self.nbytes -= self._entries.pop(key).nbytes
+
+    def _evict(self):
+        while self.nbytes > self._capacity:
+            key, arr = self._entries.popitem(last=False)
+            keys = self._by_dataset[key[0]]
+            keys.discard(key)
+            if not keys:
+                del self._by_dataset[key[0]]
+            self.nbytes -= arr.nbytes
+            self.evictions += 1
+
+
+decoded_chunk_cache = DecodedChunkCache()
+
+
+def cache_key(dset):
+    """ (ident, version) identifying a dataset in decoded_chunk_cache, or
+    None if its chunks can't be cached.
+    """
+    if not dset._direct_chunk_ok:
+        return None
+    f = dset.file
+    if f.driver not in ('sec2', 'stdio'):
+        return None
+    st = os.stat(f.filename)
+    addr = h5o.get_info(dset.id).addr
+    return (st.st_dev, st.st_ino, addr), st.st_mtime_ns
+
+
+def read_chunks(dset, selection, max_workers=None, cache_key=None):
+    """ Read a SimpleSelection from a chunked dataset, decoding the chunks
+    in parallel.
+
+    If cache_key is given, decoded chunks are looked up in and added to
+    decoded_chunk_cache.  The caller must have checked
+    Dataset._direct_chunk_ok.  Returns an array of shape selection.mshape.
+    """
+    dsid = dset.id
+    dtype = dset.dtype
+    chunks = dset.chunks
+    pipeline = dset._filter_pipeline
+    chunk_items = product(chunks)
+    chunk_nbytes = chunk_items * dtype.itemsize
+
+    out = numpy.empty(selection.mshape, dtype=dtype)
+    fillvalue = None
+    if cache_key is not None:
+        generation = decoded_chunk_cache.generation(cache_key[0])
+
+    def scatter(offset, data, filter_mask, chunk_sel, out_sel):
+        data = pipeline.decode(data, filter_mask, chunk_nbytes)
+        arr = numpy.frombuffer(data, dtype=dtype, count=chunk_items).reshape(chunks)
+        out[out_sel] = arr[chunk_sel]
+        if cache_key is not None:
+            decoded_chunk_cache.put(cache_key + (offset,), arr, generation)
+
+    todo = []
+    for offset, chunk_sel, out_sel in _touched_chunks(selection, chunks):
+        if cache_key is not None:
+            arr = decoded_chunk_cache.get(cache_key + (offset,))
+            if arr is not None:
+                out[out_sel] = arr[chunk_sel]
+                continue
+
+        info = dsid.get_chunk_info_by_coord(offset)
+        if info.byte_offset is None:
+            # Never written; HDF5 would give the fill value
+            if fillvalue is None:
+                fillvalue = dset.fillvalue
+            out[out_sel] = fillvalue
+        else:
+            # Some HDF5 versions return a stale filter mask from
+            # H5Dread_chunk for chunks written in this session, so take it
+            # from the chunk index instead.
+            todo.append((offset, info.filter_mask, chunk_sel, out_sel))
+
+    def raw_chunks():
+        # Reading stays on this thread, as HDF5 calls are serialised anyway
+        for offset, filter_mask, chunk_sel, out_sel in todo:
+            _, data = dsid.read_direct_chunk(offset)
+            yield offset, data, filter_mask, chunk_sel, out_sel
+
+    workers = min(default_workers(max_workers), len(todo))
+    for _ in _imap(scatter, raw_chunks(), workers):
+        pass
+    return out
+
+
+def iter_chunk_data(dset, slices_iter, prefetch=None, max_workers=None,
+                    ordered=True):
+    """ Read each tuple of slices from slices_iter (covering part of one
+    chunk) on a pool of threads, yielding (slices, array).
+
+    Up to prefetch chunks (default 2 * max_workers) are read ahead of the
+    consumer; with 0, each is read when it's asked for.  Chunks are decoded
+    in the threads for datasets where Dataset._direct_chunk_ok is true.
+    """
+    workers = default_workers(max_workers)
+    if prefetch is None:
+        prefetch = 2 * workers
+    elif prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    with phil:
+        shape = dset.shape
+        direct = dset._direct_chunk_ok
+        key = None
+        if direct and decoded_chunk_cache.capacity:
+            key = dset._decoded_cache_key
+
+    def read(slices):
+        if direct:
+            start = tuple(s.start for s in slices)
+            count = tuple(s.stop - s.start for s in slices)
+            selection = SimpleSelection(shape, hyperslab=(
+                start, count, (1,) * len(shape), (False,) * len(shape)))
+            arr = read_chunks(dset, selection, 1, cache_key=key)
+        else:
+            arr = dset[slices]
+        return slices, arr
+
+    return _imap(read, ((s,) for s in slices_iter), workers, prefetch, ordered)
+
+
+def write_chunks(dset, selection, source, max_workers=None):
+    """ Write an array of shape selection.mshape to a SimpleSelection with
+    unit steps, encoding whole chunks in parallel.
+
+    Chunks which the selection only partly covers are written through the
+    HDF5 filter pipeline, as are chunks for which an optional filter would
+    be skipped: some HDF5 versions mishandle a nonzero filter mask passed to
+    H5Dwrite_chunk.  The caller must have checked Dataset._direct_chunk_ok.
+    """
+    dsid = dset.id
+    chunks = dset.chunks
+    pipeline = dset._filter_pipeline
+    whole_chunk = tuple(slice(0, n, 1) for n in chunks)
+
+    def write_normal(offset, chunk_sel, out_sel):
+        dest = tuple(slice(o + s.start, o + s.stop) for o, s in zip(offset, chunk_sel))
+        dset[dest] = source[out_sel]
+
+    def encode(out_sel):
+        return pipeline.encode(numpy.ascontiguousarray(source[out_sel]))
+
+    whole = []
+    for offset, chunk_sel, out_sel in _touched_chunks(selection, chunks):
+        if chunk_sel == whole_chunk:
+            whole.append((offset, chunk_sel, out_sel))
+        else:
+            write_normal(offset, chunk_sel, out_sel)
+
+    # Encoded chunks are written on this thread, in order
+    workers = min(default_workers(max_workers), len(whole))
+    encoded = _imap(encode, ((out_sel,) for _, _, out_sel in whole), workers)
+    for (offset, chunk_sel, out_sel), (filter_mask, data) in zip(whole, encoded):
+        if filter_mask:
+            write_normal(offset, chunk_sel, out_sel)
+        else:
+            dsid.write_direct_chunk(offset, data)
@@ -0,0 +1,187 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Per-chunk minimum & maximum statistics, to skip chunks when searching.
+
+    The statistics for a dataset are kept in a companion dataset in the same
+    group, named '.<name>_chunk_stats', with one (min, max) pair per chunk:
+    its shape is the chunk grid + (2,).  The dataset has an attribute
+    holding a reference to the companion.  NaN is ignored in the statistics,
+    and parts of the dataset never written count as the fill value.
+    Undocumented and subject to change without warning; use the Dataset
+    methods.
+"""
+
+import posixpath as pp
+
+import numpy
+
+from .base import phil, product
+from . import reductions
+
+#: Attribute of the dataset referring to its statistics
+ATTR = 'h5py_chunk_stats'
+
+
+def grid_shape(shape, chunks):
+    """ Number of chunks along each axis """
+    return tuple(-(-n // c) for n, c in zip(shape, chunks))
+
+
+def _check(dset):
+    if dset.chunks is None:
+        raise TypeError("Chunk statistics need a chunked dataset")
+    if dset.dtype.kind not in 'iuf':
+        raise TypeError("Chunk statistics need integer or float data")
+
+
+def find(dset):
+    """ The companion dataset with dset's statistics, or None """
+    with phil:
+        if dset.chunks is None or ATTR not in dset.attrs:
+            return None
+        return dset.file[dset.attrs[ATTR]]
+
+
+def build(dset):
+    """ Create or recompute the statistics for a whole dataset """
+    with phil:
+        _check(dset)
+        grid = grid_shape(dset.shape, dset.chunks)
+        stats = find(dset)
+        if stats is None:
+            name = '.%s_chunk_stats' % pp.basename(dset.name)
+            stats = dset.parent.create_dataset(
+                name, shape=grid + (2,), dtype=dset.dtype,
+                maxshape=(None,) * len(grid) + (2,))
+            dset.attrs[ATTR] = stats.ref
+        elif stats.shape[:-1] != grid:
+            stats.resize(grid + (2,))
+        update(dset, stats, (0,) * dset.ndim, dset.shape)
+        return stats
+
+
+def drop(dset):
+    """ Delete a dataset's statistics, if it has any """
+    with phil:
+        stats = find(dset)
+        if stats is not None:
+            del dset.attrs[ATTR]
+            del stats.parent[stats.name]
+
+
+def _chunk_reduce(ufunc, arr, chunks):
+    """ Reduce a chunk-aligned block over each chunk it contains """
+    for ax, c in enumerate(chunks):
+        arr = ufunc.reduceat(arr, numpy.arange(0, arr.shape[ax], c), axis=ax)
+    return arr
+
+
+def update(dset, stats, start, stop):
+    """ Recompute the statistics for chunks overlapping the region from
+    start to stop (exclusive) of the dataset.
+    """
+    chunks = dset.chunks
+    g_start = [s // c for s, c in zip(start, chunks)]
+    g_stop = [-(-s // c) for s, c in zip(stop, chunks)]
+    if any(a >= b for a, b in zip(g_start, g_stop)):
+        return
+    origin = [g * c for g, c in zip(g_start, chunks)]
+    region = [min(g * c, n) - o for g, c, n, o in zip(g_stop, chunks, dset.shape, origin)]
+
+    block = reductions.block_shape(region, chunks, dset.dtype.itemsize)
+    for slices in reductions.iter_blocks(region, block):
+        src = tuple(slice(o + s.start, o + s.stop) for o, s in zip(origin, slices))
+        dest = tuple(slice(g + s.start // c, g + -(-s.stop // c))
+                     for g, s, c in zip(g_start, slices, chunks))
+        arr = dset[src]
+        with numpy.errstate(invalid='ignore'):
+            stats[dest + (0,)] = _chunk_reduce(numpy.fmin, arr, chunks)
+            stats[dest + (1,)] = _chunk_reduce(numpy.fmax, arr, chunks)
+
+
+def written(dset, selection):
+    """ Update the statistics, if any, after a write to a Selection """
+    stats = find(dset)
+    if stats is None:
+        return
+    bounds = selection.id.get_select_bounds()
+    if bounds is not None:
+        update(dset, stats, bounds[0], [b + 1 for b in bounds[1]])
+
+
+def resized(dset, old_shape):
+    """ Update the statistics, if any, after the dataset was resized """
+    stats = find(dset)
+    if stats is None:
+        return
+    shape = dset.shape
+    stats.resize(grid_shape(shape, dset.chunks) + (2,))
+    # Recompute the slab added along each axis, including the old edge
+    for ax, (old, new) in enumerate(zip(old_shape, shape)):
+        if new > old:
+            start = [0] * len(shape)
+            start[ax] = old
+            update(dset, stats, start, shape)
+
+
+def where(dset, lo=None, hi=None, max_workers=None):
+    """ Equivalent to numpy.nonzero((lo <= dset[()]) & (dset[()] < hi)),
+    reading only chunks whose statistics allow matching values.
+    """
+    def match(arr):
+        with numpy.errstate(invalid='ignore'):
+            mask = numpy.ones(arr.shape, dtype=bool)
+            if lo is not None:
+                mask &= arr >= lo
+            if hi is not None:
+                mask &= arr < hi
+        return numpy.nonzero(mask)
+
+    with phil:
+        stats = find(dset)
+        if stats is not None and stats.shape[:-1] != grid_shape(dset.shape, dset.chunks):
+            stats = None  # Resized by something else: don't trust it
+        if stats is not None:
+            minmax = stats[()]
+            chunks = dset.chunks
+
+    parts = []
+    if stats is None:
+        for slices, found in reductions.map_blocks(dset, match, max_workers):
+            parts.append([ix + s.start for ix, s in zip(found, slices)])
+    else:
+        candidate = numpy.ones(minmax.shape[:-1], dtype=bool)
+        with numpy.errstate(invalid='ignore'):
+            if lo is not None:
+                candidate &= minmax[..., 1] >= lo
+            if hi is not None:
+                candidate &= minmax[..., 0] < hi
+        selections = [
+            tuple(slice(g * c, (g + 1) * c) for g, c in zip(coord, chunks))
+            for coord in numpy.argwhere(candidate)
+        ]
+        # Read a few MB of chunks at once
+        batch = max(1, reductions.BLOCK_BYTES // (dset.dtype.itemsize * product(chunks)))
+        for i in range(0, len(selections), batch):
+            sels = selections[i:i + batch]
+            for slices, arr in zip(sels, dset.read_many(sels)):
+                found = match(arr)
+                parts.append([ix + s.start for ix, s in zip(found, slices)])
+
+    ndim = dset.ndim
+    if not parts:
+        return tuple(numpy.zeros(0, dtype=numpy.intp) for _ in range(ndim))
+    result = [numpy.concatenate([p[ax] for p in parts]) for ax in range(ndim)]
+    if ndim > 1:
+        # Blocks are in C order, but the points in them aren't
+        order = numpy.argsort(numpy.ravel_multi_index(result, dset.shape))
+        result = [ix[order] for ix in result]
+    return tuple(result)
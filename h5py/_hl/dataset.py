@@ -17,12 +17,15 @@ from abc import ABC, abstractmethod
 
 import numpy
 
-from .. import h5, h5s, h5t, h5r, h5d, h5p, h5fd, h5ds, _selector
+from .. import h5, h5s, h5t, h5r, h5d, h5p, h5fd, _selector
 from .base import (
     array_for_new_object, cached_property, Empty, find_item_type, HLObject,
     phil, product, with_phil,
 )
+from . import chunks as chunk_io
+from . import chunkstats
 from . import filters
+from . import reductions
 from . import selections as sel
 from . import selections2 as sel2
 from .datatype import Datatype
@@ -279,6 +282,16 @@ class AsStrView(AbstractView):
         return numpy.dtype(object)
 
     def __getitem__(self, idx):
+        with phil:
+            spaces = self._dset._vlen_str_spaces(idx)
+            if spaces is not None:
+                # Decode straight from the HDF5 buffers, without bytes objects
+                mspace, selection = spaces
+                arr = self._dset.id.read_vlen_str_decoded(
+                    mspace, selection.id, self.encoding, self.errors,
+                    dxpl=self._dset._dxpl)
+                return arr.reshape(selection.array_shape)[()]
+
         bytes_arr = self._dset[idx]
         # numpy.char.decode() seems like the obvious thing to use. But it only
         # accepts numpy string arrays, not object arrays of bytes (which we
@@ -294,6 +307,86 @@ class AsStrView(AbstractView):
         ], dtype=object).reshape(bytes_arr.shape)
 
 
+class AsFixedStrView(AbstractView):
+    """Wrapper to read variable-length strings into fixed-width NumPy
+    string arrays (S or U)"""
+    def __init__(self, dset, dtype, encoding):
+        super().__init__(dset)
+        self._dtype = dtype
+        self._encoding = encoding
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    def __getitem__(self, idx):
+        with phil:
+            spaces = self._dset._vlen_str_spaces(idx)
+            if spaces is not None:
+                mspace, selection = spaces
+                values, offsets = self._dset.id.read_vlen_str_flat(
+                    mspace, selection.id, dxpl=self._dset._dxpl)
+        if spaces is None:
+            if self._dtype.kind == 'U':
+                arr = self._dset.asstr()[idx]
+            else:
+                arr = self._dset[idx]
+            return numpy.asarray(arr, dtype=object).astype(self._dtype)[()]
+
+        if self._dtype.kind == 'S':
+            codes = values
+        else:
+            text, offsets = _decode_flat_strings(values, offsets, self._encoding)
+            codes = numpy.frombuffer(text.encode(_UTF32), dtype=numpy.uint32)
+        width = self._dtype.itemsize // codes.itemsize
+        if width == 0:
+            width = max(int(numpy.diff(offsets).max(initial=0)), 1)
+        arr = _pack_fixed_width(codes, offsets, width)
+        arr = arr.view('%s%d' % (self._dtype.kind, width))
+        return arr.reshape(selection.array_shape)[()]
+
+
+# UTF-32 in native byte order, as used by NumPy U arrays
+_UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+
+def _decode_flat_strings(values, offsets, encoding):
+    """Decode strings read by DatasetID.read_vlen_str_flat() all at once.
+
+    Returns (text, offsets), where string i is text[offsets[i]:offsets[i+1]].
+    encoding must be 'utf-8' or 'ascii', as HDF5 string types use.
+    """
+    text = values.tobytes().decode(encoding)
+    if encoding == 'ascii':
+        return text, offsets
+
+    # Count the characters before each string by their first bytes (UTF-8
+    # continuation bytes are 0b10xxxxxx). A string beginning in the middle
+    # of a character is invalid: decode it alone to raise the right error.
+    first = (values & 0xC0) != 0x80
+    starts = offsets[:-1]
+    nonempty = starts < offsets[1:]
+    bad = nonempty.copy()
+    bad[nonempty] = ~first[starts[nonempty]]
+    if bad.any():
+        i = numpy.argmax(bad)
+        values[offsets[i]:offsets[i + 1]].tobytes().decode(encoding)
+    cont = numpy.flatnonzero(~first)
+    return text, offsets - numpy.searchsorted(cont, offsets)
+
+
+def _pack_fixed_width(codes, offsets, width):
+    """Copy strings given as a flat array of code units & offsets into the
+    rows of a (n, width) array, truncating any longer than width.
+    """
+    lens = numpy.minimum(numpy.diff(offsets), width)
+    out = numpy.zeros((len(lens), width), dtype=codes.dtype)
+    rows = numpy.repeat(numpy.arange(len(lens)), lens)
+    cols = numpy.arange(lens.sum()) - numpy.repeat(numpy.cumsum(lens) - lens, lens)
+    out[rows, cols] = codes[numpy.repeat(offsets[:-1], lens) + cols]
+    return out
+
+
 class FieldsView(AbstractView):
     """Wrapper to extract named fields from a dataset with a struct dtype"""
 
@@ -332,6 +425,14 @@ def readtime_dtype(basetype, names):
     return numpy.dtype([(name, basetype.fields[name][0]) for name in names])
 
 
+def _reduction_out(res, out):
+    """Store a reduction result in out, if given, as NumPy methods do"""
+    if out is None:
+        return res
+    out[...] = res
+    return out
+
+
 if MPI:
     class CollectiveContext:
 
@@ -425,6 +526,116 @@ class ChunkIterator:
         return tuple(slices)
 
 
+class DatasetAppender:
+    """
+    Appends rows along the first axis of a resizable dataset, buffering them
+    in memory so that they're written one or more whole chunks at a time.
+
+    Returned by Dataset.appender().  Not safe to use from several threads.
+    """
+    def __init__(self, dset, buffer_rows=None):
+        if not dset.chunks:
+            raise TypeError("Chunked dataset required")
+        if len(dset.shape) == 0:
+            raise TypeError("Can't append to a scalar dataset")
+
+        chunk_rows = dset.chunks[0]
+        if buffer_rows is None:
+            buffer_rows = chunk_rows
+        elif buffer_rows < 1:
+            raise ValueError("buffer_rows must be at least 1")
+        # Round up to whole chunks
+        buffer_rows = -(-buffer_rows // chunk_rows) * chunk_rows
+
+        self._dset = dset
+        self._chunk_rows = chunk_rows
+        self._maxrows = dset.maxshape[0]
+        self._row_shape = dset.shape[1:]
+        self._length = self._extent = dset.shape[0]
+        self._buf = numpy.empty((buffer_rows,) + self._row_shape, dtype=dset.dtype)
+        self._nbuf = 0
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        """ Rows in the dataset, including those not yet written """
+        return self._length + self._nbuf
+
+    @property
+    def _limit(self):
+        # Buffered rows which will end at a chunk boundary in the dataset
+        return len(self._buf) - self._length % self._chunk_rows
+
+    def append(self, data):
+        """ Append one row, or an array of rows """
+        if self._closed:
+            raise ValueError("Appender is closed")
+        data = numpy.asarray(data, dtype=self._dset.dtype)
+        if data.shape == self._row_shape:
+            data = data.reshape((1,) + data.shape)
+        elif data.shape[1:] != self._row_shape:
+            raise TypeError("Can't append data of shape %s to rows of shape %s"
+                            % (data.shape, self._row_shape))
+        if self._maxrows is not None and len(self) + len(data) > self._maxrows:
+            raise ValueError("Can't append past the maximum size of the dataset (%d rows)"
+                             % self._maxrows)
+
+        pos = 0
+        while pos < len(data):
+            remaining = len(data) - pos
+            if self._nbuf == 0 and remaining >= self._limit:
+                # Enough to write whole chunks straight from the input
+                n = self._limit
+                n += (remaining - n) // self._chunk_rows * self._chunk_rows
+                self._write(data[pos:pos + n])
+            else:
+                n = min(self._limit - self._nbuf, remaining)
+                self._buf[self._nbuf:self._nbuf + n] = data[pos:pos + n]
+                self._nbuf += n
+                if self._nbuf == self._limit:
+                    self._write_buffer()
+            pos += n
+
+    def _write_buffer(self):
+        self._write(self._buf[:self._nbuf])
+        self._nbuf = 0
+
+    def _write(self, rows):
+        start = self._length
+        stop = start + len(rows)
+        if stop > self._extent:
+            # Grow geometrically, so the extent is rarely changed
+            extent = max(stop, 2 * self._extent)
+            extent = -(-extent // self._chunk_rows) * self._chunk_rows
+            if self._maxrows is not None:
+                extent = min(extent, self._maxrows)
+            self._dset.resize(extent, axis=0)
+            self._extent = extent
+        self._dset[start:stop] = rows
+        self._length = stop
+
+    def flush(self):
+        """ Write any buffered rows, and trim the dataset to the rows
+        appended so far.
+        """
+        if self._nbuf:
+            self._write_buffer()
+        if self._extent != self._length:
+            self._dset.resize(self._length, axis=0)
+            self._extent = self._length
+
+    def close(self):
+        """ Flush, and stop accepting rows """
+        if not self._closed:
+            self.flush()
+            self._closed = True
+
+
 class Dataset(HLObject):
 
     """
@@ -449,6 +660,13 @@ class Dataset(HLObject):
                     "an HDF5 string datatype"
                 )
 
+        if dtype.kind in "SU":
+            string_info = h5t.check_string_dtype(self.dtype)
+            # HDF5 converts variable-length strings to sized bytes itself
+            if (string_info is not None and string_info.length is None
+                    and (dtype.kind == "U" or dtype.itemsize == 0)):
+                return AsFixedStrView(self, dtype, string_info.encoding)
+
         return AsTypeView(self, dtype)
 
     def asstr(self, encoding=None, errors='strict'):
@@ -697,6 +915,13 @@ class Dataset(HLObject):
         """
         return filters.get_filters(self._dcpl)
 
+    @cached_property
+    def _filter_pipeline(self):
+        """
+        The filters of the dataset, applied in Python to raw chunks.
+        """
+        return filters.FilterPipeline(self._dcpl, self.dtype.itemsize)
+
     @with_phil
     def __init__(self, bind, *, readonly=False):
         """ Create a new Dataset object by binding to a low-level DatasetID.
@@ -738,7 +963,13 @@ class Dataset(HLObject):
                 size[axis] = newlen
 
             size = tuple(size)
-            self.id.set_extent(size)
+            old_shape = self.shape
+            try:
+                self.id.set_extent(size)
+            finally:
+                self._data_changed()
+            if self._has_chunk_stats:
+                chunkstats.resized(self, old_shape)
             #h5f.flush(self.id)  # THG recommends
 
     @with_phil
@@ -777,7 +1008,7 @@ class Dataset(HLObject):
             yield self[i]
 
     @with_phil
-    def iter_chunks(self, sel=None):
+    def iter_chunks(self, sel=None, *, prefetch=None, workers=None, ordered=True):
         """ Return chunk iterator.  If set, the sel argument is a slice or
         tuple of slices that defines the region to be used. If not set, the
         entire dataspace will be used for the iterator.
@@ -786,12 +1017,60 @@ class Dataset(HLObject):
         slices that gives the intersection of the given chunk with the
         selection area.
 
+        If prefetch or workers is given, it yields (slices, array) pairs
+        instead, with the data read by a pool of workers threads (default:
+        the number of CPUs), up to prefetch chunks (default: 2 * workers)
+        ahead of the consumer.  With ordered=False, chunks are yielded in
+        the order they're read, rather than the order above.
+
         A TypeError will be raised if the dataset is not chunked.
 
         A ValueError will be raised if the selection region is invalid.
 
         """
-        return ChunkIterator(self, sel)
+        chunk_iter = ChunkIterator(self, sel)
+        if prefetch is None and workers is None:
+            return chunk_iter
+        return chunk_io.iter_chunk_data(self, chunk_iter, prefetch, workers, ordered)
+
+    def chunk_index(self):
+        """ Return the location of every written chunk in the file, as a
+        read-only structured array with fields chunk_offset (an array of
+        one index per axis), filter_mask, byte_offset and size.  It is
+        sorted by chunk offset.
+
+        The array is cached, and discarded when the dataset is written to,
+        resized or refreshed through this object.
+
+        A TypeError will be raised if the dataset is not chunked.
+        """
+        with phil:
+            if 'chunk_index' in self._cache_props:
+                return self._cache_props['chunk_index']
+            if self.chunks is None:
+                raise TypeError("Chunked dataset required")
+            index = self.id.get_chunk_index()
+            index.flags.writeable = False
+            self._cache_props['chunk_index'] = index
+            return index
+
+    def appender(self, buffer_rows=None):
+        """ Return an object to append rows along the first axis, e.g.:
+
+        >>> with dset.appender(buffer_rows=1000) as app:
+        ...     for row in rows:
+        ...         app.append(row)
+
+        Up to buffer_rows rows (default: one chunk; rounded up to whole
+        chunks) are kept in memory, and written one or more whole chunks at
+        a time.  The dataset is grown in steps which double its size, and
+        trimmed to the appended rows when the appender is flushed or closed.
+        Until then, it may have extra rows containing the fill value, and
+        some appended rows may not be in the file yet.
+
+        The dataset must be chunked and resizable along the first axis.
+        """
+        return DatasetAppender(self, buffer_rows)
 
     @cached_property
     def _fast_read_ok(self):
@@ -801,6 +1080,56 @@ class Dataset(HLObject):
             and isinstance(self.id.get_type(), (h5t.TypeIntegerID, h5t.TypeFloatID))
         )
 
+    @cached_property
+    def _direct_chunk_ok(self):
+        """Can chunks be decoded and encoded outside the HDF5 filter pipeline"""
+        if not (self._fast_read_ok and self.chunks is not None):
+            return False
+        tid = self.id.get_type()
+        nbits = 8 * self.dtype.itemsize
+        # Raw chunk bytes must be usable as the numpy dtype directly
+        return (
+            tid.get_size() == self.dtype.itemsize
+            and tid.get_precision() == nbits
+            and tid.get_offset() == 0
+            and self._filter_pipeline.supported
+        )
+
+    @cached_property
+    def _decoded_cache_key(self):
+        """Identifies this dataset in chunks.decoded_chunk_cache, or None"""
+        return chunk_io.cache_key(self)
+
+    def _data_changed(self):
+        """Discard the cached chunk index, and this dataset's chunks in
+        chunks.decoded_chunk_cache.  Writes call this even if they fail, as
+        some chunks may have been written.
+        """
+        self._cache_props.pop('chunk_index', None)
+        if chunk_io.decoded_chunk_cache.capacity:
+            key = self._decoded_cache_key
+            if key is not None:
+                chunk_io.decoded_chunk_cache.invalidate(key[0])
+
+    def _read_decoded_cache(self, args):
+        """Read through chunks.decoded_chunk_cache, or return None if the
+        dataset or selection isn't suitable.
+        """
+        key = self._decoded_cache_key
+        if key is None or any(
+                isinstance(a, (str, _selector.MultiBlockSlice)) for a in args):
+            return None
+        if sel.sort_index_list(self.shape, args) is not None:
+            return None  # __getitem__ reads the sorted list, then the cache
+        selection = sel.select(self.shape, args, dataset=self)
+        if not isinstance(selection, sel.SimpleSelection):
+            return None
+        arr = chunk_io.read_chunks(self, selection, 1, cache_key=key)
+        arr = arr.reshape(selection.array_shape)
+        if arr.shape == ():
+            return arr[()]
+        return arr
+
     @with_phil
     def __getitem__(self, args, new_dtype=None):
         """ Read a slice from the HDF5 dataset.
@@ -815,6 +1144,11 @@ class Dataset(HLObject):
         """
         args = args if isinstance(args, tuple) else (args,)
 
+        if chunk_io.decoded_chunk_cache.capacity and (new_dtype is None):
+            arr = self._read_decoded_cache(args)
+            if arr is not None:
+                return arr
+
         if self._fast_read_ok and (new_dtype is None):
             try:
                 return self._fast_reader.read(args)
@@ -838,9 +1172,16 @@ class Dataset(HLObject):
             args = tuple(x for x in args if not isinstance(x, str))
             return self.fields(names, _prior_dtype=new_dtype)[args]
 
+        # Index lists out of order or with repeats: read the sorted indices
+        reorder = sel.sort_index_list(self.shape, args)
+        if reorder is not None:
+            args, axis, inverse = reorder
+            arr = self.__getitem__(args, new_dtype=new_dtype)
+            return numpy.take(arr, inverse, axis=axis)
+
         if new_dtype is None:
             new_dtype = self.dtype
-        mtype = h5t.py_create(new_dtype)
+        mtype = h5t.py_create_cached(new_dtype)
 
         # === Special-case region references ====
 
@@ -1057,8 +1398,13 @@ class Dataset(HLObject):
 
         # Perform the write, with broadcasting
         mspace = h5s.create_simple(selection.expand_shape(mshape))
-        for fspace in selection.broadcast(mshape):
-            self.id.write(mspace, fspace, val, mtype, dxpl=self._dxpl)
+        try:
+            for fspace in selection.broadcast(mshape):
+                self.id.write(mspace, fspace, val, mtype, dxpl=self._dxpl)
+        finally:
+            self._data_changed()
+        if self._has_chunk_stats:
+            chunkstats.written(self, selection)
 
     def read_direct(self, dest, source_sel=None, dest_sel=None):
         """ Read data directly from HDF5 into an existing NumPy array.
@@ -1107,8 +1453,349 @@ class Dataset(HLObject):
             else:
                 dest_sel = sel.select(self.shape, dest_sel, self)
 
-            for fspace in dest_sel.broadcast(source_sel.array_shape):
-                self.id.write(mspace, fspace, source, dxpl=self._dxpl)
+            try:
+                for fspace in dest_sel.broadcast(source_sel.array_shape):
+                    self.id.write(mspace, fspace, source, dxpl=self._dxpl)
+            finally:
+                self._data_changed()
+            if self._has_chunk_stats:
+                chunkstats.written(self, dest_sel)
+
+    def read_many(self, selections):
+        """ Read a list of selections, returning a list of arrays.
+
+        This is like ``[dset[s] for s in selections]``, but faster for many
+        small selections.  For datasets of integers or floats, selections
+        made of slices and integers are combined, and read with as few HDF5
+        calls as possible: once if none of them overlap.  The results are
+        then views of one shared buffer.  Other selections and datasets are
+        read one by one.
+
+        Each selection must be the output of numpy.s_[<args>].
+        """
+        selections = [s if isinstance(s, tuple) else (s,) for s in selections]
+
+        with phil:
+            if not self._fast_read_ok:
+                return [self[s] for s in selections]
+
+            try:
+                out = self._fast_reader.read_many(selections)
+            except TypeError:
+                # e.g. boolean arrays; let __getitem__ sort it out
+                return [self[s] for s in selections]
+
+            for i, s in enumerate(selections):
+                if out[i] is None:
+                    out[i] = self[s]  # Fancy indexing
+            return out
+
+    def read_parallel(self, source_sel=None, *, max_workers=None):
+        """ Read data, decompressing chunks on several threads.
+
+        Raw chunks are read from the file one at a time, and decompressed by
+        a pool of max_workers threads (default: the number of CPUs).  This
+        works for chunked datasets of integers or floats using any of the
+        gzip, lzf, shuffle and fletcher32 filters; anything else is read
+        normally, as are selections other than slices and integers.
+
+        The selection must be the output of numpy.s_[<args>].
+        """
+        if source_sel is None:
+            source_sel = ()
+        args = source_sel if isinstance(source_sel, tuple) else (source_sel,)
+
+        with phil:
+            if not self._direct_chunk_ok or any(
+                    isinstance(a, _selector.MultiBlockSlice) for a in args):
+                return self[args]
+
+            selection = sel.select(self.shape, args, dataset=self)
+            if not isinstance(selection, sel.SimpleSelection):
+                return self[args]
+            key = None
+            if chunk_io.decoded_chunk_cache.capacity:
+                key = self._decoded_cache_key
+
+        # phil is only taken for each HDF5 call, not while decompressing
+        arr = chunk_io.read_chunks(self, selection, max_workers, cache_key=key)
+        arr = arr.reshape(selection.array_shape)
+        if arr.shape == ():
+            return arr[()]
+        return arr
+
+    def write_parallel(self, source, dest_sel=None, *, max_workers=None):
+        """ Write data, compressing chunks on several threads.
+
+        Chunks entirely covered by the selection are compressed by a pool
+        of max_workers threads (default: the number of CPUs) and written to
+        the file in order, bypassing the HDF5 filter pipeline.  Partly
+        covered chunks are written normally.  The same datasets are
+        supported as for read_parallel; anything else, and selections other
+        than slices with step 1 and integers, are written normally.
+
+        The selection must be the output of numpy.s_[<args>].  Broadcasting
+        is supported.
+        """
+        if dest_sel is None:
+            dest_sel = ()
+        args = dest_sel if isinstance(dest_sel, tuple) else (dest_sel,)
+
+        with phil:
+            if not self._direct_chunk_ok or any(
+                    isinstance(a, _selector.MultiBlockSlice) for a in args):
+                self[args] = source
+                return
+
+            selection = sel.select(self.shape, args, dataset=self)
+            if not isinstance(selection, sel.SimpleSelection) or any(
+                    step != 1 for step in selection._sel[2]):
+                self[args] = source
+                return
+
+            source = numpy.asarray(source, dtype=self.dtype)
+            source = source.reshape(selection.expand_shape(source.shape))
+            source = numpy.broadcast_to(source, selection.mshape)
+
+        # phil is only taken for each HDF5 call, not while compressing
+        try:
+            chunk_io.write_chunks(self, selection, source, max_workers)
+        finally:
+            with phil:
+                self._data_changed()
+        with phil:
+            if self._has_chunk_stats:
+                chunkstats.written(self, selection)
+
+    def _vlen_str_spaces(self, args):
+        """ Memory dataspace & selection to read variable-length strings in
+        bulk, with the DatasetID.read_vlen_str_*() methods.  Returns None
+        for datasets of other types, and for selections needing the general
+        read path of __getitem__.
+        """
+        string_info = h5t.check_string_dtype(self.dtype)
+        if string_info is None or string_info.length is not None:
+            return None
+        args = args if isinstance(args, tuple) else (args,)
+        if self._is_empty or self.shape == ():
+            return None
+        if any(isinstance(a, (str, h5r.RegionReference)) for a in args):
+            return None
+        if sel.sort_index_list(self.shape, args) is not None:
+            return None
+        selection = sel.select(self.shape, args, dataset=self)
+        return h5s.create_simple((selection.nselect,)), selection
+
+    def _ragged_selection(self, sel_args, strings=False):
+        """ Base dtype, file & memory dataspaces for read/write_ragged.  The
+        base dtype is None for variable-length strings, if strings is True.
+        """
+        base = h5t.check_vlen_dtype(self.dtype)
+        string_info = h5t.check_string_dtype(self.dtype)
+        if strings and string_info is not None and string_info.length is None:
+            base = None
+        elif base is None or string_info or base.kind == 'O':
+            raise TypeError("Ragged I/O needs a variable-length numeric "
+                            "dataset, not %s" % self.dtype)
+        if sel_args is None:
+            sel_args = ()
+        args = sel_args if isinstance(sel_args, tuple) else (sel_args,)
+        selection = sel.select(self.shape, args, dataset=self)
+        mspace = h5s.create_simple((selection.nselect,))
+        return base, selection, mspace
+
+    def read_ragged(self, sel=None):
+        """ Read variable-length data as a flat array of values and an array
+        of offsets, as used by Arrow and Awkward Array.
+
+        Returns ``(values, offsets)``: offsets is an int64 array one longer
+        than the number of selected elements, and element i (in C order of
+        the selection) is ``values[offsets[i]:offsets[i+1]]``.  This avoids
+        making an array object per element, as ``dset[sel]`` does.
+
+        For variable-length string datasets, values is a uint8 array of the
+        encoded strings back to back.
+
+        The selection must be the output of numpy.s_[<args>].
+        """
+        with phil:
+            base, selection, mspace = self._ragged_selection(sel, strings=True)
+            if base is None:
+                return self.id.read_vlen_str_flat(mspace, selection.id,
+                                                  dxpl=self._dxpl)
+            return self.id.read_vlen_flat(mspace, selection.id, base,
+                                          dxpl=self._dxpl)
+
+    def write_ragged(self, values, offsets, sel=None):
+        """ Write variable-length data from a flat array of values and an
+        array of offsets, as returned by read_ragged().
+
+        offsets must have one more entry than the number of selected
+        elements, and must not decrease; element i is
+        ``values[offsets[i]:offsets[i+1]]``.
+
+        The selection must be the output of numpy.s_[<args>].
+        """
+        with phil:
+            base, selection, mspace = self._ragged_selection(sel)
+            values = numpy.ascontiguousarray(values, dtype=base).reshape(-1)
+            offsets = numpy.ascontiguousarray(offsets, dtype=numpy.int64)
+            try:
+                self.id.write_vlen_flat(mspace, selection.id, values, offsets,
+                                        dxpl=self._dxpl)
+            finally:
+                self._data_changed()
+
+    def reduce(self, ufunc, axis=None, dtype=None, *, keepdims=False,
+               max_workers=None):
+        """ Reduce the dataset with a NumPy ufunc, like
+        ``ufunc.reduce(dset[()], axis, dtype)``, without reading it all
+        into memory.
+
+        The data is read in blocks of whole chunks (or rows), of a few MB,
+        and each block is reduced and the results combined, so ufunc must
+        be associative (e.g. numpy.add, numpy.maximum, numpy.logical_or).
+        Reading and reducing blocks runs on a pool of max_workers threads
+        (default: the number of CPUs).
+        """
+        return reductions.reduce(self, ufunc, axis, dtype, keepdims, max_workers)
+
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False, *,
+            max_workers=None):
+        """ Sum of the data, like numpy.sum(), read in blocks; see reduce() """
+        res = self.reduce(numpy.add, axis, dtype, keepdims=keepdims,
+                          max_workers=max_workers)
+        return _reduction_out(res, out)
+
+    def min(self, axis=None, out=None, keepdims=False, *, max_workers=None):
+        """ Minimum, like numpy.min(), read in blocks; see reduce() """
+        res = self.reduce(numpy.minimum, axis, keepdims=keepdims,
+                          max_workers=max_workers)
+        return _reduction_out(res, out)
+
+    def max(self, axis=None, out=None, keepdims=False, *, max_workers=None):
+        """ Maximum, like numpy.max(), read in blocks; see reduce() """
+        res = self.reduce(numpy.maximum, axis, keepdims=keepdims,
+                          max_workers=max_workers)
+        return _reduction_out(res, out)
+
+    def mean(self, axis=None, dtype=None, out=None, keepdims=False, *,
+             max_workers=None):
+        """ Mean, like numpy.mean(), read in blocks; see reduce() """
+        res = reductions.mean(self, axis, dtype, keepdims, max_workers)
+        return _reduction_out(res, out)
+
+    def stats(self, axis=None, *, keepdims=False, max_workers=None):
+        """ Count, minimum, maximum, mean and standard deviation of the
+        data, computed in one pass.  Returns a named tuple with fields
+        count, min, max, mean and std.
+
+        NumPy's rules for dtypes and NaN are followed, as for mean() and
+        std(); the data is read as in reduce().
+        """
+        return reductions.stats(self, axis, keepdims, max_workers)
+
+    def histogram(self, bins=10, range=None, density=False, *,
+                  max_workers=None):
+        """ Histogram of the data, like numpy.histogram(), read in blocks.
+        Returns (hist, bin_edges).
+
+        If bins is a number and range isn't given, the data is read twice:
+        first to find its range.  Bin estimators (bins='auto', etc.) aren't
+        supported.
+        """
+        return reductions.histogram(self, bins, range, density, max_workers)
+
+    def build_chunk_stats(self):
+        """ Store the minimum and maximum of each chunk, so that where() can
+        skip chunks.  Once built, the statistics are kept up to date as
+        data is written through h5py.  Returns the dataset holding them.
+
+        Only for chunked datasets of integers or floats; TypeError is
+        raised for others.
+        """
+        return chunkstats.build(self)
+
+    def drop_chunk_stats(self):
+        """ Delete the statistics made by build_chunk_stats(), if any """
+        chunkstats.drop(self)
+
+    @property
+    def _has_chunk_stats(self):
+        """Whether build_chunk_stats() has been used.  Only chunked datasets
+        of integers or floats can have statistics; for those, the file is
+        checked every time, as they may be built through another object.
+        """
+        if 'chunk_stats_possible' not in self._cache_props:
+            self._cache_props['chunk_stats_possible'] = (
+                self.chunks is not None and self.dtype.kind in 'iuf')
+        return (self._cache_props['chunk_stats_possible']
+                and chunkstats.ATTR in self.attrs)
+
+    def chunk_stats(self):
+        """ The minimum & maximum of each chunk, as an array with the shape
+        of the chunk grid + (2,), or None if they haven't been built.
+        """
+        with phil:
+            stats = chunkstats.find(self)
+            return None if stats is None else stats[()]
+
+    def where(self, lo=None, hi=None, *, max_workers=None):
+        """ Find the elements with lo <= value < hi.  Either bound may be
+        None.  Returns a tuple of index arrays, one per axis, like
+        ``numpy.nonzero((lo <= dset[()]) & (dset[()] < hi))``.
+
+        If build_chunk_stats() has been used, only chunks which may hold
+        matching values are read.  Otherwise, all the data is read in
+        blocks, as for reduce().
+        """
+        return chunkstats.where(self, lo, hi, max_workers)
+
+    def as_memmap(self, mode='r'):
+        """ Return a numpy.memmap of the dataset's data in the file.
+
+        Only contiguous datasets in files opened with the default ('sec2')
+        or 'stdio' drivers can be mapped, and their data must already be
+        allocated in the file.  The datatype must have the same layout in
+        the file as in memory, which excludes variable-length data and
+        references.  TypeError is raised for anything else.
+
+        mode is 'r' (read-only), 'c' (copy-on-write) or 'r+' (writes go to
+        the file, which must be open for writing).  HDF5 isn't aware of the
+        mapping: don't mix writes through it with writes through h5py
+        without flushing both.
+        """
+        if mode not in ('r', 'r+', 'c'):
+            raise ValueError("mode must be 'r', 'r+' or 'c' (got %r)" % (mode,))
+
+        with phil:
+            if self._is_empty:
+                raise TypeError("Empty datasets have no numpy representation")
+            if self._dcpl.get_layout() != h5d.CONTIGUOUS:
+                raise TypeError("Only contiguous datasets can be memory-mapped")
+            if self._dcpl.get_external_count():
+                raise TypeError("Datasets stored in external files can't be memory-mapped")
+
+            dtype = self.dtype
+            if dtype.hasobject or self.id.get_type().get_size() != dtype.itemsize:
+                raise TypeError("Datatype %s can't be memory-mapped" % dtype)
+
+            f = self.file
+            if f.driver not in ('sec2', 'stdio'):
+                raise TypeError("Can't memory-map datasets with the %r driver" % f.driver)
+            if mode == 'r+' and f.mode != 'r+':
+                raise ValueError("File must be open for writing to map it with mode 'r+'")
+
+            offset = self.id.get_offset()
+            if offset is None:
+                raise TypeError("Dataset has no storage allocated in the file")
+
+            # Make sure data written through HDF5 is visible in the map
+            if f.mode == 'r+':
+                f.flush()
+
+            return numpy.memmap(f.filename, dtype=dtype, mode=mode,
+                                offset=offset, shape=self.shape)
 
     @with_phil
     def __array__(self, dtype=None, copy=None):
@@ -1153,6 +1840,7 @@ class Dataset(HLObject):
             """
             self._id.refresh()
             self._cache_props.clear()
+            self._data_changed()
 
     if hasattr(h5d.DatasetID, "flush"):
         @with_phil
@@ -1195,6 +1883,7 @@ class Dataset(HLObject):
 
         You can optionally pass a name to associate with this scale.
         """
+        from .. import h5ds
         h5ds.set_scale(self._id, self._e(name))
 
     @property
@@ -1204,4 +1893,5 @@ class Dataset(HLObject):
 
         Return ``False`` otherwise.
         """
+        from .. import h5ds
         return h5ds.is_scale(self._id)
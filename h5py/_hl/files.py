@@ -56,7 +56,15 @@ def _set_fapl_mpio(plist, **kwargs):
 
 def _set_fapl_fileobj(plist, **kwargs):
     """Set the Python file object driver in a file access property list"""
-    plist.set_fileobj_driver(h5fd.fileobj_driver, kwargs.get('fileobj'))
+    block_cache = kwargs.get('block_cache')
+    if block_cache is not None and not isinstance(block_cache, h5fd.BlockCache):
+        raise TypeError("block_cache must be an h5py.h5fd.BlockCache")
+    plist.set_fileobj_driver(h5fd.fileobj_driver, kwargs.get('fileobj'), block_cache)
+
+
+def _set_fapl_mmap(plist, **kwargs):
+    """Set the read-only memory map driver in a file access property list"""
+    plist.set_mmap_driver(h5fd.mmap_driver, **kwargs)
 
 
 _drivers = {
@@ -69,6 +77,7 @@ _drivers = {
     ),
     'mpio': _set_fapl_mpio,
     'fileobj': _set_fapl_fileobj,
+    'mmap': _set_fapl_mmap,
     'split': lambda plist, **kwargs: plist.set_fapl_split(**kwargs),
 }
 
@@ -305,7 +314,8 @@ class File(Group):
                    h5fd.WINDOWS: 'windows',
                    h5fd.MPIO: 'mpio',
                    h5fd.MPIPOSIX: 'mpiposix',
-                   h5fd.fileobj_driver: 'fileobj'}
+                   h5fd.fileobj_driver: 'fileobj',
+                   h5fd.mmap_driver: 'mmap'}
         if ros3:
             drivers[h5fd.ROS3D] = 'ros3'
         if direct_vfd:
@@ -393,7 +403,8 @@ class File(Group):
             a        Read/write if exists, create otherwise
         driver
             Name of the driver to use.  Legal values are None (default,
-            recommended), 'core', 'sec2', 'direct', 'stdio', 'mpio', 'ros3'.
+            recommended), 'core', 'sec2', 'direct', 'stdio', 'mpio', 'ros3',
+            'mmap' (read-only).
         libver
             Library version bounds.  Supported values: 'earliest', 'v108',
             'v110', 'v112'  and 'latest'.
@@ -39,11 +39,12 @@
 """
 from collections.abc import Mapping
 import operator
+import zlib
 
 import numpy as np
 from .base import product
 from .compat import filename_encode
-from .. import h5z, h5p, h5d, h5f
+from .. import h5z, h5p, h5d, h5f, _filters
 
 
 _COMP_FILTERS = {'gzip': h5z.FILTER_DEFLATE,
@@ -354,6 +355,105 @@ def get_filters(plist):
 
     return pipeline
 
+class FilterPipeline:
+    """ Apply the filter pipeline of a chunked dataset to raw chunks in
+    Python, for use with read_direct_chunk and write_direct_chunk.
+
+    Only the DEFLATE, shuffle, fletcher32 and LZF filters are implemented;
+    check ``supported`` before use.  All of them release the GIL, so chunks
+    can be encoded and decoded on several threads at once.
+
+    Undocumented and subject to change without warning.
+    """
+
+    _IMPLEMENTED = frozenset((h5z.FILTER_DEFLATE, h5z.FILTER_SHUFFLE,
+                              h5z.FILTER_FLETCHER32, h5z.FILTER_LZF))
+
+    def __init__(self, plist, itemsize):
+        self._setup(
+            [plist.get_filter(i)[:3] for i in range(plist.get_nfilters())],
+            itemsize
+        )
+
+    @classmethod
+    def from_filters(cls, filters, itemsize):
+        """ Make a pipeline from (code, flags, values) for each filter, as
+        found in the ``filters`` attribute, without a property list.
+        """
+        self = cls.__new__(cls)
+        self._setup(filters, itemsize)
+        return self
+
+    def _setup(self, filters, itemsize):
+        self.filters = tuple(
+            (int(code), int(flags), tuple(int(v) for v in vals))
+            for code, flags, vals in filters
+        )
+        self.itemsize = itemsize
+        self.supported = all(f[0] in self._IMPLEMENTED for f in self.filters)
+
+    def _shuffle_size(self, vals):
+        # H5Z_filter_shuffle's set_local callback stores the element size
+        return vals[0] if vals else self.itemsize
+
+    def decode(self, data, filter_mask, nbytes):
+        """ Undo the filters recorded as applied in filter_mask, returning
+        a buffer which should hold nbytes of chunk data.
+        """
+        data = memoryview(data).cast('B')
+        for idx in reversed(range(len(self.filters))):
+            if filter_mask & (1 << idx):
+                continue
+            code, _, vals = self.filters[idx]
+            if code == h5z.FILTER_DEFLATE:
+                data = zlib.decompress(data, bufsize=max(nbytes, 1))
+            elif code == h5z.FILTER_SHUFFLE:
+                data = _filters.unshuffle(data, self._shuffle_size(vals))
+            elif code == h5z.FILTER_FLETCHER32:
+                data = memoryview(data)
+                if len(data) < 4:
+                    raise OSError("Chunk too small for a fletcher32 checksum")
+                stored = int.from_bytes(data[-4:], 'little')
+                data = data[:-4]
+                checksum = _filters.fletcher32(data)
+                # HDF5 before 1.6.3 swapped the bytes of each 16-bit half
+                # on little-endian machines; those files are still valid.
+                swapped = ((checksum & 0x00ff00ff) << 8) | ((checksum >> 8) & 0x00ff00ff)
+                if stored not in (checksum, swapped):
+                    raise OSError("Data error detected by fletcher32 checksum")
+            elif code == h5z.FILTER_LZF:
+                data = _filters.lzf_decompress(data, nbytes)
+            else:
+                raise ValueError("Filter %s is not supported" % get_filter_name(code))
+        return data
+
+    def encode(self, data):
+        """ Apply the filters to chunk data.
+
+        Returns a tuple (filter_mask, data), where filter_mask records any
+        optional filters which were skipped, as for write_direct_chunk.
+        """
+        data = memoryview(data).cast('B')
+        filter_mask = 0
+        for idx, (code, flags, vals) in enumerate(self.filters):
+            if code == h5z.FILTER_DEFLATE:
+                data = zlib.compress(data, vals[0] if vals else DEFAULT_GZIP)
+            elif code == h5z.FILTER_SHUFFLE:
+                data = _filters.shuffle(data, self._shuffle_size(vals))
+            elif code == h5z.FILTER_FLETCHER32:
+                checksum = _filters.fletcher32(data)
+                data = bytes(data) + checksum.to_bytes(4, 'little')
+            elif code == h5z.FILTER_LZF:
+                compressed = _filters.lzf_compress(data)
+                if compressed is None:
+                    # Incompressible; HDF5 stores the chunk as it is
+                    filter_mask |= 1 << idx
+                else:
+                    data = compressed
+            else:
+                raise ValueError("Filter %s is not supported" % get_filter_name(code))
+        return filter_mask, data
+
 CHUNK_BASE = 16*1024    # Multiplier by which chunks are adjusted
 CHUNK_MIN = 8*1024      # Soft lower limit (8k)
 CHUNK_MAX = 1024*1024   # Hard upper limit (1M)
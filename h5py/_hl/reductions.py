@@ -0,0 +1,282 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Reductions over datasets too big to read into memory at once.
+
+    The dataset is read in blocks made of whole chunks, each of which is
+    reduced with NumPy, and the partial results are combined in order.
+    Reading and reducing blocks runs on a pool of threads, with a bounded
+    number of blocks in memory.  Undocumented and subject to change without
+    warning; use the Dataset methods.
+"""
+
+from collections import namedtuple
+import itertools
+import operator
+
+import numpy
+
+from .base import phil, product
+from . import chunks as chunk_io
+from . import selections as sel
+
+#: Approximate size of the blocks read and reduced in one piece
+BLOCK_BYTES = 8 * 1024 * 1024
+
+Stats = namedtuple('Stats', ['count', 'min', 'max', 'mean', 'std'])
+
+# Moved in NumPy 1.25
+AxisError = getattr(numpy, 'exceptions', numpy).AxisError
+
+
+def normalize_axis(axis, ndim):
+    """ Convert an axis argument (None, an int or a tuple of ints) to a
+    sorted tuple of non-negative ints, as NumPy does.
+    """
+    if axis is None:
+        return tuple(range(ndim))
+    if not isinstance(axis, tuple):
+        axis = (axis,)
+    axes = []
+    for ax in axis:
+        ax = operator.index(ax)
+        if not -ndim <= ax < ndim:
+            raise AxisError(ax, ndim)
+        ax %= ndim
+        if ax in axes:
+            raise ValueError("duplicate value in 'axis'")
+        axes.append(ax)
+    return tuple(sorted(axes))
+
+
+def block_shape(shape, unit, itemsize, target=BLOCK_BYTES):
+    """ Shape of blocks of about target bytes, made of whole units (chunks).
+
+    Blocks are extended along the last axis first, so that for contiguous
+    datasets (unit of 1 on each axis) they cover whole rows.
+    """
+    block = [min(u, n) for u, n in zip(unit, shape)]
+    for ax in reversed(range(len(shape))):
+        nbytes = product(block) * itemsize
+        factor = max(1, target // max(nbytes, 1))
+        block[ax] = min(shape[ax], block[ax] * factor)
+        if block[ax] < shape[ax]:
+            break
+    return tuple(block)
+
+
+def iter_blocks(shape, block):
+    """ Yield a tuple of slices for each block covering a shape """
+    ranges = [range(0, n, b) for n, b in zip(shape, block)]
+    for starts in itertools.product(*ranges):
+        yield tuple(slice(s, min(s + b, n))
+                    for s, b, n in zip(starts, block, shape))
+
+
+def map_blocks(dset, func, max_workers=None):
+    """ Read a dataset in blocks and yield (block, func(arr)) for each,
+    in order.  func is called on a pool of max_workers threads.
+    """
+    with phil:
+        shape = dset.shape
+        if shape is None:
+            raise TypeError("Empty datasets have no data to reduce")
+        unit = dset.chunks or (1,) * len(shape)
+        block = block_shape(shape, unit, dset.dtype.itemsize)
+        nblocks = product(-(-n // max(b, 1)) for n, b in zip(shape, block))
+        workers = min(chunk_io.default_workers(max_workers), nblocks)
+
+        # Decoding chunks ourselves pays off with several threads, or to
+        # use decoded_chunk_cache; otherwise HDF5 is a little faster.
+        key = None
+        if dset._direct_chunk_ok and chunk_io.decoded_chunk_cache.capacity:
+            key = dset._decoded_cache_key
+        direct = dset._direct_chunk_ok and (workers > 1 or key is not None)
+
+    if nblocks == 0:
+        return
+
+    def work(slices, selection):
+        if selection is not None:
+            # phil is taken for each HDF5 call, not while decompressing
+            arr = chunk_io.read_chunks(dset, selection, 1, cache_key=key)
+        else:
+            arr = dset[slices]
+        return slices, func(arr)
+
+    def args_iter():
+        for slices in iter_blocks(shape, block):
+            selection = None
+            if direct:
+                with phil:
+                    selection = sel.select(shape, slices, dataset=dset)
+            yield slices, selection
+
+    yield from chunk_io._imap(work, args_iter(), workers)
+
+
+def fold(dset, axes, partial, combine, max_workers=None):
+    """ Reduce a dataset over axes, block by block.
+
+    partial(arr) returns a tuple of arrays, reduced over axes of the block
+    with keepdims=True.  combine(a, b) merges two such tuples for the same
+    region of the result.  Returns a list of arrays, with the shape of the
+    dataset but 1 along the reduced axes, or None if the dataset is empty.
+    """
+    acc = None
+    for slices, part in map_blocks(dset, partial, max_workers):
+        idx = tuple(slice(None) if ax in axes else s
+                    for ax, s in enumerate(slices))
+        if acc is None:
+            out_shape = tuple(1 if ax in axes else n
+                              for ax, n in enumerate(dset.shape))
+            acc = [numpy.empty(out_shape, dtype=p.dtype) for p in part]
+            seen = set()
+        region = tuple(s.start for s in idx if s.start is not None)
+        if region in seen:
+            part = combine(tuple(a[idx] for a in acc), part)
+        seen.add(region)
+        for a, p in zip(acc, part):
+            a[idx] = p
+    return acc
+
+
+def _finish(arr, axes, keepdims):
+    """ Drop the reduced axes, or give a scalar when reducing over all """
+    if keepdims:
+        return arr
+    shape = tuple(n for ax, n in enumerate(arr.shape) if ax not in axes)
+    arr = arr.reshape(shape)
+    if shape == ():
+        return arr[()]
+    return arr
+
+
+def reduce(dset, ufunc, axis=None, dtype=None, keepdims=False, max_workers=None):
+    """ Equivalent to ufunc.reduce(dset[()], axis, dtype) """
+    axes = normalize_axis(axis, dset.ndim)
+
+    def partial(arr):
+        return (ufunc.reduce(arr, axis=axes, dtype=dtype, keepdims=True),)
+
+    def combine(a, b):
+        return (ufunc(a[0], b[0]),)
+
+    acc = fold(dset, axes, partial, combine, max_workers)
+    if acc is None:
+        # Empty: let NumPy give the identity, or raise an error
+        res = ufunc.reduce(numpy.empty(dset.shape, dset.dtype), axis=axes,
+                           dtype=dtype, keepdims=True)
+    else:
+        res = acc[0]
+    return _finish(res, axes, keepdims)
+
+
+def _mean_dtype(dtype):
+    """ Accumulator dtype NumPy uses for the mean """
+    if dtype.kind in 'biu':
+        return numpy.dtype('f8')
+    if dtype == numpy.dtype('f2'):
+        return numpy.dtype('f4')
+    return dtype
+
+
+def mean(dset, axis=None, dtype=None, keepdims=False, max_workers=None):
+    """ Equivalent to numpy.mean(dset[()], axis, dtype) """
+    axes = normalize_axis(axis, dset.ndim)
+    count = product(dset.shape[ax] for ax in axes)
+    acc_dtype = _mean_dtype(dset.dtype) if dtype is None else dtype
+    total = reduce(dset, numpy.add, axes, acc_dtype, True, max_workers)
+    with numpy.errstate(invalid='ignore', divide='ignore'):
+        res = numpy.true_divide(total, count, dtype=total.dtype)
+    if dtype is None and dset.dtype == numpy.dtype('f2'):
+        res = res.astype('f2')
+    return _finish(res, axes, keepdims)
+
+
+def stats(dset, axis=None, keepdims=False, max_workers=None):
+    """ Count, min, max, mean & standard deviation in one pass.
+
+    The variance of each block is combined with the pairwise formula of
+    Chan, Golub & LeVeque, which is stable for large counts.
+    """
+    axes = normalize_axis(axis, dset.ndim)
+    acc_dtype = _mean_dtype(dset.dtype)
+
+    def partial(arr):
+        n = product(arr.shape[ax] for ax in axes)
+        m = numpy.mean(arr, axis=axes, dtype=acc_dtype, keepdims=True)
+        d = arr - m
+        m2 = numpy.sum((d * d.conj()).real, axis=axes, keepdims=True)
+        return (
+            numpy.full(m.shape, n, dtype=numpy.intp),
+            numpy.minimum.reduce(arr, axis=axes, keepdims=True),
+            numpy.maximum.reduce(arr, axis=axes, keepdims=True),
+            m,
+            m2,
+        )
+
+    def combine(a, b):
+        na, mina, maxa, ma, m2a = a
+        nb, minb, maxb, mb, m2b = b
+        n = na + nb
+        delta = mb - ma
+        frac = (nb / n).astype(m2a.dtype)
+        return (
+            n,
+            numpy.minimum(mina, minb),
+            numpy.maximum(maxa, maxb),
+            ma + delta * frac,
+            m2a + m2b + (delta * delta.conj()).real * na * frac,
+        )
+
+    acc = fold(dset, axes, partial, combine, max_workers)
+    if acc is None or product(dset.shape[ax] for ax in axes) == 0:
+        raise ValueError("zero-size array to reduction operation stats")
+    n, mn, mx, m, m2 = acc
+    std = numpy.sqrt(m2 / n.astype(m2.dtype))
+    if dset.dtype == numpy.dtype('f2'):
+        m, std = m.astype('f2'), std.astype('f2')
+    return Stats(*(_finish(x, axes, keepdims) for x in (n, mn, mx, m, std)))
+
+
+def histogram(dset, bins=10, range=None, density=False, max_workers=None):
+    """ Equivalent to numpy.histogram(dset[()], bins, range, density) """
+    if isinstance(bins, str):
+        raise TypeError("Bins estimated from the data (%r) are not supported"
+                        % bins)
+    if numpy.ndim(bins) == 0 and range is None:
+        # Range of the data, as NumPy would take it: needs a first pass
+        if dset.size == 0:
+            range = (0, 1)
+        else:
+            axes = normalize_axis(None, dset.ndim)
+            mn, mx = fold(dset, axes, lambda arr: (
+                numpy.minimum.reduce(arr, axis=None, keepdims=True),
+                numpy.maximum.reduce(arr, axis=None, keepdims=True),
+            ), lambda a, b: (
+                numpy.minimum(a[0], b[0]), numpy.maximum(a[1], b[1])
+            ), max_workers)
+            range = (mn.flat[0], mx.flat[0])
+            if not numpy.all(numpy.isfinite(range)):
+                raise ValueError(
+                    "autodetected range of [{}, {}] is not finite".format(*range))
+    edges = numpy.histogram_bin_edges(
+        numpy.empty(0, dtype=dset.dtype), bins, range)
+
+    hist = numpy.zeros(len(edges) - 1, dtype=numpy.intp)
+    for _, counts in map_blocks(
+            dset, lambda arr: numpy.histogram(arr, edges)[0], max_workers):
+        hist += counts
+
+    if density:
+        db = numpy.diff(edges).astype(float)
+        return hist / db / hist.sum(), edges
+    return hist, edges
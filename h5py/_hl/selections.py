@@ -82,6 +82,49 @@ def select(shape, args, dataset=None):
     return selector.make_selection(args)
 
 
+def sort_index_list(shape, args):
+    """ Prepare to read an index list which isn't in increasing order.
+
+    HDF5 selections always deliver data in storage order, so an index list
+    (a list or 1D integer array for one axis) must be increasing.  To read
+    one in any order, with repeats, read the sorted unique indices (each
+    chunk is then decoded once) and rearrange the result.
+
+    Returns None if no rearranging is needed; otherwise a tuple
+    (args, axis, inverse), so that ``numpy.take(dset[args], inverse, axis)``
+    gives the data in the order requested.
+    """
+    rank = len(shape)
+    found = None
+    dim = axis = 0
+    for i, a in enumerate(args):
+        if a is Ellipsis:
+            n = rank - (len(args) - 1)
+            dim += n
+            axis += n
+            continue
+        if isinstance(a, (list, np.ndarray)):
+            arr = np.asarray(a)
+            if arr.ndim == 1 and arr.dtype.kind in 'iu' and dim < rank:
+                if found is not None:
+                    return None  # More than one list; an error later
+                found = (i, dim, axis, arr)
+        elif isinstance(a, (int, np.integer)):
+            dim += 1  # Integers drop an axis from the result
+            continue
+        dim += 1
+        axis += 1
+
+    if found is None:
+        return None
+    i, dim, axis, arr = found
+    arr = np.where(arr < 0, arr + shape[dim], arr)
+    if np.all(arr[1:] > arr[:-1]):
+        return None
+    indices, inverse = np.unique(arr, return_inverse=True)
+    return args[:i] + (indices,) + args[i+1:], axis, inverse.reshape(-1)
+
+
 class Selection:
 
     """
@@ -24,6 +24,33 @@ from .utils cimport emalloc, efree, convert_dims
 
 import_array()
 
+# Number of runs of indices to select in one dataspace before combining
+cdef Py_ssize_t FANCY_GROUP_RUNS = 32
+
+# Number of different selections on the other axes which read_many will try
+# to read together along the first axis
+cdef Py_ssize_t MAX_DENSE_GROUPS = 8
+
+
+cdef bint _same_except_first(int64_t[:, ::1] params, int rank,
+                             Py_ssize_t a, Py_ssize_t b) noexcept:
+    # Do two rows of read_many's hyperslab parameters only differ on axis 0?
+    cdef int j, d
+    for j in range(4):
+        for d in range(1, rank):
+            if params[a, j * rank + d] != params[b, j * rank + d]:
+                return False
+    return True
+
+
+cdef object _as_shape(ndarray view, tuple shape):
+    # Drop the axes of integer indices, and make 0D arrays scalars
+    if len(shape) == 0:
+        return view.reshape(())[()]
+    if view.ndim != len(shape):
+        return view.reshape(shape)
+    return view
+
 
 cdef object convert_bools(bint* data, hsize_t rank):
     # Convert a bint array to a Python tuple of bools.
@@ -72,8 +99,12 @@ cdef class Selector:
         efree(self.block)
         efree(self.scalar)
 
-    cdef bint apply_args(self, tuple args) except 0:
-        """Apply indexing arguments to this Selector object"""
+    cdef bint apply_args(self, tuple args, bint select=True) except 0:
+        """Apply indexing arguments to this Selector object
+
+        If select is False, only the hyperslab parameters & is_fancy are set,
+        without changing the selection in the dataspace.
+        """
         cdef:
             int nargs, ellipsis_ix, array_ix = -1
             bint seen_ellipsis = False
@@ -232,7 +263,9 @@ cdef class Selector:
                 self.block[dim_ix] = 1
                 self.scalar[dim_ix] = False
 
-        if nargs == 0:
+        if not select:
+            self.is_fancy = array_ix != -1
+        elif nargs == 0:
             H5Sselect_all(self.space)
             self.is_fancy = False
         elif array_ix != -1:
@@ -244,25 +277,68 @@ cdef class Selector:
         return True
 
     cdef select_fancy(self, int array_ix, ndarray array_arg):
-        """Apply a 'fancy' selection (array of indices) to the dataspace"""
-        cdef hsize_t* tmp_start
-        cdef hsize_t* tmp_count
-        cdef uint64_t i
+        """Apply a 'fancy' selection (array of indices) to the dataspace
 
-        H5Sselect_none(self.space)
+        Runs of consecutive indices are selected as one hyperslab each.
+        Adding hyperslabs one at a time to a selection gets slower as the
+        selection grows, so the runs are split into small groups, each
+        selected in its own copy of the dataspace, and the groups are then
+        combined pairwise.
+        """
+        cdef hsize_t* tmp_start = NULL
+        cdef hsize_t* tmp_count = NULL
+        cdef hid_t* groups = NULL
+        cdef const int64_t[::1] run_start
+        cdef const int64_t[::1] run_len
+        cdef Py_ssize_t nruns, ngroups, i, j, step
+        cdef H5S_seloper_t op
+
+        H5Sselect_none(self.space)  # Also makes copies of the space cheap
+        if array_arg.shape[0] == 0:
+            return
+
+        # Indices are already checked to be increasing
+        run_ix = np.flatnonzero(np.diff(array_arg) != 1) + 1
+        run_ix = np.concatenate(([0], run_ix, [array_arg.shape[0]]))
+        run_start = np.ascontiguousarray(array_arg[run_ix[:-1]], dtype=np.int64)
+        run_len = np.diff(run_ix).astype(np.int64)
+        nruns = run_len.shape[0]
+        ngroups = (nruns + FANCY_GROUP_RUNS - 1) // FANCY_GROUP_RUNS
 
         tmp_start = <hsize_t*>emalloc(sizeof(hsize_t) * self.rank)
         tmp_count = <hsize_t*>emalloc(sizeof(hsize_t) * self.rank)
+        groups = <hid_t*>emalloc(sizeof(hid_t) * ngroups)
+        memset(groups, 0, sizeof(hid_t) * ngroups)
         try:
             memcpy(tmp_start, self.start, sizeof(hsize_t) * self.rank)
             memcpy(tmp_count, self.count, sizeof(hsize_t) * self.rank)
-            tmp_count[array_ix] = 1
 
-            # Iterate over the array of indices, add each hyperslab to the selection
-            for i in array_arg:
-                tmp_start[array_ix] = i
-                H5Sselect_hyperslab(self.space, H5S_SELECT_OR, tmp_start, self.stride, tmp_count, self.block)
+            # The first group is built in our own dataspace, which ends up
+            # holding the combined selection.
+            groups[0] = self.space
+            for i in range(1, ngroups):
+                groups[i] = H5Scopy(self.space)
+
+            for i in range(nruns):
+                op = H5S_SELECT_SET if i % FANCY_GROUP_RUNS == 0 else H5S_SELECT_OR
+                tmp_start[array_ix] = run_start[i]
+                tmp_count[array_ix] = run_len[i]
+                H5Sselect_hyperslab(groups[i // FANCY_GROUP_RUNS], op,
+                                    tmp_start, self.stride, tmp_count, self.block)
+
+            step = 1
+            while step < ngroups:
+                for i in range(0, ngroups - step, 2 * step):
+                    j = i + step
+                    H5Smodify_select(groups[i], H5S_SELECT_OR, groups[j])
+                    H5Sclose(groups[j])
+                    groups[j] = 0
+                step *= 2
         finally:
+            for i in range(1, ngroups):
+                if groups[i] > 0:
+                    H5Sclose(groups[i])
+            efree(groups)
             efree(tmp_start)
             efree(tmp_count)
 
@@ -383,6 +459,209 @@ cdef class Reader:
         else:
             return arr
 
+    def read_many(self, list args_list):
+        """Read several selections, each given as a tuple of indexing args
+
+        Returns a list with an array (or a scalar) for each selection, or None
+        for 'fancy' selections, which should be read separately.
+
+        Selections which differ only along the first axis are read together
+        as one block spanning all of them, if at least half of that block is
+        wanted.  Other selections whose points all come before the next one's
+        in the file (in C order) are combined into one dataspace and read
+        with one H5Dread call; overlapping ones need more calls.  The arrays
+        returned are views of the buffers read into.
+
+        Only works for simple numeric dtypes.
+        """
+        cdef:
+            Py_ssize_t n = len(args_list)
+            int rank = self.selector.rank
+            int64_t[:, ::1] params   # start, stride, count, block
+            int64_t[::1] first, last, npoints
+            int64_t lin_first, lin_last, size, total, lo, hi, row
+            const int64_t[::1] order
+            Py_ssize_t i, k, b
+            int d
+            list results, shapes, groups, group, batches, batch_ends, batch, sparse
+
+        params = np.zeros((n, 4 * rank), dtype=np.int64)
+        first = np.zeros(n, dtype=np.int64)
+        last = np.zeros(n, dtype=np.int64)
+        npoints = np.zeros(n, dtype=np.int64)
+        results = [None] * n
+        shapes = [None] * n
+        groups = []
+        sparse = []
+
+        for i in range(n):
+            self.selector.apply_args(args_list[i], False)
+            if self.selector.is_fancy:
+                continue
+
+            size = 1
+            lin_first = lin_last = 0
+            shape = []
+            for d in range(rank):
+                params[i, d] = self.selector.start[d]
+                params[i, rank + d] = self.selector.stride[d]
+                params[i, 2 * rank + d] = self.selector.count[d]
+                params[i, 3 * rank + d] = self.selector.block[d]
+                size *= self.selector.count[d] * self.selector.block[d]
+                if not self.selector.scalar[d]:
+                    shape.append(self.selector.count[d] * self.selector.block[d])
+                # Flat indices of the first & last selected points
+                lin_first = lin_first * self.selector.dims[d] + self.selector.start[d]
+                lin_last = lin_last * self.selector.dims[d] + self.selector.start[d]
+                if self.selector.count[d] > 0:
+                    lin_last += ((self.selector.count[d] - 1) * self.selector.stride[d]
+                                 + self.selector.block[d] - 1)
+            shapes[i] = tuple(shape)
+            npoints[i] = size
+            first[i] = lin_first
+            last[i] = lin_last
+            if size == 0:
+                results[i] = self._make_array_1d(0).reshape(shapes[i])
+            elif self.selector.block[0] == 1:
+                # Group by the selection on all but the first axis
+                for group in groups:
+                    if _same_except_first(params, rank, group[0], i):
+                        group.append(i)
+                        break
+                else:
+                    if len(groups) < MAX_DENSE_GROUPS:
+                        groups.append([i])
+                    else:
+                        sparse.append(i)
+            else:
+                sparse.append(i)
+
+        # Dense groups: read the block of rows they span
+        for group in groups:
+            i = group[0]
+            lo = hi = params[i, 0]
+            total = 0
+            for i in group:
+                lo = min(lo, params[i, 0])
+                hi = max(hi, params[i, 0] + (params[i, 2 * rank] - 1) * params[i, rank] + 1)
+                total += npoints[i]
+            i = group[0]
+            row = npoints[i] // params[i, 2 * rank]
+            if len(group) == 1 or 2 * total < (hi - lo) * row:
+                sparse.extend(group)
+                continue
+
+            box = np.array(params[i:i + 1])
+            box[0, 0] = lo
+            box[0, rank] = 1
+            box[0, 2 * rank] = hi - lo
+            arr = self._make_array_1d((hi - lo) * row)
+            self._read_union([0], box, (hi - lo) * row, arr)
+            arr = arr.reshape((hi - lo,) + tuple([
+                params[i, 2 * rank + d] * params[i, 3 * rank + d] for d in range(1, rank)
+            ]))
+
+            for i in group:
+                lo_i = params[i, 0] - lo
+                view = arr[lo_i:lo_i + (params[i, 2 * rank] - 1) * params[i, rank] + 1:params[i, rank]]
+                results[i] = _as_shape(view, shapes[i])
+
+        # The rest: sort by the first point, and put each selection into the
+        # first batch it doesn't overlap.
+        order = np.argsort(first, kind='stable').astype(np.int64)
+        in_sparse = np.zeros(n, dtype=bool)
+        in_sparse[sparse] = True
+        batches = []
+        batch_ends = []
+        for k in range(n):
+            i = order[k]
+            if not in_sparse[i]:
+                continue
+            for b in range(len(batches)):
+                if batch_ends[b] < first[i]:
+                    batches[b].append(i)
+                    batch_ends[b] = last[i]
+                    break
+            else:
+                batches.append([i])
+                batch_ends.append(last[i])
+
+        for batch in batches:
+            total = 0
+            for i in batch:
+                total += npoints[i]
+            arr = self._make_array_1d(total)
+            self._read_union(batch, params, total, arr)
+
+            total = 0
+            for i in batch:
+                results[i] = _as_shape(arr[total:total + npoints[i]], shapes[i])
+                total += npoints[i]
+
+        return results
+
+    cdef ndarray _make_array_1d(self, npy_intp size):
+        arr = PyArray_ZEROS(1, &size, self.np_typenum, 0)
+        if not self.native_byteorder:
+            arr = arr.view(arr.dtype.newbyteorder())
+        return arr
+
+    cdef _read_union(self, list batch, int64_t[:, ::1] params, int64_t total,
+                     ndarray arr):
+        """Read the union of several hyperslabs into a 1D array
+
+        As in select_fancy, the hyperslabs are selected in small groups,
+        each in a copy of the dataspace, which are then combined pairwise.
+        """
+        cdef:
+            int rank = self.selector.rank
+            hsize_t* hs = NULL
+            hid_t* groups = NULL
+            hid_t mspace = 0
+            hsize_t mdims = total
+            Py_ssize_t n = len(batch), ngroups, i, j, step
+            int d
+            H5S_seloper_t op
+
+        ngroups = (n + FANCY_GROUP_RUNS - 1) // FANCY_GROUP_RUNS
+        H5Sselect_none(self.selector.space)  # Makes copies of the space cheap
+
+        hs = <hsize_t*>emalloc(sizeof(hsize_t) * 4 * rank)
+        groups = <hid_t*>emalloc(sizeof(hid_t) * ngroups)
+        memset(groups, 0, sizeof(hid_t) * ngroups)
+        try:
+            groups[0] = self.selector.space
+            for i in range(1, ngroups):
+                groups[i] = H5Scopy(self.selector.space)
+
+            for i in range(n):
+                for d in range(4 * rank):
+                    hs[d] = params[batch[i], d]
+                op = H5S_SELECT_SET if i % FANCY_GROUP_RUNS == 0 else H5S_SELECT_OR
+                H5Sselect_hyperslab(groups[i // FANCY_GROUP_RUNS], op,
+                                    hs, hs + rank, hs + 2 * rank, hs + 3 * rank)
+
+            step = 1
+            while step < ngroups:
+                for i in range(0, ngroups - step, 2 * step):
+                    j = i + step
+                    H5Smodify_select(groups[i], H5S_SELECT_OR, groups[j])
+                    H5Sclose(groups[j])
+                    groups[j] = 0
+                step *= 2
+
+            mspace = H5Screate_simple(1, &mdims, NULL)
+            H5Dread(self.dataset, self.h5_memory_datatype.id, mspace,
+                    self.selector.space, H5P_DEFAULT, PyArray_DATA(arr))
+        finally:
+            if mspace > 0:
+                H5Sclose(mspace)
+            for i in range(1, ngroups):
+                if groups[i] > 0:
+                    H5Sclose(groups[i])
+            efree(groups)
+            efree(hs)
+
 
 class MultiBlockSlice:
     """
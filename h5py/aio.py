@@ -0,0 +1,340 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    asyncio wrappers for the high-level API.
+
+    Every operation which may touch the file runs on a thread pool, so the
+    event loop is never blocked, either by HDF5 or by waiting for h5py's
+    global lock.  See the "asyncio" page of the documentation.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+
+from ._hl.dataset import Dataset
+from ._hl.files import File
+from ._hl.group import Group
+
+__all__ = ['AsyncFile', 'AsyncGroup', 'AsyncDataset', 'AsyncAttributeManager']
+
+# h5py serialises calls into HDF5, so more threads than this mostly wait
+DEFAULT_MAX_WORKERS = 4
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor():
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                DEFAULT_MAX_WORKERS, thread_name_prefix='h5py-aio'
+            )
+        return _default_executor
+
+
+class _Runner:
+    """ Runs blocking calls on an executor, with at most max_pending of them
+    submitted at once.
+
+    An operation counts as pending until its thread is finished with it,
+    even if the task awaiting it was cancelled in the meantime.
+    """
+
+    def __init__(self, executor=None, max_pending=DEFAULT_MAX_WORKERS):
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.executor = executor
+        self.max_pending = max_pending
+        self._loop = None
+        self._sem = None
+
+    def _semaphore(self, loop):
+        # Semaphores belong to one event loop in older Python versions
+        if self._loop is not loop:
+            self._loop = loop
+            self._sem = asyncio.Semaphore(self.max_pending)
+        return self._sem
+
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        sem = self._semaphore(loop)
+        await sem.acquire()
+
+        def release(_):
+            try:
+                loop.call_soon_threadsafe(sem.release)
+            except RuntimeError:
+                pass  # Event loop closed
+
+        try:
+            executor = self.executor or _get_default_executor()
+            cfut = executor.submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            sem.release()
+            raise
+        cfut.add_done_callback(release)
+
+        # If this is cancelled before the call starts, it's dropped from the
+        # executor's queue.  Once started, it runs to completion.
+        return await asyncio.wrap_future(cfut)
+
+
+def _wrap(obj, runner):
+    """ Wrap a high-level object; call this in a worker thread """
+    if isinstance(obj, File):
+        return AsyncFile._from_sync(obj, runner)
+    if isinstance(obj, Group):
+        return AsyncGroup(obj, runner)
+    if isinstance(obj, Dataset):
+        return AsyncDataset(obj, runner)
+    return obj
+
+
+class _AsyncObject:
+
+    """ Common base for the wrapped objects """
+
+    def __init__(self, obj, runner):
+        self.sync = obj
+        self._runner = runner
+        # Snapshot, so looking at it doesn't need phil
+        self.name = obj.name
+
+    def _run(self, func, *args, **kwargs):
+        return self._runner.run(func, *args, **kwargs)
+
+    @property
+    def attrs(self):
+        """ Attributes of this object """
+        return AsyncAttributeManager(self)
+
+    def __repr__(self):
+        return "<async %s>" % object.__repr__(self.sync)
+
+
+class AsyncGroup(_AsyncObject):
+
+    """ Wraps a Group; use ``await group[name]`` to open members.
+    """
+
+    def __getitem__(self, name):
+        return self._run(lambda: _wrap(self.sync[name], self._runner))
+
+    async def get(self, name, default=None):
+        """ Open a member, or return default if it doesn't exist """
+        def get():
+            obj = self.sync.get(name)
+            return default if obj is None else _wrap(obj, self._runner)
+        return await self._run(get)
+
+    async def keys(self):
+        """ List of member names """
+        return await self._run(lambda: list(self.sync.keys()))
+
+    async def contains(self, name):
+        """ Check if a member exists """
+        return await self._run(self.sync.__contains__, name)
+
+    async def create_group(self, name, **kwds):
+        """ Create a subgroup; see Group.create_group """
+        return await self._run(
+            lambda: _wrap(self.sync.create_group(name, **kwds), self._runner)
+        )
+
+    async def require_group(self, name):
+        """ Open or create a subgroup; see Group.require_group """
+        return await self._run(
+            lambda: _wrap(self.sync.require_group(name), self._runner)
+        )
+
+    async def create_dataset(self, name, shape=None, dtype=None, data=None, **kwds):
+        """ Create a dataset; see Group.create_dataset """
+        return await self._run(lambda: _wrap(
+            self.sync.create_dataset(name, shape, dtype, data, **kwds), self._runner
+        ))
+
+    async def delete(self, name):
+        """ Delete a member, like ``del group[name]`` """
+        await self._run(self.sync.__delitem__, name)
+
+
+class AsyncFile(AsyncGroup):
+
+    """ An HDF5 file for use with asyncio.
+
+    Takes the same arguments as h5py.File, plus:
+
+    executor
+        A concurrent.futures.Executor to run HDF5 calls on.  By default,
+        a thread pool shared by all asynchronous files is used.
+    max_pending
+        How many operations on this file may be submitted to the executor
+        at once.  Further operations wait, without blocking the event loop.
+
+    The file is opened by ``await AsyncFile(...)`` or
+    ``async with AsyncFile(...)``.
+    """
+
+    def __init__(self, *args, executor=None, max_pending=DEFAULT_MAX_WORKERS, **kwds):
+        self._args = args
+        self._kwds = kwds
+        self._runner = _Runner(executor, max_pending)
+        self.sync = None
+
+    @classmethod
+    def _from_sync(cls, obj, runner):
+        self = cls.__new__(cls)
+        self._args = self._kwds = None
+        _AsyncObject.__init__(self, obj, runner)
+        return self
+
+    async def _open(self):
+        if self.sync is None:
+            await self._run(lambda: _AsyncObject.__init__(
+                self, File(*self._args, **self._kwds), self._runner
+            ))
+        return self
+
+    def __await__(self):
+        return self._open().__await__()
+
+    async def __aenter__(self):
+        return await self._open()
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def flush(self):
+        """ Tell HDF5 to flush its buffers """
+        await self._run(self.sync.flush)
+
+    async def close(self):
+        """ Close the file """
+        if self.sync is not None:
+            await self._run(self.sync.close)
+
+
+class AsyncDataset(_AsyncObject):
+
+    """ Wraps a Dataset.
+
+    shape, dtype, chunks, ndim and size are recorded when the dataset is
+    opened, and updated by resize(); use ``await ds.refresh()`` to pick up
+    changes made through other objects.
+    """
+
+    def __init__(self, obj, runner):
+        super().__init__(obj, runner)
+        self._update_meta()
+
+    def _update_meta(self):
+        obj = self.sync
+        self.shape = obj.shape
+        self.dtype = obj.dtype
+        self.chunks = obj.chunks
+        self.ndim = len(self.shape) if self.shape is not None else 0
+        self.size = obj.size
+
+    async def read(self, sel=()):
+        """ Read data, like ``dset[sel]`` """
+        return await self._run(self.sync.__getitem__, sel)
+
+    async def write(self, sel, data):
+        """ Write data, like ``dset[sel] = data``.
+
+        If the task is cancelled once the write has started, it still
+        completes, so data is never half written by a cancellation.
+        """
+        await self._run(self.sync.__setitem__, sel, data)
+
+    async def resize(self, size, axis=None):
+        """ Resize the dataset; see Dataset.resize """
+        def resize():
+            self.sync.resize(size, axis)
+            self._update_meta()
+        await self._run(resize)
+
+    async def refresh(self):
+        """ Reload the cached metadata, and refresh SWMR readers """
+        def refresh():
+            if self.sync.file.swmr_mode:
+                self.sync.refresh()
+            self._update_meta()
+        await self._run(refresh)
+
+    async def iter_chunks(self, sel=None, *, prefetch=1):
+        """ Iterate over (slices, data) for each chunk in the selection.
+
+        Unlike Dataset.iter_chunks, the data is read as well.  Up to
+        prefetch chunks are read ahead, while the caller is busy with the
+        current one.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        slices = await self._run(lambda: list(self.sync.iter_chunks(sel)))
+
+        pending = deque()
+        it = iter(slices)
+        try:
+            for s in it:
+                pending.append((s, asyncio.ensure_future(self.read(s))))
+                if len(pending) > prefetch:
+                    s, task = pending.popleft()
+                    yield s, await task
+            while pending:
+                s, task = pending.popleft()
+                yield s, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+
+class AsyncAttributeManager:
+
+    """ Wraps the attributes of an object; use ``await obj.attrs[name]``.
+    """
+
+    def __init__(self, parent):
+        self._parent = parent
+
+    def _run(self, func, *args, **kwargs):
+        return self._parent._run(func, *args, **kwargs)
+
+    def __getitem__(self, name):
+        return self._run(lambda: self._parent.sync.attrs[name])
+
+    async def get(self, name, default=None):
+        """ Read an attribute, or return default if it doesn't exist """
+        return await self._run(lambda: self._parent.sync.attrs.get(name, default))
+
+    async def set(self, name, value):
+        """ Set an attribute, like ``attrs[name] = value`` """
+        def set_attr():
+            self._parent.sync.attrs[name] = value
+        await self._run(set_attr)
+
+    async def delete(self, name):
+        """ Delete an attribute """
+        def delete():
+            del self._parent.sync.attrs[name]
+        await self._run(delete)
+
+    async def keys(self):
+        """ List of attribute names """
+        return await self._run(lambda: list(self._parent.sync.attrs.keys()))
+
+    async def items(self):
+        """ List of (name, value) pairs """
+        return await self._run(lambda: list(self._parent.sync.attrs.items()))
@@ -0,0 +1,10 @@
+# This file is automatically generated by the h5py setup script.  Don't modify.
+
+DEF MPI = False
+DEF ROS3 = True
+DEF HDF5_VERSION = (1, 10, 8)
+DEF DIRECT_VFD = False
+DEF VOL_MIN_HDF5_VERSION = (1,11,5)
+DEF COMPLEX256_SUPPORT = True
+DEF NUMPY_BUILD_VERSION = '2.4.6'
+DEF CYTHON_BUILD_VERSION = '3.3.0'
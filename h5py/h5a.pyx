@@ -14,7 +14,7 @@
 
 # C-level imports
 from ._objects cimport pdefault
-from .h5t cimport TypeID, typewrap, py_create
+from .h5t cimport TypeID, typewrap, py_create, py_create_cached
 from .h5s cimport SpaceID
 from .h5p cimport PropID
 from numpy cimport import_array, ndarray, PyArray_DATA
@@ -360,7 +360,7 @@ cdef class AttrID(ObjectID):
             check_numpy_write(arr, space_id)
 
             if mtype is None:
-                mtype = py_create(arr.dtype)
+                mtype = py_create_cached(arr.dtype)
 
             attr_rw(self.id, mtype.id, PyArray_DATA(arr), 1)
 
@@ -388,7 +388,7 @@ cdef class AttrID(ObjectID):
             check_numpy_read(arr, space_id)
 
             if mtype is None:
-                mtype = py_create(arr.dtype)
+                mtype = py_create_cached(arr.dtype)
 
             attr_rw(self.id, mtype.id, PyArray_DATA(arr), 0)
 
@@ -15,23 +15,26 @@ include "config.pxi"
 
 # Compile-time imports
 cimport cython
-from libc.string cimport strcmp
+from libc.string cimport strcmp, strlen
 from ._objects cimport pdefault
 from numpy cimport ndarray, import_array, PyArray_DATA, PyArray_Descr, PyArray_DESCR
 from .utils cimport  check_numpy_read, check_numpy_write, \
                      convert_tuple, convert_dims, emalloc, efree
-from .h5t cimport TypeID, typewrap, py_create, H5PY_NUMPY_STRING_TAG
+from .h5t cimport TypeID, typewrap, py_create, py_create_cached, \
+                  H5PY_NUMPY_STRING_TAG
 from .h5s cimport SpaceID
 from .h5p cimport PropID, propwrap
 from ._proxy cimport dset_rw, dset_rw_vlen_strings
 
 from collections import namedtuple
+import numpy as np
 from ._objects import phil, with_phil
 from cpython cimport PyBUF_ANY_CONTIGUOUS, \
                      PyBuffer_Release, \
                      PyBytes_AsString, \
                      PyBytes_FromStringAndSize, \
-                     PyObject_GetBuffer
+                     PyObject_GetBuffer, \
+                     PyUnicode_Decode
 
 
 # Initialization
@@ -115,8 +118,70 @@ IF HDF5_VERSION >= (1, 12, 3) or (HDF5_VERSION >= (1, 10, 10) and HDF5_VERSION <
             return 1
         return 0
 
+# === Chunk index =============================================================
+
+cdef struct _ChunkIndexBuf:
+    # Arrays for DatasetID.get_chunk_index to fill in
+    int rank
+    hsize_t n
+    hsize_t capacity
+    hsize_t* offsets
+    unsigned* masks
+    haddr_t* addrs
+    hsize_t* sizes
+
+
+cdef bint _chunk_index_add(_ChunkIndexBuf* buf, const hsize_t* offset,
+                           unsigned filter_mask, haddr_t addr,
+                           hsize_t size) noexcept nogil:
+    cdef int i
+    if addr == HADDR_UNDEF:
+        return True
+    if buf.n >= buf.capacity:
+        return False
+    for i in range(buf.rank):
+        buf.offsets[buf.n * buf.rank + i] = offset[i]
+    buf.masks[buf.n] = filter_mask
+    buf.addrs[buf.n] = addr
+    buf.sizes[buf.n] = size
+    buf.n += 1
+    return True
+
+
+IF HDF5_VERSION >= (1, 12, 3) or (HDF5_VERSION >= (1, 10, 10) and HDF5_VERSION < (1, 10, 99)):
+
+    cdef int _cb_chunk_index(const hsize_t *offset, unsigned filter_mask, haddr_t addr,
+                             hsize_t size, void *op_data) noexcept nogil:
+        # Callback for H5Dchunk_iter in DatasetID.get_chunk_index.  More
+        # chunks than H5Dget_num_chunks counted is an error.
+        if _chunk_index_add(<_ChunkIndexBuf*>op_data, offset, filter_mask, addr, size):
+            return 0
+        return -1
+
 # === Dataset operations ======================================================
 
+cdef hid_t read_vlen_str_buf(DatasetID dset, SpaceID mspace, SpaceID fspace,
+                             PropID dxpl, char **buf) except -1:
+    # Read variable-length strings into buf, an array of as many pointers as
+    # points selected in mspace.  Returns the memory type; the caller must
+    # reclaim the strings with it (H5Dvlen_reclaim) and close it.
+    cdef hid_t stype = H5Dget_type(dset.id)
+    try:
+        if not H5Tis_variable_str(stype):
+            raise TypeError("Dataset is not a variable-length string dataset")
+        memset(buf, 0, sizeof(char *) * max(H5Sget_select_npoints(mspace.id), 1))
+        try:
+            H5Dread(dset.id, stype, mspace.id, fspace.id, pdefault(dxpl), buf)
+        except:
+            # Strings read before a failure were still allocated
+            H5Dvlen_reclaim(stype, mspace.id, H5P_DEFAULT, buf)
+            raise
+    except:
+        H5Tclose(stype)
+        raise
+    return stype
+
+
 @with_phil
 def create(ObjectID loc not None, object name, TypeID tid not None,
            SpaceID space not None, PropID dcpl=None, PropID lcpl=None,
@@ -245,7 +310,7 @@ cdef class DatasetID(ObjectID):
         cdef int oldflags
 
         if mtype is None:
-            mtype = py_create(arr_obj.dtype)
+            mtype = py_create_cached(arr_obj.dtype)
         check_numpy_write(arr_obj, -1)
 
         self_id = self.id
@@ -290,7 +355,7 @@ cdef class DatasetID(ObjectID):
         cdef int oldflags
 
         if mtype is None:
-            mtype = py_create(arr_obj.dtype)
+            mtype = py_create_cached(arr_obj.dtype)
         check_numpy_read(arr_obj, -1)
 
         self_id = self.id
@@ -307,6 +372,209 @@ cdef class DatasetID(ObjectID):
             dset_rw(self_id, mtype_id, mspace_id, fspace_id, plist_id, data, 0)
 
 
+    @with_phil
+    def read_vlen_flat(self, SpaceID mspace not None, SpaceID fspace not None,
+                       object dtype, PropID dxpl=None):
+        """ (SpaceID mspace, SpaceID fspace, DTYPE dtype, PropDXID dxpl=None)
+            => (NDARRAY values, NDARRAY offsets)
+
+            Read the selected elements of a variable-length dataset into one
+            flat array of values, with the given dtype for the base type, and
+            an int64 array of offsets, one longer than the number of elements:
+            element i is values[offsets[i]:offsets[i+1]].
+
+            The memory dataspace must have the same number of selected points
+            as the file dataspace.  No NumPy object is made per element.
+        """
+        cdef hid_t vtype = -1
+        cdef hvl_t *buf = NULL
+        cdef hssize_t npoints, i
+        cdef int64_t total = 0
+        cdef int64_t *offs
+        cdef char *dest
+        cdef size_t itemsize
+        cdef TypeID base
+        cdef ndarray values, offsets
+
+        dtype = np.dtype(dtype)
+        base = py_create(dtype)
+        itemsize = dtype.itemsize
+        npoints = H5Sget_select_npoints(mspace.id)
+        offsets = np.empty(npoints + 1, dtype=np.int64)
+        offs = <int64_t *>PyArray_DATA(offsets)
+
+        vtype = H5Tvlen_create(base.id)
+        try:
+            buf = <hvl_t *>emalloc(sizeof(hvl_t) * max(npoints, 1))
+            memset(buf, 0, sizeof(hvl_t) * max(npoints, 1))
+            try:
+                # Reclaim what HDF5 allocated even if the read fails partway
+                H5Dread(self.id, vtype, mspace.id, fspace.id, pdefault(dxpl), buf)
+                for i in range(npoints):
+                    offs[i] = total
+                    total += buf[i].len
+                offs[npoints] = total
+                values = np.empty(total, dtype=dtype)
+                dest = <char *>PyArray_DATA(values)
+                with nogil:
+                    for i in range(npoints):
+                        if buf[i].len:
+                            memcpy(dest + offs[i] * itemsize, buf[i].p,
+                                   buf[i].len * itemsize)
+            finally:
+                H5Dvlen_reclaim(vtype, mspace.id, H5P_DEFAULT, buf)
+        finally:
+            efree(buf)
+            H5Tclose(vtype)
+        return values, offsets
+
+
+    @with_phil
+    def read_vlen_str_flat(self, SpaceID mspace not None,
+                           SpaceID fspace not None, PropID dxpl=None):
+        """ (SpaceID mspace, SpaceID fspace, PropDXID dxpl=None)
+            => (NDARRAY values, NDARRAY offsets)
+
+            Read the selected elements of a variable-length string dataset
+            into one flat uint8 array holding the encoded strings back to
+            back, and an int64 array of offsets, one longer than the number of
+            elements: element i is values[offsets[i]:offsets[i+1]].
+
+            The memory dataspace must have the same number of selected points
+            as the file dataspace.  No Python object is made per element.
+        """
+        cdef hid_t stype = -1
+        cdef char **buf = NULL
+        cdef hssize_t npoints, i
+        cdef int64_t total = 0
+        cdef int64_t *offs
+        cdef char *dest
+        cdef ndarray values, offsets
+
+        npoints = H5Sget_select_npoints(mspace.id)
+        offsets = np.empty(npoints + 1, dtype=np.int64)
+        offs = <int64_t *>PyArray_DATA(offsets)
+
+        try:
+            buf = <char **>emalloc(sizeof(char *) * max(npoints, 1))
+            stype = read_vlen_str_buf(self, mspace, fspace, dxpl, buf)
+            try:
+                with nogil:
+                    for i in range(npoints):
+                        offs[i] = total
+                        if buf[i] != NULL:
+                            total += strlen(buf[i])
+                    offs[npoints] = total
+                values = np.empty(total, dtype=np.uint8)
+                dest = <char *>PyArray_DATA(values)
+                with nogil:
+                    for i in range(npoints):
+                        if offs[i + 1] > offs[i]:
+                            memcpy(dest + offs[i], buf[i], offs[i + 1] - offs[i])
+            finally:
+                H5Dvlen_reclaim(stype, mspace.id, H5P_DEFAULT, buf)
+        finally:
+            efree(buf)
+            if stype >= 0:
+                H5Tclose(stype)
+        return values, offsets
+
+
+    @with_phil
+    def read_vlen_str_decoded(self, SpaceID mspace not None,
+                              SpaceID fspace not None, str encoding not None,
+                              str errors='strict', PropID dxpl=None):
+        """ (SpaceID mspace, SpaceID fspace, STRING encoding,
+             STRING errors='strict', PropDXID dxpl=None) => NDARRAY
+
+            Read the selected elements of a variable-length string dataset
+            into a 1D object array of str, decoding each string straight from
+            the HDF5 buffer.  encoding and errors are as for bytes.decode().
+
+            The memory dataspace must have the same number of selected points
+            as the file dataspace.
+        """
+        cdef hid_t stype = -1
+        cdef char **buf = NULL
+        cdef hssize_t npoints, i
+        cdef bytes enc = encoding.encode('ascii')
+        cdef bytes err = errors.encode('ascii')
+        cdef list strings = []
+        cdef ndarray out
+
+        npoints = H5Sget_select_npoints(mspace.id)
+        try:
+            buf = <char **>emalloc(sizeof(char *) * max(npoints, 1))
+            stype = read_vlen_str_buf(self, mspace, fspace, dxpl, buf)
+            try:
+                for i in range(npoints):
+                    if buf[i] == NULL:
+                        strings.append('')
+                    else:
+                        strings.append(PyUnicode_Decode(buf[i], strlen(buf[i]), enc, err))
+            finally:
+                H5Dvlen_reclaim(stype, mspace.id, H5P_DEFAULT, buf)
+        finally:
+            efree(buf)
+            if stype >= 0:
+                H5Tclose(stype)
+        out = np.empty(npoints, dtype=object)
+        out[:] = strings
+        return out
+
+
+    @with_phil
+    def write_vlen_flat(self, SpaceID mspace not None, SpaceID fspace not None,
+                        ndarray values not None, ndarray offsets not None,
+                        PropID dxpl=None):
+        """ (SpaceID mspace, SpaceID fspace, NDARRAY values, NDARRAY offsets,
+             PropDXID dxpl=None)
+
+            Write the selected elements of a variable-length dataset from a
+            flat array of values and an int64 array of offsets, one longer
+            than the number of elements: element i is
+            values[offsets[i]:offsets[i+1]].  Both arrays must be
+            C-contiguous, and the offsets must not decrease.
+        """
+        cdef hid_t vtype = -1
+        cdef hvl_t *buf = NULL
+        cdef hssize_t npoints, i
+        cdef int64_t *offs
+        cdef char *src
+        cdef size_t itemsize
+        cdef TypeID base
+
+        check_numpy_read(values, -1)
+        check_numpy_read(offsets, -1)
+        if offsets.dtype != np.int64 or offsets.ndim != 1:
+            raise TypeError("offsets must be a 1D int64 array")
+        npoints = H5Sget_select_npoints(mspace.id)
+        if offsets.shape[0] != npoints + 1:
+            raise ValueError("%d offsets given for %d elements"
+                             % (offsets.shape[0], npoints))
+        offs = <int64_t *>PyArray_DATA(offsets)
+        if offs[0] < 0 or offs[npoints] > values.size:
+            raise ValueError("offsets out of range for %d values" % values.size)
+        for i in range(npoints):
+            if offs[i + 1] < offs[i]:
+                raise ValueError("offsets must not decrease")
+
+        base = py_create(values.dtype)
+        itemsize = values.dtype.itemsize
+        src = <char *>PyArray_DATA(values)
+
+        vtype = H5Tvlen_create(base.id)
+        try:
+            buf = <hvl_t *>emalloc(sizeof(hvl_t) * max(npoints, 1))
+            for i in range(npoints):
+                buf[i].len = offs[i + 1] - offs[i]
+                buf[i].p = src + offs[i] * itemsize
+            H5Dwrite(self.id, vtype, mspace.id, fspace.id, pdefault(dxpl), buf)
+        finally:
+            efree(buf)
+            H5Tclose(vtype)
+
+
     @with_phil
     def extend(self, tuple shape):
         """ (TUPLE shape)
@@ -488,6 +756,7 @@ cdef class DatasetID(ObjectID):
         """
         H5Drefresh(self.id)
 
+    @with_phil
     def write_direct_chunk(self, offsets, data, filter_mask=0x00000000, PropID dxpl=None):
         """ (offsets, data, uint32_t filter_mask=0x00000000, PropID dxpl=None)
 
@@ -536,6 +805,7 @@ cdef class DatasetID(ObjectID):
                 H5Sclose(space_id)
 
 
+    @with_phil
     @cython.boundscheck(False)
     @cython.wraparound(False)
     def read_direct_chunk(self, offsets, PropID dxpl=None, unsigned char[::1] out=None):
@@ -688,6 +958,78 @@ cdef class DatasetID(ObjectID):
                          byte_offset if byte_offset != HADDR_UNDEF else None,
                          size)
 
+    @with_phil
+    def get_chunk_index(self):
+        """ () => NDARRAY
+
+        Retrieve the chunk offset, filter mask, file address and size of
+        every written chunk at once, as a structured array with fields
+        chunk_offset (an array of length rank), filter_mask, byte_offset
+        and size.  It is sorted by chunk offset.
+
+        The array is filled in without creating Python objects for each
+        chunk.  With HDF5 1.10.10 or any later 1.10, or 1.12.3 or later,
+        this uses H5Dchunk_iter.  Older versions can only look chunks up
+        one at a time, which takes time proportional to the number of
+        chunks for each one.
+
+        .. versionadded:: 3.15
+        """
+        cdef int rank
+        cdef hid_t space_id = 0
+        cdef hsize_t nchunks = 0, k
+        cdef hsize_t* coord = NULL
+        cdef _ChunkIndexBuf buf
+        cdef haddr_t addr
+        cdef hsize_t size
+        cdef unsigned filter_mask
+        cdef ndarray offsets, masks, addrs, sizes
+
+        space_id = H5Dget_space(self.id)
+        try:
+            rank = H5Sget_simple_extent_ndims(space_id)
+            H5Dget_num_chunks(self.id, space_id, &nchunks)
+
+            offsets = np.zeros((nchunks, rank), dtype=np.uint64)
+            masks = np.zeros(nchunks, dtype=np.uint32)
+            addrs = np.zeros(nchunks, dtype=np.uint64)
+            sizes = np.zeros(nchunks, dtype=np.uint64)
+            buf.rank = rank
+            buf.n = 0
+            buf.capacity = nchunks
+            buf.offsets = <hsize_t*>PyArray_DATA(offsets)
+            buf.masks = <unsigned*>PyArray_DATA(masks)
+            buf.addrs = <haddr_t*>PyArray_DATA(addrs)
+            buf.sizes = <hsize_t*>PyArray_DATA(sizes)
+
+            IF HDF5_VERSION >= (1, 12, 3) or (HDF5_VERSION >= (1, 10, 10) and HDF5_VERSION < (1, 10, 99)):
+                if nchunks:
+                    H5Dchunk_iter(self.id, H5P_DEFAULT,
+                                  <H5D_chunk_iter_op_t>_cb_chunk_index, <void*>&buf)
+            ELSE:
+                coord = <hsize_t*>emalloc(sizeof(hsize_t) * rank)
+                for k in range(nchunks):
+                    H5Dget_chunk_info(self.id, space_id, k, coord,
+                                      &filter_mask, &addr, &size)
+                    _chunk_index_add(&buf, coord, filter_mask, addr, size)
+        finally:
+            H5Sclose(space_id)
+            efree(coord)
+
+        n = buf.n
+        order = np.lexsort(offsets[:n].T[::-1]) if rank else np.arange(n)
+        out = np.zeros(n, dtype=[
+            ('chunk_offset', np.uint64, (rank,)),
+            ('filter_mask', np.uint32),
+            ('byte_offset', np.uint64),
+            ('size', np.uint64),
+        ])
+        out['chunk_offset'] = offsets[:n][order]
+        out['filter_mask'] = masks[:n][order]
+        out['byte_offset'] = addrs[:n][order]
+        out['size'] = sizes[:n][order]
+        return out
+
     IF HDF5_VERSION >= (1, 12, 3) or (HDF5_VERSION >= (1, 10, 10) and HDF5_VERSION < (1, 10, 99)):
 
         @with_phil
@@ -100,10 +100,29 @@ LOG_ALL       = H5FD_LOG_ALL        # (H5FD_LOG_ALLOC|H5FD_LOG_TIME_IO|H5FD_LOG_
 # non-zero value.
 
 
+# The driver reads and writes the file-like object in one of these ways,
+# chosen when the file is opened:
+#  - IO_FD: for files from open() (or io.FileIO) on regular files, pread()
+#    and pwrite() on the file descriptor, releasing the GIL. Not on Windows.
+#  - IO_AT: if the object has readinto_at(offset, buf) (and optionally
+#    write_at(offset, buf)) methods, positional I/O through those. This
+#    doesn't move the object's position, so it can be shared safely.
+#  - IO_SEEK: otherwise, seek() followed by readinto() (or read()) and
+#    write().
+
+cdef enum:
+    IO_SEEK = 0
+    IO_AT = 1
+    IO_FD = 2
+
 # H5FD_t of file-like object
 ctypedef struct H5FD_fileobj_t:
     H5FD_t base  # must be first
     PyObject* fileobj
+    PyObject* cache  # BlockCache or None
+    int read_io  # IO_* for reads
+    int write_io  # IO_* for writes
+    int fd  # File descriptor for IO_FD
     haddr_t eoa
 
 
@@ -113,13 +132,271 @@ ctypedef struct H5FD_fileobj_t:
 from cpython cimport Py_INCREF, Py_DECREF
 from libc.stdlib cimport malloc as stdlib_malloc
 from libc.stdlib cimport free as stdlib_free
+from libc.errno cimport errno, EINTR
 cimport libc.stdio
 cimport libc.stdint
+import io
+import os
+import stat
+
+IF UNAME_SYSNAME != "Windows":
+    from posix.unistd cimport pread, pwrite
+
+
+cdef int fileobj_choose_io(H5FD_fileobj_t *f, fileobj) except -1:
+    f.read_io = f.write_io = IO_SEEK
+    f.fd = -1
+    if hasattr(fileobj, 'readinto_at'):
+        f.read_io = IO_AT
+        if hasattr(fileobj, 'write_at'):
+            f.write_io = IO_AT
+        return 0
+    IF UNAME_SYSNAME != "Windows":
+        # Only trust fileno() for plain files: e.g. GzipFile.fileno() gives
+        # the descriptor of the compressed file.
+        raw = fileobj
+        if isinstance(fileobj, (io.BufferedReader, io.BufferedRandom)):
+            raw = fileobj.raw
+        if not (isinstance(raw, io.FileIO) and raw.readable()):
+            return 0
+        # pwrite() appends in append mode, whatever the offset
+        if 'a' in raw.mode or not stat.S_ISREG(os.fstat(raw.fileno()).st_mode):
+            return 0
+        fileobj.flush()
+        f.fd = raw.fileno()
+        f.read_io = IO_FD
+        if raw.writable():
+            f.write_io = IO_FD
+    return 0
+
+
+cdef size_t fileobj_read_at(H5FD_fileobj_t *f, haddr_t addr, size_t size, unsigned char *buf) except? -1:
+    """ Read up to size bytes at addr; returns the number read """
+    cdef unsigned char[:] mview
+    cdef size_t done = 0
+    cdef ssize_t n = 0
+    cdef int err = 0
+    fileobj = <object>f.fileobj
+    if f.read_io == IO_FD:
+        IF UNAME_SYSNAME != "Windows":
+            with nogil:
+                while done < size:
+                    n = pread(f.fd, buf + done, size - done, addr + done)
+                    if n < 0 and errno == EINTR:
+                        continue
+                    if n <= 0:
+                        err = errno if n < 0 else 0
+                        break
+                    done += n
+            if err:
+                raise OSError(err, os.strerror(err))
+            return done
+    if size == 0:
+        return 0
+    mview = <unsigned char[:size]>buf
+    if f.read_io == IO_AT:
+        return fileobj.readinto_at(addr, mview)
+    fileobj.seek(addr)
+    if hasattr(fileobj, 'readinto'):
+        return fileobj.readinto(mview)
+    b = fileobj.read(size)
+    done = len(b)
+    memcpy(buf, <unsigned char *>b, done)
+    return done
+
+
+cdef int fileobj_write_at(H5FD_fileobj_t *f, haddr_t addr, size_t size, const unsigned char *buf) except -1:
+    cdef unsigned char[:] mview
+    cdef size_t done = 0
+    cdef ssize_t n = 0
+    cdef int err = 0
+    fileobj = <object>f.fileobj
+    if f.write_io == IO_FD:
+        IF UNAME_SYSNAME != "Windows":
+            with nogil:
+                while done < size:
+                    n = pwrite(f.fd, buf + done, size - done, addr + done)
+                    if n < 0 and errno == EINTR:
+                        continue
+                    if n < 0:
+                        err = errno
+                        break
+                    done += n
+            if err:
+                raise OSError(err, os.strerror(err))
+            return 0
+    mview = <unsigned char[:size]>buf
+    if f.write_io == IO_AT:
+        fileobj.write_at(addr, mview)
+    else:
+        fileobj.seek(addr)
+        fileobj.write(mview)
+    return 0
+
 
+# File-like objects may be slow to access (e.g. over a network), and
+# HDF5 makes many small reads. An optional BlockCache, passed along with
+# the file-like object, keeps aligned blocks of the file in memory, so that
+# HDF5 reads mostly come from the cache. Writes go straight through to the
+# file-like object, discarding cached blocks they overlap.
+
+from collections import OrderedDict
+
+
+cdef class BlockCache:
+
+    """(block_size=65536, max_bytes=16777216, readahead=1)
+
+    Least-recently-used cache of fixed-size, aligned blocks of a Python
+    file-like object, for the 'fileobj' driver.  Pass it when opening the
+    file::
+
+        cache = h5py.h5fd.BlockCache(block_size=256 * 1024)
+        f = h5py.File(fileobj, 'r', block_cache=cache)
+
+    On a miss, the block is read from the file-like object along with up to
+    ``readahead`` following blocks, in a single read() call.  Cached blocks
+    are discarded, least recently used first, to keep their total size
+    under ``max_bytes``.  The cache is cleared when a file is opened with
+    it; it can only be used by one open file at a time.
+
+    Counters: ``hits`` and ``misses`` count blocks; ``reads`` counts calls
+    to the file-like object's read(); ``evictions`` counts blocks discarded
+    to make room.
+    """
+
+    cdef readonly size_t block_size
+    cdef readonly size_t max_bytes
+    cdef readonly size_t readahead
+    cdef readonly size_t nbytes
+    cdef public unsigned long long hits, misses, reads, evictions
+    cdef object blocks  # block index -> bytes
+    cdef object owner   # file-like object of the open file using the cache
+
+    def __init__(self, size_t block_size=65536, size_t max_bytes=16777216,
+                 size_t readahead=1):
+        if block_size == 0:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+        self.readahead = readahead
+        self.blocks = OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = self.reads = self.evictions = 0
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __repr__(self):
+        return "<BlockCache: %d blocks of %d bytes, %d/%d bytes>" % (
+            len(self), self.block_size, self.nbytes, self.max_bytes)
+
+    def clear(self):
+        """()
+
+        Discard all cached blocks.
+        """
+        self.blocks.clear()
+        self.nbytes = 0
+
+    def reset_stats(self):
+        """()
+
+        Set the hits, misses, reads and evictions counters to 0.
+        """
+        self.hits = self.misses = self.reads = self.evictions = 0
+
+    cdef int attach(self, fileobj) except -1:
+        if self.owner is not None and self.owner is not fileobj:
+            raise ValueError("BlockCache is already used by another open file")
+        self.owner = fileobj
+        self.clear()
+        return 0
+
+    cdef int detach(self) except -1:
+        self.owner = None
+        self.clear()
+        return 0
+
+    cdef bytes fetch(self, H5FD_fileobj_t *f, size_t block, size_t last):
+        """ Read block and the blocks after it, up to last + readahead and
+        stopping at a cached block.  Returns the data of the first block.
+        """
+        cdef size_t bs = self.block_size
+        cdef size_t n = 1
+        cdef size_t i
+        cdef bytearray buf
+        while block + n <= last + self.readahead and (block + n) not in self.blocks:
+            n += 1
+        buf = bytearray(n * bs)
+        data = bytes(memoryview(buf)[:fileobj_read_at(f, block * bs, n * bs, buf)])
+        self.reads += 1
+        self.misses += 1
+        first = data[:bs]
+        for i in range(n):
+            if i * bs >= <size_t>len(data):
+                break  # Past the end of the file
+            self.store(block + i, data[i * bs:(i + 1) * bs])
+        return first
+
+    cdef int store(self, size_t block, bytes data) except -1:
+        old = self.blocks.pop(block, None)
+        if old is not None:
+            self.nbytes -= len(old)
+        if <size_t>len(data) > self.max_bytes:
+            return 0
+        self.blocks[block] = data
+        self.nbytes += len(data)
+        while self.nbytes > self.max_bytes:
+            _, old = self.blocks.popitem(last=False)
+            self.nbytes -= len(old)
+            self.evictions += 1
+        return 0
+
+    cdef int read(self, H5FD_fileobj_t *f, haddr_t addr, size_t size, unsigned char *buf) except -1:
+        """ Copy size bytes from addr to buf; zeros past the end of file """
+        cdef size_t bs = self.block_size
+        cdef haddr_t pos = addr
+        cdef haddr_t end = addr + size
+        cdef size_t block, offset, n, avail
+        cdef bytes data
+        while pos < end:
+            block = pos // bs
+            data = self.blocks.get(block)
+            if data is None:
+                data = self.fetch(f, block, (end - 1) // bs)
+            else:
+                self.hits += 1
+                self.blocks.move_to_end(block)
+            offset = pos - block * bs
+            n = min(<size_t>(end - pos), bs - offset)
+            avail = <size_t>len(data) - offset if <size_t>len(data) > offset else 0
+            avail = min(avail, n)
+            memcpy(buf + (pos - addr), <unsigned char *>data + offset, avail)
+            if avail < n:
+                memset(buf + (pos - addr) + avail, 0, n - avail)
+            pos += n
+        return 0
+
+    cdef int discard(self, haddr_t addr, size_t size) except -1:
+        """ Drop cached blocks overlapping a written region """
+        cdef size_t bs = self.block_size
+        cdef size_t block
+        if size == 0:
+            return 0
+        for block in range(addr // bs, (addr + size - 1) // bs + 1):
+            old = self.blocks.pop(block, None)
+            if old is not None:
+                self.nbytes -= len(old)
+        return 0
+
+
+# The driver info in the FAPL is a tuple (fileobj, cache)
 
 cdef void *H5FD_fileobj_fapl_get(H5FD_fileobj_t *f) with gil:
-    Py_INCREF(<object>f.fileobj)
-    return f.fileobj
+    fa = (<object>f.fileobj, <object>f.cache)
+    Py_INCREF(fa)
+    return <PyObject *>fa
 
 cdef void *H5FD_fileobj_fapl_copy(PyObject *old_fa) with gil:
     cdef PyObject *new_fa = old_fa
@@ -131,16 +408,34 @@ cdef herr_t H5FD_fileobj_fapl_free(PyObject *fa) except -1 with gil:
     return 0
 
 cdef H5FD_fileobj_t *H5FD_fileobj_open(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr) except * with gil:
-    cdef PyObject *fileobj = <PyObject *>H5Pget_driver_info(fapl)
+    fileobj, cache = <object>H5Pget_driver_info(fapl)
+    if cache is not None:
+        (<BlockCache?>cache).attach(fileobj)
     f = <H5FD_fileobj_t *>stdlib_malloc(sizeof(H5FD_fileobj_t))
-    f.fileobj = fileobj
-    Py_INCREF(<object>f.fileobj)
+    f.fileobj = <PyObject *>fileobj
+    Py_INCREF(fileobj)
+    f.cache = <PyObject *>cache
+    Py_INCREF(cache)
     f.eoa = 0
+    try:
+        fileobj_choose_io(f, fileobj)
+    except BaseException:
+        H5FD_fileobj_close(f)
+        raise
     return f
 
 cdef herr_t H5FD_fileobj_close(H5FD_fileobj_t *f) except -1 with gil:
-    Py_DECREF(<object>f.fileobj)
-    stdlib_free(f)
+    try:
+        if <object>f.cache is not None:
+            (<BlockCache>f.cache).detach()
+        if f.read_io == IO_FD:
+            # Seeking to the end drops data the file object may have
+            # buffered before we changed the file under it.
+            (<object>f.fileobj).seek(0, libc.stdio.SEEK_END)
+    finally:
+        Py_DECREF(<object>f.fileobj)
+        Py_DECREF(<object>f.cache)
+        stdlib_free(f)
     return 0
 
 cdef haddr_t H5FD_fileobj_get_eoa(const H5FD_fileobj_t *f, H5FD_mem_t type) noexcept nogil:
@@ -151,11 +446,22 @@ cdef herr_t H5FD_fileobj_set_eoa(H5FD_fileobj_t *f, H5FD_mem_t type, haddr_t add
     return 0
 
 cdef haddr_t H5FD_fileobj_get_eof(const H5FD_fileobj_t *f, H5FD_mem_t type) except -1 with gil:  # HADDR_UNDEF
+    if f.read_io == IO_FD:
+        return os.fstat(f.fd).st_size
     (<object>f.fileobj).seek(0, libc.stdio.SEEK_END)
     return (<object>f.fileobj).tell()
 
 cdef herr_t H5FD_fileobj_read(H5FD_fileobj_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) except -1 with gil:
     cdef unsigned char[:] mview
+    cdef size_t n
+    if <object>f.cache is not None:
+        return (<BlockCache>f.cache).read(f, addr, size, <unsigned char *>buf)
+    if f.read_io != IO_SEEK:
+        # Like the sec2 driver, reading past the end of the file gives zeros
+        n = fileobj_read_at(f, addr, size, <unsigned char *>buf)
+        if n < size:
+            memset(<unsigned char *>buf + n, 0, size - n)
+        return 0
     (<object>f.fileobj).seek(addr)
     if hasattr(<object>f.fileobj, 'readinto'):
         mview = <unsigned char[:size]>(buf)
@@ -169,14 +475,14 @@ cdef herr_t H5FD_fileobj_read(H5FD_fileobj_t *f, H5FD_mem_t type, hid_t dxpl, ha
     return 0
 
 cdef herr_t H5FD_fileobj_write(H5FD_fileobj_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) except -1 with gil:
-    cdef unsigned char[:] mview
-    (<object>f.fileobj).seek(addr)
-    mview = <unsigned char[:size]>buf
-    (<object>f.fileobj).write(mview)
-    return 0
+    if <object>f.cache is not None:
+        (<BlockCache>f.cache).discard(addr, size)
+    return fileobj_write_at(f, addr, size, <const unsigned char *>buf)
 
 cdef herr_t H5FD_fileobj_truncate(H5FD_fileobj_t *f, hid_t dxpl, hbool_t closing) except -1 with gil:
     (<object>f.fileobj).truncate(f.eoa)
+    if <object>f.cache is not None:
+        (<BlockCache>f.cache).clear()
     return 0
 
 cdef herr_t H5FD_fileobj_flush(H5FD_fileobj_t *f, hid_t dxpl, hbool_t closing) except -1 with gil:
@@ -235,3 +541,105 @@ IF HDF5_VERSION >= (1, 14, 0):
     info.version = H5FD_CLASS_VERSION
 
 fileobj_driver = H5FDregister(&info)
+
+
+# Implementation of the read-only 'mmap' Virtual File Driver. The whole
+# file is mapped into memory when it is opened, so each HDF5 read is a
+# memcpy from the map, with no system call and without the GIL. Processes
+# mapping the same file share its pages in the OS page cache.
+
+# The map is made with Python's mmap module, which works on all platforms.
+# H5FD_mmap_t holds a buffer exported by the mmap object, which keeps the
+# map valid until the file is closed.
+
+ctypedef struct H5FD_mmap_t:
+    H5FD_t base  # must be first
+    PyObject* mmap  # mmap.mmap object, or None for an empty file
+    Py_buffer view
+    haddr_t eoa
+
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+
+
+cdef H5FD_mmap_t *H5FD_mmap_open(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr) except * with gil:
+    import mmap
+    if flags & (H5F_ACC_RDWR | H5F_ACC_TRUNC | H5F_ACC_EXCL | H5F_ACC_CREAT):
+        raise ValueError("The mmap driver can only open files read-only")
+
+    with open(<bytes>name, 'rb') as fh:
+        fh.seek(0, libc.stdio.SEEK_END)
+        if fh.tell() == 0:
+            mm = None  # Can't map an empty file; reads give zeros
+        else:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    f = <H5FD_mmap_t *>stdlib_malloc(sizeof(H5FD_mmap_t))
+    if f == NULL:
+        if mm is not None:
+            mm.close()
+        raise MemoryError("Can't allocate the mmap driver's file struct")
+    memset(f, 0, sizeof(H5FD_mmap_t))
+    if mm is not None:
+        try:
+            PyObject_GetBuffer(mm, &f.view, PyBUF_SIMPLE)
+        except BaseException:
+            stdlib_free(f)
+            mm.close()
+            raise
+    f.mmap = <PyObject *>mm
+    Py_INCREF(mm)
+    return f
+
+cdef herr_t H5FD_mmap_close(H5FD_mmap_t *f) except -1 with gil:
+    mm = <object>f.mmap
+    if mm is not None:
+        PyBuffer_Release(&f.view)
+        mm.close()
+    Py_DECREF(mm)
+    stdlib_free(f)
+    return 0
+
+cdef haddr_t H5FD_mmap_get_eoa(const H5FD_mmap_t *f, H5FD_mem_t type) noexcept nogil:
+    return f.eoa
+
+cdef herr_t H5FD_mmap_set_eoa(H5FD_mmap_t *f, H5FD_mem_t type, haddr_t addr) noexcept nogil:
+    f.eoa = addr
+    return 0
+
+cdef haddr_t H5FD_mmap_get_eof(const H5FD_mmap_t *f, H5FD_mem_t type) except -1 nogil:
+    return f.view.len
+
+cdef herr_t H5FD_mmap_read(H5FD_mmap_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) except -1 nogil:
+    # Like the sec2 driver, reading past the end of the file gives zeros
+    cdef size_t n = 0
+    if addr < <haddr_t>f.view.len:
+        n = min(size, <size_t>(f.view.len - addr))
+        memcpy(buf, <char *>f.view.buf + addr, n)
+    if n < size:
+        memset(<char *>buf + n, 0, size - n)
+    return 0
+
+cdef herr_t H5FD_mmap_write(H5FD_mmap_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) except -1 with gil:
+    raise ValueError("The mmap driver is read-only")
+
+
+# Construct H5FD_class_t struct and register 'mmap' driver.
+
+cdef H5FD_class_t mmap_info
+memset(&mmap_info, 0, sizeof(mmap_info))
+
+mmap_info.name = 'mmap'
+mmap_info.maxaddr = libc.stdint.SIZE_MAX - 1
+mmap_info.fc_degree = H5F_CLOSE_WEAK
+mmap_info.open = <H5FD_t *(*)(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr)>H5FD_mmap_open
+mmap_info.close = <file_close_func_ptr>H5FD_mmap_close
+mmap_info.get_eoa = <file_get_eoa_func_ptr>H5FD_mmap_get_eoa
+mmap_info.set_eoa = <file_set_eof_func_ptr>H5FD_mmap_set_eoa
+mmap_info.get_eof = <file_get_eof_func_ptr>H5FD_mmap_get_eof
+mmap_info.read = <file_read_func_ptr>H5FD_mmap_read
+mmap_info.write = <file_write_func_ptr>H5FD_mmap_write
+mmap_info.fl_map = info.fl_map
+IF HDF5_VERSION >= (1, 14, 0):
+    mmap_info.version = H5FD_CLASS_VERSION
+
+mmap_driver = H5FDregister(&mmap_info)
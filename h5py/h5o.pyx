@@ -18,6 +18,7 @@ from ._objects cimport ObjectID, pdefault
 from .h5g cimport GroupID
 from .h5i cimport wrap_identifier
 from .h5p cimport PropID
+from .h5t cimport TypeID, typewrap
 from .utils cimport emalloc, efree
 cimport cython
 # Python level imports:
@@ -423,3 +424,187 @@ def visit(ObjectID loc not None, object func, *,
         <H5_iter_order_t>order, cfunc, <void*>visit, pdefault(lapl))
 
     return visit.retval
+
+
+cdef class _Snapshot:
+    # Columns gathered by snapshot(), one entry per link
+    cdef list path, link_type, obj_type, addr, num_attrs
+    cdef list shape, dtype, layout, chunks, storage_size
+    # HDF5 types seen, and their NumPy dtypes: many datasets share a type
+    cdef list types, dtypes
+
+    def __init__(self):
+        self.path, self.link_type, self.obj_type = [], [], []
+        self.addr, self.num_attrs, self.shape, self.dtype = [], [], [], []
+        self.layout, self.chunks, self.storage_size = [], [], []
+        self.types, self.dtypes = [], []
+
+    cdef object type_dtype(self, hid_t tid):
+        # NumPy dtype for an HDF5 type (taking ownership of it), or None
+        cdef Py_ssize_t i
+        cdef TypeID known
+        for i in range(len(self.types)):
+            known = self.types[i]
+            if H5Tequal(tid, known.id) > 0:
+                H5Tclose(tid)
+                return self.dtypes[i]
+        known = typewrap(tid)
+        try:
+            dt = known.py_dtype()
+        except TypeError:
+            dt = None
+        if len(self.types) < 32:
+            self.types.append(known)
+            self.dtypes.append(dt)
+        return dt
+
+
+cdef object _space_shape(hid_t sid):
+    # Shape of a dataspace: None if null, () if scalar
+    cdef int rank
+    cdef hsize_t *dims = NULL
+    cdef H5S_class_t cls = H5Sget_simple_extent_type(sid)
+    if cls == H5S_NULL:
+        return None
+    if cls == H5S_SCALAR:
+        return ()
+    rank = H5Sget_simple_extent_ndims(sid)
+    dims = <hsize_t *>emalloc(sizeof(hsize_t) * rank)
+    try:
+        H5Sget_simple_extent_dims(sid, dims, NULL)
+        return tuple(dims[i] for i in range(rank))
+    finally:
+        efree(dims)
+
+
+_LAYOUTS = {
+    H5D_COMPACT: 'compact',
+    H5D_CONTIGUOUS: 'contiguous',
+    H5D_CHUNKED: 'chunked',
+    H5D_VIRTUAL: 'virtual',
+}
+
+
+cdef int _snapshot_dataset(_Snapshot snap, hid_t did) except -1:
+    cdef hid_t sid = -1, pid = -1
+    cdef int rank
+    cdef hsize_t *dims = NULL
+    cdef H5D_layout_t layout
+
+    try:
+        sid = H5Dget_space(did)
+        snap.shape.append(_space_shape(sid))
+        snap.dtype.append(snap.type_dtype(H5Dget_type(did)))
+        pid = H5Dget_create_plist(did)
+        layout = H5Pget_layout(pid)
+        snap.layout.append(_LAYOUTS.get(<int>layout, ''))
+        if layout == H5D_CHUNKED:
+            rank = H5Sget_simple_extent_ndims(sid)
+            dims = <hsize_t *>emalloc(sizeof(hsize_t) * rank)
+            H5Pget_chunk(pid, rank, dims)
+            snap.chunks.append(tuple(dims[i] for i in range(rank)))
+        else:
+            snap.chunks.append(None)
+        snap.storage_size.append(H5Dget_storage_size(did))
+    finally:
+        efree(dims)
+        if pid >= 0:
+            H5Pclose(pid)
+        if sid >= 0:
+            H5Sclose(sid)
+    return 0
+
+
+cdef herr_t cb_snapshot(hid_t grp, const char* name, const H5L_info_t *linfo, void* data) except 2 with gil:
+    cdef _Snapshot snap = <_Snapshot>data
+    cdef H5O_info_t oinfo
+    cdef hid_t oid
+
+    snap.path.append(name)
+    snap.link_type.append(<int>linfo.type)
+    if linfo.type != H5L_TYPE_HARD:
+        # Soft & external links aren't followed
+        snap.obj_type.append(-1)
+        snap.addr.append(0)
+        snap.num_attrs.append(-1)
+    else:
+        # Opening the object once is faster than looking it up by name twice
+        oid = H5Oopen(grp, name, H5P_DEFAULT)
+        try:
+            H5Oget_info(oid, &oinfo)
+            snap.obj_type.append(<int>oinfo.type)
+            snap.addr.append(oinfo.addr)
+            snap.num_attrs.append(oinfo.num_attrs)
+            if oinfo.type == H5O_TYPE_DATASET:
+                _snapshot_dataset(snap, oid)
+                return 0
+            if oinfo.type == H5O_TYPE_NAMED_DATATYPE:
+                snap.shape.append(None)
+                snap.dtype.append(snap.type_dtype(H5Tcopy(oid)))
+                snap.layout.append('')
+                snap.chunks.append(None)
+                snap.storage_size.append(0)
+                return 0
+        finally:
+            H5Oclose(oid)
+
+    snap.shape.append(None)
+    snap.dtype.append(None)
+    snap.layout.append('')
+    snap.chunks.append(None)
+    snap.storage_size.append(0)
+    return 0
+
+
+@with_phil
+def snapshot(GroupID loc not None, *, int idx_type=H5_INDEX_NAME,
+             int order=H5_ITER_INC):
+    """(GroupID loc, **kwds) => DICT
+
+    Describe every link below a group, recursively, without creating an
+    object for each one.  Returns a dict of lists, with one entry per link
+    in each list:
+
+    path
+        Link name (bytes) relative to loc
+    link_type
+        Link type (h5l.TYPE_*)
+    obj_type
+        Object type (TYPE_*), or -1 for soft & external links, which
+        aren't followed
+    addr
+        Object address, or 0 for soft & external links
+    num_attrs
+        Number of attributes, or -1 for soft & external links
+    shape
+        Dataset shape, or None
+    dtype
+        NumPy dtype of a dataset or named datatype, or None
+    layout
+        Dataset storage layout ('compact', 'contiguous', 'chunked' or
+        'virtual'), or ''
+    chunks
+        Dataset chunk shape, or None
+    storage_size
+        Bytes of storage allocated for a dataset's data, or 0
+
+    Keywords:
+
+    INT idx_type (h5.INDEX_NAME)
+        What indexing strategy to use
+
+    INT order (h5.ITER_INC)
+        Order in which iteration occurs
+    """
+    cdef _Snapshot snap = _Snapshot()
+
+    H5Lvisit(loc.id, <H5_index_t>idx_type, <H5_iter_order_t>order,
+             cb_snapshot, <void*>snap)
+
+    return {
+        'path': snap.path, 'link_type': snap.link_type,
+        'obj_type': snap.obj_type, 'addr': snap.addr,
+        'num_attrs': snap.num_attrs, 'shape': snap.shape,
+        'dtype': snap.dtype, 'layout': snap.layout, 'chunks': snap.chunks,
+        'storage_size': snap.storage_size,
+    }
@@ -1224,12 +1224,22 @@ cdef class PropFAID(PropInstanceID):
 
 
     @with_phil
-    def set_fileobj_driver(self, hid_t driver_id, object fileobj):
-        """(INT driver_id, OBJECT fileobj)
+    def set_fileobj_driver(self, hid_t driver_id, object fileobj, object block_cache=None):
+        """(INT driver_id, OBJECT fileobj, BlockCache block_cache=None)
 
-        Select the "fileobj" file driver (h5py-specific).
+        Select the "fileobj" file driver (h5py-specific).  An
+        h5fd.BlockCache may be given to cache blocks of the file.
         """
-        return H5Pset_driver(self.id, driver_id, <PyObject *>fileobj)
+        fa = (fileobj, block_cache)
+        return H5Pset_driver(self.id, driver_id, <PyObject *>fa)
+
+    @with_phil
+    def set_mmap_driver(self, hid_t driver_id):
+        """(INT driver_id)
+
+        Select the read-only "mmap" file driver (h5py-specific).
+        """
+        H5Pset_driver(self.id, driver_id, NULL)
 
 
     @with_phil
@@ -71,3 +71,4 @@ cdef hid_t H5PY_OBJ
 cdef char* H5PY_PYTHON_OPAQUE_TAG
 cdef char* H5PY_NUMPY_STRING_TAG
 cpdef TypeID py_create(object dtype, bint logical=*, bint aligned=*)
+cpdef TypeID py_create_cached(object dtype, bint logical=*, bint aligned=*)
@@ -30,7 +30,7 @@ from .utils cimport  emalloc, efree, require_tuple, convert_dims,\
 import codecs
 import platform
 import sys
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 import numpy as np
 from .h5 import get_config
 
@@ -38,7 +38,9 @@ from ._objects import phil, with_phil
 
 cfg = get_config()
 
-_UNAME_MACHINE = platform.uname()[4]
+# platform.machine() rather than platform.uname()[4]: indexing the uname
+# result also determines the processor, which may run a subprocess.
+_UNAME_MACHINE = platform.machine()
 _IS_PPC64 = _UNAME_MACHINE == "ppc64"
 _IS_PPC64LE = _UNAME_MACHINE == "ppc64le"
 
@@ -1776,6 +1778,82 @@ cpdef TypeID py_create(object dtype_in, bint logical=0, bint aligned=0):
         else:
             raise TypeError("No conversion path for dtype: %s" % repr(dt))
 
+# Building an HDF5 type for a compound dtype takes one H5Tinsert per field,
+# which can cost more than reading a few rows of a wide table. Reading and
+# writing data only needs a memory type to hand to HDF5, so py_create_cached()
+# keeps recently used ones.  Dtypes carrying metadata (h5py's vlen, enum,
+# ref & opaque hints) aren't cached, as dtype equality ignores metadata.
+
+PY_CREATE_CACHE_SIZE = 128
+cdef object _type_cache = OrderedDict()
+cdef Py_ssize_t _type_cache_hits = 0
+cdef Py_ssize_t _type_cache_misses = 0
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize', 'maxsize'])
+
+cdef bint _has_metadata(cnp.dtype dt):
+    # True if dt or any dtype nested in it has metadata
+    if (<object>dt).metadata is not None:
+        return True
+    if dt.subdtype is not None:
+        return _has_metadata(dt.subdtype[0])
+    if (<object>dt).names is not None:
+        for field in (<object>dt).fields.values():
+            if _has_metadata(field[0]):
+                return True
+    return False
+
+cpdef TypeID py_create_cached(object dtype_in, bint logical=0, bint aligned=0):
+    """(OBJECT dtype_in, BOOL logical=False, BOOL aligned=False) => TypeID
+
+    Like py_create(), but the result may be shared with other callers, so it
+    must not be modified or committed.  A cached type which has been closed
+    is made again.  For memory types passed to read & write calls.  See
+    py_create_cache_info().
+    """
+    global _type_cache_hits, _type_cache_misses
+    cdef cnp.dtype dt = np.dtype(dtype_in)
+    cdef TypeID tid
+
+    aligned = getattr(dtype_in, "isalignedstruct", aligned)
+    if _has_metadata(dt):
+        return py_create(dt, logical, aligned)
+    # The names used for complex & bool types are configurable
+    key = (dt, logical, aligned,
+           cfg._r_name, cfg._i_name, cfg._f_name, cfg._t_name)
+    with phil:
+        tid = _type_cache.get(key)
+        if tid is not None and tid.valid:
+            _type_cache_hits += 1
+            _type_cache.move_to_end(key)
+            return tid
+        _type_cache_misses += 1
+        tid = py_create(dt, logical, aligned)
+        _type_cache[key] = tid
+        if len(_type_cache) > PY_CREATE_CACHE_SIZE:
+            _type_cache.popitem(last=False)
+        return tid
+
+def py_create_cache_info():
+    """() => CacheInfo
+
+    Statistics of the py_create_cached() cache, as a named tuple
+    (hits, misses, currsize, maxsize).  Lookups of dtypes with metadata
+    aren't counted.
+    """
+    return CacheInfo(_type_cache_hits, _type_cache_misses,
+                     len(_type_cache), PY_CREATE_CACHE_SIZE)
+
+def py_create_cache_clear():
+    """()
+
+    Empty the py_create_cached() cache and reset its statistics.
+    """
+    global _type_cache_hits, _type_cache_misses
+    with phil:
+        _type_cache.clear()
+        _type_cache_hits = _type_cache_misses = 0
+
 def vlen_dtype(basetype):
     """Make a numpy dtype for an HDF5 variable-length datatype
 
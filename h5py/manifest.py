@@ -0,0 +1,422 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Byte-range manifests of HDF5 files.
+
+    export() records where the data of every dataset in a file is stored,
+    along with its type and filters.  open() uses a manifest to read the
+    data directly from the file, decoding chunks in Python, without HDF5
+    parsing the file's metadata.  See the "manifest" page of the
+    documentation.
+"""
+
+import builtins
+import json
+import operator
+import os
+import threading
+
+import numpy
+
+from . import h5d
+from ._hl.base import product
+from ._hl.chunks import touched_chunks
+from ._hl.dataset import Dataset
+from ._hl.files import File
+from ._hl.filters import FilterPipeline
+from ._objects import phil
+
+__all__ = ['export', 'open', 'ManifestFile', 'ManifestDataset']
+
+FORMAT = 'h5py-manifest'
+VERSION = 1
+
+# Drivers which spread a file over several files
+_MULTI_FILE_DRIVERS = ('family', 'split', 'multi')
+
+
+def _chunk_base(file, index, dset):
+    """ What to add to the chunk addresses from HDF5 to get file offsets.
+
+    Some HDF5 versions give chunk addresses relative to the end of the
+    user block, others include it, so look at where a chunk really is.
+    """
+    ub = file.userblock_size
+    if not ub or len(index) == 0:
+        return 0
+    row = index[0]
+    _, data = dset.id.read_direct_chunk(tuple(int(i) for i in row['chunk_offset']))
+    with builtins.open(file.filename, 'rb') as f:
+        for base in (ub, 0):
+            f.seek(int(row['byte_offset']) + base)
+            if f.read(len(data)) == data:
+                return base
+    raise ValueError("Can't find the chunks of %s in the file" % dset.name)
+
+
+def _describe(dset, key):
+    """ (metadata, arrays) recording one dataset, or None if its data can't
+    be read without HDF5.
+    """
+    if dset.shape is None:
+        return None
+    dcpl = dset.id.get_create_plist()
+    layout = dcpl.get_layout()
+    dtype = dset.dtype
+    if dtype.hasobject or dset.id.get_type().get_size() != dtype.itemsize:
+        return None
+    if layout == h5d.VIRTUAL or dcpl.get_external_count():
+        return None
+
+    meta = {'key': key, 'shape': list(dset.shape)}
+    arrays = {key + '.dtype': numpy.empty(0, dtype=dtype)}
+    arrays[key + '.fill'] = numpy.array(dset.fillvalue, dtype=dtype)
+
+    if layout == h5d.CHUNKED:
+        if not dset._direct_chunk_ok:
+            return None
+        meta['layout'] = 'chunked'
+        meta['chunks'] = list(dset.chunks)
+        meta['filters'] = [list(f[:2]) + [list(f[2])]
+                           for f in dset._filter_pipeline.filters]
+        index = dset.id.get_chunk_index()
+        index['byte_offset'] += _chunk_base(dset.file, index, dset)
+        arrays[key + '.index'] = index
+    elif layout == h5d.CONTIGUOUS:
+        meta['layout'] = 'contiguous'
+        # With a user block, HDF5 may give an offset for unallocated data
+        allocated = dset.id.get_storage_size() > 0
+        meta['offset'] = dset.id.get_offset() if allocated else None
+    elif layout == h5d.COMPACT:
+        # Small enough to keep in the manifest
+        meta['layout'] = 'compact'
+        arrays[key + '.data'] = dset[()]
+    else:
+        return None
+    return meta, arrays
+
+
+def export(file, dest):
+    """ Write a manifest of the datasets in an HDF5 file.
+
+    file is an h5py File, or the path of one.  dest is a path or a binary
+    file-like object, to write a NumPy .npz archive to.
+
+    For each dataset, the manifest holds its shape, dtype and fill value,
+    and where its data is stored: the filters and the location of every
+    chunk for chunked datasets, the offset for contiguous ones, or the data
+    itself for compact ones.  Datasets which can't be read without HDF5 are
+    listed as unsupported; see the documentation.
+
+    Returns a list of the names of unsupported datasets.
+    """
+    if not isinstance(file, File):
+        with File(file, 'r') as f:
+            return export(f, dest)
+
+    with phil:
+        if file.driver in _MULTI_FILE_DRIVERS:
+            raise ValueError("Can't export files using the %r driver" % file.driver)
+        if file.mode == 'r+':
+            file.flush()  # Chunk locations must be final
+
+        datasets = {}
+        unsupported = []
+        arrays = {}
+
+        def visit(name, obj):
+            if not isinstance(obj, Dataset):
+                return
+            desc = _describe(obj, 'd%d' % len(datasets))
+            if desc is None:
+                unsupported.append(obj.name)
+            else:
+                meta, arr = desc
+                datasets[obj.name] = meta
+                arrays.update(arr)
+
+        file.visititems(visit)
+
+        meta = {
+            'format': FORMAT,
+            'version': VERSION,
+            'filename': os.path.basename(file.filename),
+            'file_size': file.id.get_filesize(),
+            'datasets': datasets,
+            'unsupported': unsupported,
+        }
+
+    arrays['manifest'] = numpy.frombuffer(json.dumps(meta).encode('utf-8'), dtype='u1')
+    if isinstance(dest, (str, bytes, os.PathLike)):
+        with builtins.open(dest, 'wb') as f:
+            numpy.savez_compressed(f, **arrays)
+    else:
+        numpy.savez_compressed(dest, **arrays)
+    return unsupported
+
+
+def open(manifest, data_path=None):
+    """ Open an HDF5 file to read using a manifest made by export().
+
+    manifest is the path of the manifest or a binary file-like object.
+    data_path is the HDF5 file; by default, the file of the same name as
+    when the manifest was made, in the same directory as the manifest.
+    """
+    with numpy.load(manifest, allow_pickle=False) as npz:
+        arrays = {k: npz[k] for k in npz.files}
+
+    if 'manifest' not in arrays:
+        raise ValueError("Not an h5py manifest")
+    meta = json.loads(arrays.pop('manifest').tobytes().decode('utf-8'))
+    if meta.get('format') != FORMAT:
+        raise ValueError("Not an h5py manifest")
+    if meta['version'] > VERSION:
+        raise ValueError("Manifest version %d is not supported by this version of h5py"
+                         % meta['version'])
+
+    if data_path is None:
+        if not isinstance(manifest, (str, os.PathLike)):
+            raise TypeError("data_path is required when manifest is a file object")
+        data_path = os.path.join(os.path.dirname(os.fspath(manifest)), meta['filename'])
+
+    return ManifestFile(meta, arrays, data_path)
+
+
+def _pread(fd, size, offset, lock):
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, offset)
+    with lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
+
+class ManifestFile:
+
+    """ An HDF5 file read using a manifest; see open().
+
+    Datasets are looked up by their full name, as ``f['/group/data']``.
+    """
+
+    def __init__(self, meta, arrays, data_path):
+        self.filename = os.fspath(data_path)
+        self.unsupported = tuple(meta['unsupported'])
+        self._fd = os.open(self.filename, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        self._lock = threading.Lock()  # Only needed without os.pread
+        try:
+            size = os.fstat(self._fd).st_size
+            if size != meta['file_size']:
+                raise ValueError(
+                    "%s is %d bytes, but the manifest is for a file of %d bytes"
+                    % (self.filename, size, meta['file_size']))
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        self._datasets = {
+            name: ManifestDataset(self, name, m, arrays)
+            for name, m in meta['datasets'].items()
+        }
+
+    def _read(self, size, offset):
+        data = _pread(self._fd, size, offset, self._lock)
+        if len(data) != size:
+            raise OSError("Unexpected end of file reading %s" % self.filename)
+        return data
+
+    @staticmethod
+    def _normname(name):
+        return name if name.startswith('/') else '/' + name
+
+    def __getitem__(self, name):
+        name = self._normname(name)
+        try:
+            return self._datasets[name]
+        except KeyError:
+            if name in self.unsupported:
+                raise TypeError("Dataset %s can't be read without HDF5" % name) from None
+            raise KeyError("No dataset %s in the manifest" % name) from None
+
+    def __contains__(self, name):
+        return self._normname(name) in self._datasets
+
+    def __iter__(self):
+        return iter(self._datasets)
+
+    def __len__(self):
+        return len(self._datasets)
+
+    def keys(self):
+        """ Names of the datasets which can be read """
+        return self._datasets.keys()
+
+    def close(self):
+        """ Close the HDF5 file """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        if self._fd is None:
+            return "<Closed manifest file>"
+        return "<Manifest file %r (%d datasets)>" % (self.filename, len(self))
+
+
+class ManifestDataset:
+
+    """ A dataset read using a manifest.  Supports slicing with integers
+    and slices, like h5py datasets.
+    """
+
+    def __init__(self, file, name, meta, arrays):
+        key = meta['key']
+        self.file = file
+        self.name = name
+        self.shape = tuple(meta['shape'])
+        self.dtype = arrays[key + '.dtype'].dtype
+        self.fillvalue = arrays[key + '.fill'][()]
+        self.layout = meta['layout']
+        self.chunks = tuple(meta['chunks']) if self.layout == 'chunked' else None
+
+        if self.layout == 'chunked':
+            self._pipeline = FilterPipeline.from_filters(meta['filters'], self.dtype.itemsize)
+            # Chunks are found by their number in C order, which the index
+            # is sorted by
+            self._index = index = arrays[key + '.index']
+            coords = index['chunk_offset'] // numpy.array(self.chunks, dtype=numpy.uint64)
+            self._grid = tuple(
+                max(-(-n // c), int(m) + 1) for n, c, m in zip(
+                    self.shape, self.chunks, coords.max(axis=0, initial=0))
+            )
+            self._chunk_ids = numpy.ravel_multi_index(coords.T, self._grid)
+        elif self.layout == 'contiguous':
+            self._offset = meta['offset']
+        else:
+            self._data = arrays[key + '.data']
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return product(self.shape)
+
+    def __len__(self):
+        if not self.shape:
+            raise TypeError("Attempt to take len() of scalar dataset")
+        return self.shape[0]
+
+    def __repr__(self):
+        return '<Manifest dataset "%s": shape %s, type "%s">' % (
+            self.name, self.shape, self.dtype.str)
+
+    def _parse(self, args):
+        """ Turn indexing args into (start, count, step, scalar) per axis """
+        args = args if isinstance(args, tuple) else (args,)
+        if any(a is Ellipsis for a in args):
+            i = next(i for i, a in enumerate(args) if a is Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(args) + 1)
+            args = args[:i] + fill + args[i + 1:]
+        if len(args) > self.ndim:
+            raise IndexError("%d indexing arguments for %d dimensions"
+                             % (len(args), self.ndim))
+        args += (slice(None),) * (self.ndim - len(args))
+
+        start, count, step, scalar = [], [], [], []
+        for a, n in zip(args, self.shape):
+            if isinstance(a, slice):
+                b, e, s = a.indices(n)
+                if s < 1:
+                    raise ValueError("Step must be >= 1 (got %d)" % s)
+                start.append(b)
+                count.append(max(0, -(-(e - b) // s)))
+                step.append(s)
+                scalar.append(False)
+            else:
+                try:
+                    a = operator.index(a)
+                except TypeError:
+                    raise TypeError("Only integers, slices and Ellipsis can be "
+                                    "used with manifest datasets") from None
+                if a < 0:
+                    a += n
+                if not 0 <= a < n:
+                    raise IndexError("Index (%d) out of range for (0-%d)" % (a, n - 1))
+                start.append(a)
+                count.append(1)
+                step.append(1)
+                scalar.append(True)
+        return start, count, step, scalar
+
+    def __getitem__(self, args):
+        start, count, step, scalar = self._parse(args)
+        out = numpy.empty(tuple(count), dtype=self.dtype)
+
+        if out.size == 0:
+            pass
+        elif self.layout == 'compact':
+            out[...] = self._data[tuple(
+                slice(b, b + c * s, s) for b, c, s in zip(start, count, step))]
+        elif self.layout == 'contiguous':
+            self._read_contiguous(start, count, step, out)
+        else:
+            self._read_chunked(start, count, step, out)
+
+        out = out.reshape([c for c, s in zip(count, scalar) if not s])
+        if out.shape == ():
+            return out[()]
+        return out
+
+    def _read_contiguous(self, start, count, step, out):
+        if self._offset is None:
+            out[...] = self.fillvalue  # Never written
+            return
+        if self.ndim == 0:
+            data = self.file._read(self.dtype.itemsize, self._offset)
+            out[()] = numpy.frombuffer(data, dtype=self.dtype)[0]
+            return
+
+        # Read whole rows on the first axis, then select from them
+        rowsize = product(self.shape[1:]) * self.dtype.itemsize
+        inner = tuple(slice(b, b + c * s, s)
+                      for b, c, s in zip(start[1:], count[1:], step[1:]))
+        if step[0] == 1:
+            runs = [(start[0], count[0], slice(None))]
+        else:
+            runs = [(start[0] + i * step[0], 1, slice(i, i + 1)) for i in range(count[0])]
+        for first, nrows, out_sel in runs:
+            data = self.file._read(nrows * rowsize, self._offset + first * rowsize)
+            arr = numpy.frombuffer(data, dtype=self.dtype).reshape((nrows,) + self.shape[1:])
+            out[out_sel] = arr[(slice(None),) + inner]
+
+    def _read_chunked(self, start, count, step, out):
+        chunks = self.chunks
+        chunk_items = product(chunks)
+        chunk_nbytes = chunk_items * self.dtype.itemsize
+        for offset, chunk_sel, out_sel in touched_chunks(start, count, step, chunks):
+            chunk_id = numpy.ravel_multi_index(
+                [o // c for o, c in zip(offset, chunks)], self._grid)
+            i = numpy.searchsorted(self._chunk_ids, chunk_id)
+            if i == len(self._chunk_ids) or self._chunk_ids[i] != chunk_id:
+                out[out_sel] = self.fillvalue  # Never written
+                continue
+            row = self._index[i]
+            data = self._pipeline.decode(
+                self.file._read(int(row['size']), int(row['byte_offset'])),
+                int(row['filter_mask']), chunk_nbytes
+            )
+            arr = numpy.frombuffer(data, dtype=self.dtype, count=chunk_items).reshape(chunks)
+            out[out_sel] = arr[chunk_sel]
@@ -0,0 +1,179 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the asyncio wrappers (h5py.aio).
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py import aio
+from h5py._objects import phil
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 30))
+
+
+def test_file_group_dataset(tmp_path):
+    path = tmp_path / 'test.h5'
+
+    async def main():
+        async with aio.AsyncFile(path, 'w') as f:
+            assert isinstance(f, aio.AsyncFile)
+            grp = await f.create_group('g')
+            assert isinstance(grp, aio.AsyncGroup)
+            ds = await grp.create_dataset('x', shape=(10, 4), dtype='i4')
+            assert isinstance(ds, aio.AsyncDataset)
+            assert ds.shape == (10, 4)
+            assert ds.dtype == np.dtype('i4')
+            assert ds.name == '/g/x'
+
+            await ds.write(np.s_[2:4], np.ones((2, 4)))
+            np.testing.assert_array_equal(await ds.read(np.s_[1:3, 0]), [0, 1])
+
+            await ds.attrs.set('units', 'm')
+            assert await ds.attrs['units'] == 'm'
+            assert await ds.attrs.keys() == ['units']
+            assert await ds.attrs.get('missing', 5) == 5
+            await ds.attrs.delete('units')
+            assert await ds.attrs.items() == []
+
+            assert await f.keys() == ['g']
+            assert await f.contains('g/x')
+            assert isinstance(await f['g/x'], aio.AsyncDataset)
+            assert await f.get('nothing') is None
+            await grp.delete('x')
+            assert not await f.contains('g/x')
+
+        assert not f.sync
+
+    run(main())
+
+
+def test_await_file(tmp_path):
+    path = tmp_path / 'test.h5'
+    with h5py.File(path, 'w') as f:
+        f['x'] = np.arange(10)
+
+    async def main():
+        f = await aio.AsyncFile(path, 'r')
+        try:
+            ds = await f['x']
+            return await ds.read()
+        finally:
+            await f.close()
+
+    np.testing.assert_array_equal(run(main()), np.arange(10))
+
+
+def test_resize(writable_file):
+    ds = writable_file.create_dataset('x', shape=(5,), maxshape=(None,), dtype='f4')
+
+    async def main():
+        ads = await aio.AsyncGroup(writable_file, aio._Runner())['x']
+        await ads.resize((12,))
+        assert ads.shape == (12,)
+        ds.resize((20,))
+        assert ads.shape == (12,)
+        await ads.refresh()
+        assert ads.shape == (20,)
+
+    run(main())
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_iter_chunks(writable_file, prefetch):
+    data = np.arange(100).reshape(10, 10)
+    writable_file.create_dataset('x', data=data, chunks=(3, 5))
+
+    async def main():
+        ds = await aio.AsyncGroup(writable_file, aio._Runner())['x']
+        out = np.zeros_like(data)
+        n = 0
+        async for sel, block in ds.iter_chunks(prefetch=prefetch):
+            out[sel] = block
+            n += 1
+        assert n == 8
+        np.testing.assert_array_equal(out, data)
+
+        # Stopping early is fine
+        async for sel, block in ds.iter_chunks(np.s_[2:8, 0:10]):
+            break
+
+    run(main())
+
+
+def test_loop_not_blocked_by_phil(writable_file):
+    writable_file['x'] = np.arange(10)
+
+    async def main():
+        ds = await aio.AsyncGroup(writable_file, aio._Runner())['x']
+        with phil:
+            # Another thread is using h5py; the read has to wait, but the
+            # event loop doesn't
+            task = asyncio.ensure_future(ds.read())
+            await asyncio.sleep(0.1)
+            assert not task.done()
+        np.testing.assert_array_equal(await task, np.arange(10))
+
+    run(main())
+
+
+def test_backpressure_and_cancel(writable_file):
+    writable_file['x'] = np.arange(10)
+    started = threading.Event()
+    proceed = threading.Event()
+    calls = []
+
+    def blocking(i):
+        calls.append(i)
+        started.set()
+        proceed.wait(10)
+        return i
+
+    async def main():
+        runner = aio._Runner(max_pending=2)
+        t1 = asyncio.ensure_future(runner.run(blocking, 1))
+        t2 = asyncio.ensure_future(runner.run(blocking, 2))
+        t3 = asyncio.ensure_future(runner.run(blocking, 3))
+        await asyncio.sleep(0.1)
+        assert started.is_set()
+
+        # The 3rd call waits for a free slot, without being submitted
+        assert len(calls) <= 2
+        assert runner._sem.locked()
+
+        # Cancelling a running call doesn't free its slot until it finishes
+        t1.cancel()
+        await asyncio.sleep(0.1)
+        assert 3 not in calls
+
+        proceed.set()
+        assert await t2 == 2
+        assert await t3 == 3
+        with pytest.raises(asyncio.CancelledError):
+            await t1
+        assert sorted(calls) == [1, 2, 3]
+
+    run(main())
+
+
+def test_errors_propagate(writable_file):
+    async def main():
+        grp = aio.AsyncGroup(writable_file, aio._Runner())
+        with pytest.raises(KeyError):
+            await grp['missing']
+
+    run(main())
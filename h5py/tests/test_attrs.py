@@ -275,6 +275,42 @@ class TestTrackOrder(BaseAttrs):
         self.assertNotIn('10', group.attrs)
 
 
+class TestBulk(BaseAttrs):
+
+    """
+        Feature: Many attributes can be read & written together
+    """
+
+    def test_read_all(self):
+        grp = self.f.create_group('grp', track_order=True)
+        grp.attrs['b'] = 1
+        grp.attrs['a'] = 'text'
+        grp.attrs['c'] = np.arange(3)
+        grp.attrs['d'] = h5py.Empty('f4')
+        values = grp.attrs.read_all()
+        self.assertEqual(list(values), ['b', 'a', 'c', 'd'])
+        self.assertEqual(values['b'], 1)
+        self.assertEqual(values['a'], 'text')
+        np.testing.assert_array_equal(values['c'], np.arange(3))
+        self.assertEqual(values['d'], h5py.Empty('f4'))
+        self.assertEqual(self.f.attrs.read_all(), {})
+
+    def test_update_many(self):
+        self.f.attrs['a'] = 0
+        self.f.attrs.update_many({'a': 1, 'b': 'two'}, c=[3, 4])
+        self.assertEqual(self.f.attrs['a'], 1)
+        self.assertEqual(self.f.attrs['b'], 'two')
+        np.testing.assert_array_equal(self.f.attrs['c'], [3, 4])
+        self.f.attrs.update_many([('d', 5.0)])
+        self.assertEqual(self.f.attrs['d'], 5.0)
+
+    def test_update_many_invalid(self):
+        """ Nothing is written if a value can't be converted """
+        with self.assertRaises(TypeError):
+            self.f.attrs.update_many({'x': 1, 'y': object()})
+        self.assertNotIn('x', self.f.attrs)
+
+
 class TestDatatype(BaseAttrs):
 
     def test_datatype(self):
@@ -18,7 +18,10 @@ from h5py._hl.base import is_hdf5, Empty
 from .common import ut, TestCase, UNICODE_FILENAMES
 
 import numpy as np
+import pytest
 import os
+import subprocess
+import sys
 import tempfile
 
 class BaseTest(TestCase):
@@ -144,3 +147,25 @@ def test_is_hdf5():
     # non-existing HDF5 file
     filename = tempfile.mktemp()
     assert not is_hdf5(filename)
+
+
+def test_lazy_imports():
+    # Run in a fresh interpreter: the test suite imports all of these
+    code = """if 1:
+        import sys
+        import h5py
+        loaded = [m for m in ['h5py.h5ds', 'h5py.h5pl', 'subprocess', 'logging',
+                              'concurrent.futures'] if m in sys.modules]
+        assert not loaded, loaded
+        assert 'h5ds' in dir(h5py)
+        assert h5py.h5ds.is_scale is not None
+        assert 'h5py.h5ds' in sys.modules
+        """
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+
+def test_lazy_import_missing():
+    import h5py
+    with pytest.raises(AttributeError):
+        h5py.not_a_module
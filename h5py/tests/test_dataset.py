@@ -33,6 +33,7 @@ from h5py.h5py_warnings import H5pyDeprecationWarning
 from h5py import version
 import h5py
 import h5py._hl.selections as sel
+from h5py._hl import chunkstats
 from h5py.tests.common import NUMPY_RELEASE_VERSION
 
 class BaseDataset(TestCase):
@@ -323,6 +324,394 @@ class TestWriteDirectly:
             dset.write_direct(arr)
 
 
+class TestAsMemmap:
+
+    """
+        Feature: Map a contiguous dataset's data in the file into memory
+    """
+
+    @pytest.mark.parametrize('dtype', ['<i4', '>f8', 'S5', [('a', 'u1'), ('b', '<f4')]])
+    def test_read(self, tmp_path, dtype):
+        path = tmp_path / 'test.h5'
+        data = np.arange(24).reshape(4, 6).astype(dtype)
+        with h5py.File(path, 'w', userblock_size=512) as f:
+            f['x'] = data
+        with h5py.File(path, 'r') as f:
+            arr = f['x'].as_memmap()
+            assert isinstance(arr, np.memmap)
+            assert arr.dtype == f['x'].dtype
+            np.testing.assert_array_equal(arr, data)
+            with pytest.raises(ValueError):
+                arr[0, 0] = 1  # read-only
+
+    def test_scalar(self, writable_file):
+        dset = writable_file.create_dataset('x', data=42.5)
+        assert dset.as_memmap()[()] == 42.5
+
+    def test_write(self, tmp_path):
+        path = tmp_path / 'test.h5'
+        with h5py.File(path, 'w') as f:
+            dset = f.create_dataset('x', data=np.zeros(10, dtype='i8'))
+            arr = dset.as_memmap('r+')
+            arr[3:5] = 7
+            arr.flush()
+            del arr
+        with h5py.File(path, 'r') as f:
+            np.testing.assert_array_equal(f['x'][:5], [0, 0, 0, 7, 7])
+            with pytest.raises(ValueError):
+                f['x'].as_memmap('r+')
+            # Copy-on-write doesn't change the file
+            arr = f['x'].as_memmap('c')
+            arr[:] = 1
+            assert f['x'][0] == 0
+
+    def test_flushes_pending_writes(self, writable_file):
+        dset = writable_file.create_dataset('x', shape=(10,), dtype='i8')
+        dset[:] = np.arange(10)
+        np.testing.assert_array_equal(dset.as_memmap(), np.arange(10))
+
+    @pytest.mark.parametrize('kwargs', [
+        dict(shape=(10,), dtype='i4', chunks=(5,)),
+        dict(shape=(10,), dtype='i4', compression='gzip'),
+        dict(shape=(10,), dtype=h5py.string_dtype()),
+        dict(shape=(10,), dtype='i4'),  # Storage not allocated yet
+        dict(shape=None, dtype='i4'),
+    ])
+    def test_unsupported(self, writable_file, kwargs):
+        dset = writable_file.create_dataset('x', **kwargs)
+        with pytest.raises(TypeError):
+            dset.as_memmap()
+
+    def test_compact(self, writable_file):
+        dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+        dcpl.set_layout(h5py.h5d.COMPACT)
+        space = h5py.h5s.create_simple((10,))
+        h5py.h5d.create(writable_file.id, b'x', h5py.h5t.STD_I32LE, space, dcpl=dcpl)
+        with pytest.raises(TypeError):
+            writable_file['x'].as_memmap()
+
+    def test_core_driver(self):
+        with h5py.File('in-memory.h5', 'w', driver='core', backing_store=False) as f:
+            dset = f.create_dataset('x', data=np.arange(10))
+            with pytest.raises(TypeError):
+                dset.as_memmap()
+
+    def test_bad_mode(self, writable_file):
+        dset = writable_file.create_dataset('x', data=np.arange(10))
+        with pytest.raises(ValueError):
+            dset.as_memmap('w+')
+
+
+class TestReadMany:
+
+    """
+        Feature: Read a list of selections at once
+    """
+
+    @pytest.mark.parametrize('selections', [
+        # Dense & sparse, overlapping & not
+        [np.s_[i * 10:(i + 1) * 10] for i in range(30)],
+        [np.s_[i * 30:i * 30 + 10] for i in range(10)],
+        [np.s_[50:60], np.s_[5:15], np.s_[55:58], np.s_[0:100], np.s_[99]],
+        [np.s_[3, 2], np.s_[4, 2:5], np.s_[5:9:2, 2:5], np.s_[7, 2:5]],
+        [np.s_[3, 1], np.s_[40:43, ::3], np.s_[2, 4], np.s_[..., 0], np.s_[1:1]],
+        [np.s_[[1, 5, 9], 0], np.s_[4:2], np.s_[()], np.s_[-1, -1]],
+        [np.s_[h5py.MultiBlockSlice(3, 10, 4, 2)], np.s_[1:3, 1:2]],
+    ])
+    @pytest.mark.parametrize('readonly', [False, True])
+    def test_matches_getitem(self, tmp_path, selections, readonly):
+        path = tmp_path / 'test.h5'
+        data = np.arange(100 * 6, dtype='>i4').reshape(100, 6)
+        with h5py.File(path, 'w') as f:
+            f['x'] = data
+        with h5py.File(path, 'r' if readonly else 'a') as f:
+            dset = f['x']
+            res = dset.read_many(selections)
+            assert len(res) == len(selections)
+            for r, s in zip(res, selections):
+                expected = dset[s]
+                assert type(r) is type(expected)
+                assert r.dtype == expected.dtype
+                np.testing.assert_array_equal(r, expected)
+
+    def test_1d(self, writable_file):
+        dset = writable_file.create_dataset('x', data=np.arange(50.))
+        sels = [np.s_[i:i + 3] for i in range(0, 45, 4)]
+        sels += [np.s_[7], np.s_[np.array([True] * 25 + [False] * 25)]]
+        for r, s in zip(dset.read_many(sels), sels):
+            np.testing.assert_array_equal(r, dset[s])
+
+    def test_other_dtypes(self, writable_file):
+        dset = writable_file.create_dataset('x', data=[b'a', b'bc', b'def'])
+        a, b = dset.read_many([np.s_[1:], 0])
+        np.testing.assert_array_equal(a, [b'bc', b'def'])
+        assert b == b'a'
+
+    def test_shared_buffer(self, writable_file):
+        dset = writable_file.create_dataset('x', data=np.arange(1000))
+        dense = dset.read_many([np.s_[i:i + 5] for i in range(0, 100, 6)])
+        sparse = dset.read_many([np.s_[i:i + 5] for i in range(0, 1000, 100)])
+        for res in dense, sparse:
+            base = res[0].base
+            assert base is not None
+            assert all(r.base is base for r in res)
+
+    def test_errors(self, writable_file):
+        dset = writable_file.create_dataset('x', data=np.arange(10))
+        with pytest.raises(IndexError):
+            dset.read_many([np.s_[2:3], np.s_[10]])
+        assert dset.read_many([]) == []
+
+
+class TestAppender:
+
+    """
+        Feature: Append rows to a resizable dataset in whole chunks
+    """
+
+    def test_append(self, writable_file, monkeypatch):
+        dset = writable_file.create_dataset('x', shape=(0, 3), maxshape=(None, 3),
+                                            chunks=(4, 3), dtype='i4')
+        expected = np.arange(3 * 50).reshape(50, 3)
+
+        # Record the rows written
+        writes = []
+        orig = Dataset.__setitem__
+
+        def setitem(ds, args, val):
+            writes.append(args)
+            orig(ds, args, val)
+
+        monkeypatch.setattr(Dataset, '__setitem__', setitem)
+
+        with dset.appender(buffer_rows=6) as app:
+            app.append(expected[0])
+            app.append([expected[1]])
+            app.append(expected[2:5])
+            app.append(expected[5:30])
+            for row in expected[30:]:
+                app.append(row)
+            assert len(app) == 50
+            assert dset.shape[0] >= 48
+
+        assert dset.shape == (50, 3)
+        np.testing.assert_array_equal(dset[()], expected)
+        # Everything but the end is written in whole chunks
+        assert all(s.start % 4 == 0 and s.stop % 4 == 0 for s in writes[:-1])
+        assert writes[-1].stop == 50
+        assert len(writes) < 10
+
+    def test_extend_existing(self, writable_file):
+        dset = writable_file.create_dataset('x', data=np.arange(5.), maxshape=(None,),
+                                            chunks=(4,))
+        with dset.appender() as app:
+            app.append(np.arange(5., 12.))
+            app.flush()
+            assert dset.shape == (12,)
+            app.append(12)
+        np.testing.assert_array_equal(dset[()], np.arange(13.))
+
+        with pytest.raises(ValueError):
+            app.append(1)
+
+    def test_maxshape(self, writable_file):
+        dset = writable_file.create_dataset('x', shape=(0,), maxshape=(10,),
+                                            chunks=(4,), dtype='f4')
+        with dset.appender(buffer_rows=8) as app:
+            app.append(np.ones(6))
+            with pytest.raises(ValueError):
+                app.append(np.ones(5))
+            app.append(np.ones(4))
+        assert dset.shape == (10,)
+
+    def test_errors(self, writable_file):
+        dset = writable_file.create_dataset('x', shape=(0, 2), maxshape=(None, 2),
+                                            chunks=(4, 2), dtype='f4')
+        with pytest.raises(ValueError):
+            dset.appender(buffer_rows=0)
+        with dset.appender() as app:
+            with pytest.raises(TypeError):
+                app.append(np.ones(3))
+        contiguous = writable_file.create_dataset('y', shape=(3,), dtype='f4')
+        with pytest.raises(TypeError):
+            contiguous.appender()
+
+
+class TestReductions:
+
+    """
+        Feature: Reductions read in blocks match NumPy
+    """
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        # Many blocks, so that partial results are combined
+        monkeypatch.setattr(h5py._hl.reductions, 'BLOCK_BYTES', 64)
+
+    @pytest.mark.parametrize('dtype', ['i2', 'u1', 'f2', 'f4', 'f8', 'c16', '?'])
+    @pytest.mark.parametrize('chunks', [None, (3, 4, 2)])
+    def test_match_numpy(self, writable_file, dtype, chunks):
+        rng = np.random.default_rng(0)
+        data = (rng.random((7, 9, 5)) * 10).astype(dtype)
+        dset = writable_file.create_dataset('x', data=data, chunks=chunks)
+        rtol = 1e-2 if dtype == 'f2' else 1e-5
+
+        for axis in [None, 0, -1, (0, 2)]:
+            for name in ['sum', 'min', 'max', 'mean']:
+                res = getattr(dset, name)(axis=axis, max_workers=2)
+                expected = getattr(np, name)(data, axis=axis)
+                assert np.asarray(res).dtype == expected.dtype
+                np.testing.assert_allclose(res, expected, rtol=rtol)
+
+            stats = dset.stats(axis=axis)
+            assert np.all(stats.count == data.size // np.mean(data, axis=axis).size)
+            np.testing.assert_array_equal(stats.min, np.min(data, axis=axis))
+            np.testing.assert_array_equal(stats.max, np.max(data, axis=axis))
+            np.testing.assert_allclose(stats.mean, np.mean(data, axis=axis), rtol=rtol)
+            np.testing.assert_allclose(stats.std, np.std(data, axis=axis), rtol=rtol)
+            assert np.asarray(stats.std).dtype == np.std(data, axis=axis).dtype
+
+    def test_numpy_functions(self, writable_file):
+        data = np.arange(60, dtype='i4').reshape(6, 10)
+        dset = writable_file.create_dataset('x', data=data, chunks=(4, 4))
+        assert np.sum(dset) == data.sum()
+        np.testing.assert_array_equal(np.max(dset, axis=1), data.max(axis=1))
+        assert np.mean(dset, dtype='f4').dtype == np.dtype('f4')
+        assert dset.sum(keepdims=True).shape == (1, 1)
+        out = np.zeros(10, dtype='i8')
+        assert dset.sum(axis=0, out=out) is out
+        np.testing.assert_array_equal(out, data.sum(axis=0))
+        assert dset.reduce(np.logical_or, axis=0).dtype == np.bool_
+
+    def test_nan(self, writable_file):
+        data = np.arange(20.).reshape(4, 5)
+        data[1, 2] = np.nan
+        dset = writable_file.create_dataset('x', data=data, chunks=(2, 2))
+        assert np.isnan(dset.sum())
+        np.testing.assert_array_equal(dset.min(axis=0), data.min(axis=0))
+        np.testing.assert_array_equal(dset.stats(axis=1).mean, data.mean(axis=1))
+        with pytest.raises(ValueError):
+            dset.histogram()
+        np.testing.assert_array_equal(dset.histogram(4, range=(0, 20))[0],
+                                      np.histogram(data, 4, range=(0, 20))[0])
+
+    @pytest.mark.parametrize('bins', [10, 3, [0, 5, 7.5, 100]])
+    def test_histogram(self, writable_file, bins):
+        data = np.random.default_rng(0).normal(size=(40, 30))
+        dset = writable_file.create_dataset('x', data=data, chunks=(7, 5))
+        for density in [False, True]:
+            hist, edges = dset.histogram(bins, density=density)
+            exp_hist, exp_edges = np.histogram(data, bins, density=density)
+            np.testing.assert_array_equal(edges, exp_edges)
+            np.testing.assert_allclose(hist, exp_hist)
+        with pytest.raises(TypeError):
+            dset.histogram('auto')
+
+    def test_empty(self, writable_file):
+        dset = writable_file.create_dataset('x', shape=(0, 3), dtype='f4')
+        assert dset.sum() == 0
+        np.testing.assert_array_equal(dset.sum(axis=0), np.zeros(3))
+        with pytest.raises(ValueError):
+            dset.min()
+        with pytest.raises(ValueError):
+            dset.stats()
+        null = writable_file.create_dataset('y', data=h5py.Empty('f4'))
+        with pytest.raises(TypeError):
+            null.sum()
+
+
+class TestChunkStats:
+
+    """
+        Feature: Per-chunk statistics let Dataset.where skip chunks
+    """
+
+    def test_where(self, writable_file, monkeypatch):
+        data = np.arange(100.)
+        data[[5, 95]] = np.nan
+        dset = writable_file.create_dataset('x', data=data, chunks=(10,))
+        assert dset.chunk_stats() is None
+        expected = np.nonzero((data >= 42) & (data < 57))
+
+        np.testing.assert_array_equal(dset.where(42, 57), expected)
+        dset.build_chunk_stats()
+        stats = dset.chunk_stats()
+        assert stats.shape == (10, 2)
+        np.testing.assert_array_equal(stats[0], [0, 9])  # NaN is ignored
+
+        # Only chunks 4 and 5 are read
+        reads = []
+        orig = Dataset.read_many
+
+        def read_many(ds, sels):
+            reads.extend(sels)
+            return orig(ds, sels)
+
+        monkeypatch.setattr(Dataset, 'read_many', read_many)
+        np.testing.assert_array_equal(dset.where(42, 57), expected)
+        assert [s[0].start for s in reads] == [40, 50]
+        np.testing.assert_array_equal(dset.where(hi=3), ([0, 1, 2],))
+        np.testing.assert_array_equal(dset.where(lo=97), ([97, 98, 99],))
+
+    def test_kept_up_to_date(self, writable_file):
+        dset = writable_file.create_dataset('x', shape=(20, 10), dtype='i4',
+                                            chunks=(4, 4), maxshape=(None, 10),
+                                            fillvalue=-1)
+        dset.build_chunk_stats()
+        np.testing.assert_array_equal(dset.chunk_stats(), -1)
+
+        dset[5, 5] = 100
+        dset.write_direct(np.full((2, 2), 200, dtype='i4'), dest_sel=np.s_[0:2, 8:10])
+        dset.write_parallel(np.full((4, 4), 300, dtype='i4'), np.s_[12:16, 0:4])
+        np.testing.assert_array_equal(dset.chunk_stats()[1, 1], [-1, 100])
+        np.testing.assert_array_equal(dset.chunk_stats()[0, 2], [-1, 200])
+        np.testing.assert_array_equal(dset.chunk_stats()[3, 0], [300, 300])
+
+        # Overwriting narrows the range again
+        dset[5, 5] = 0
+        np.testing.assert_array_equal(dset.chunk_stats()[1, 1], [-1, 0])
+
+        dset.resize((30, 10))
+        assert dset.chunk_stats().shape == (8, 3, 2)
+        dset[25:30] = 7
+        np.testing.assert_array_equal(dset.where(7, 8)[0], np.repeat(np.arange(25, 30), 10))
+
+    def test_drop(self, writable_file):
+        dset = writable_file.create_dataset('x', data=np.arange(10), chunks=(3,))
+        dset.build_chunk_stats()
+        assert len(writable_file) == 2
+        dset.drop_chunk_stats()
+        assert dset.chunk_stats() is None
+        assert list(writable_file) == ['x']
+        dset[0] = 5  # No statistics to update
+
+    def test_not_updated_without_stats(self, writable_file, monkeypatch):
+        monkeypatch.setattr(chunkstats, 'written', lambda ds, s: pytest.fail("No statistics"))
+        dset = writable_file.create_dataset('x', data=np.arange(10), chunks=(3,))
+        dset[0] = 5
+        strings = writable_file.create_dataset('y', data=[b'a', b'b'], chunks=(1,))
+        strings[0] = b'c'
+
+    def test_built_through_other_object(self, writable_file):
+        d1 = writable_file.create_dataset('x', data=np.arange(100.), chunks=(10,))
+        d1[0:5] = 1
+        writable_file['x'].build_chunk_stats()
+        d1[20:30] = 500
+        np.testing.assert_array_equal(writable_file['x'].where(499, 501),
+                                      (np.arange(20, 30),))
+        writable_file['x'].drop_chunk_stats()
+        d1[40] = 7  # No statistics to update
+
+    def test_unsupported(self, writable_file):
+        contiguous = writable_file.create_dataset('x', data=np.arange(10))
+        with pytest.raises(TypeError):
+            contiguous.build_chunk_stats()
+        np.testing.assert_array_equal(contiguous.where(3, 5), ([3, 4],))
+        strings = writable_file.create_dataset('y', data=[b'a', b'b'], chunks=(1,))
+        with pytest.raises(TypeError):
+            strings.build_chunk_stats()
+
+
 class TestCreateRequire(BaseDataset):
 
     """
@@ -1097,6 +1486,33 @@ class TestChunkIterator(BaseDataset):
         sel = slice(3,5)
         self.assertEqual(list(dset.iter_chunks((sel, sel))), list(expected))
 
+    def test_data(self):
+        data = np.arange(100 * 100, dtype='f4').reshape(100, 100)
+        for kwargs in [{}, {'compression': 'gzip'}]:
+            dset = self.f.create_dataset("foo", data=data, chunks=(32, 64), **kwargs)
+            region = np.s_[10:90, 30:100]
+            expected = list(dset.iter_chunks(region))
+            for opts in [dict(workers=2), dict(prefetch=0), dict(prefetch=3, workers=1)]:
+                result = list(dset.iter_chunks(region, **opts))
+                self.assertEqual([s for s, _ in result], expected)
+                for s, arr in result:
+                    self.assertArrayEqual(arr, data[s])
+
+            result = list(dset.iter_chunks(workers=3, ordered=False))
+            self.assertEqual(sorted(s for s, _ in result), sorted(dset.iter_chunks()))
+            for s, arr in result:
+                self.assertArrayEqual(arr, data[s])
+            del self.f["foo"]
+
+    def test_data_stop_early(self):
+        dset = self.f.create_dataset("foo", data=np.arange(1000), chunks=(10,))
+        it = dset.iter_chunks(workers=2, prefetch=4)
+        s, arr = next(it)
+        self.assertArrayEqual(arr, np.arange(10))
+        it.close()
+        with self.assertRaises(ValueError):
+            list(dset.iter_chunks(prefetch=-1))
+
 
 
 class TestResize(BaseDataset):
@@ -1888,6 +2304,122 @@ class TestVlen(BaseDataset):
             np.array(ds.asstr(), dtype=int)
 
 
+class TestRagged:
+
+    """
+        Feature: Variable-length data can be read & written as flat values
+        and offsets
+    """
+
+    def test_roundtrip(self, writable_file):
+        rng = np.random.default_rng(0)
+        offsets = np.concatenate([[0], np.cumsum(rng.integers(0, 5, 50))])
+        values = rng.random(offsets[-1]).astype('f4')
+        dset = writable_file.create_dataset(
+            'x', (50,), dtype=h5py.vlen_dtype('f4'), chunks=(8,))
+        dset.write_ragged(values, offsets)
+        for i in (0, 17, 49):
+            np.testing.assert_array_equal(dset[i], values[offsets[i]:offsets[i + 1]])
+
+        v, o = dset.read_ragged()
+        assert o.dtype == np.int64
+        np.testing.assert_array_equal(v, values)
+        np.testing.assert_array_equal(o, offsets)
+
+        v, o = dset.read_ragged(np.s_[10:20])
+        np.testing.assert_array_equal(o, offsets[10:21] - offsets[10])
+        np.testing.assert_array_equal(v, values[offsets[10]:offsets[20]])
+
+    def test_selection(self, writable_file):
+        dset = writable_file.create_dataset('x', (2, 3), dtype=h5py.vlen_dtype('i8'))
+        dset.write_ragged([5, 6, 7], [1, 1, 3], np.s_[1, 1:])
+        dset[0, 1] = [1, 2]
+        v, o = dset.read_ragged()
+        np.testing.assert_array_equal(v, [1, 2, 6, 7])
+        np.testing.assert_array_equal(o, [0, 0, 2, 2, 2, 2, 4])
+        v, o = dset.read_ragged(np.s_[0, :0])
+        assert v.shape == (0,)
+        np.testing.assert_array_equal(o, [0])
+
+    def test_invalid(self, writable_file):
+        dset = writable_file.create_dataset('x', (2,), dtype=h5py.vlen_dtype('i4'))
+        with pytest.raises(ValueError):
+            dset.write_ragged([1, 2], [0, 1])  # Too few offsets
+        with pytest.raises(ValueError):
+            dset.write_ragged([1, 2], [0, 2, 1])  # Decreasing
+        with pytest.raises(ValueError):
+            dset.write_ragged([1, 2], [0, 1, 3])  # Past the values
+        strings = writable_file.create_dataset('s', (2,), dtype=h5py.string_dtype())
+        with pytest.raises(TypeError):
+            strings.write_ragged([1, 2], [0, 1, 2])
+        with pytest.raises(TypeError):
+            writable_file.create_dataset('y', data=[1, 2]).read_ragged()
+
+    def test_strings(self, writable_file):
+        dset = writable_file.create_dataset(
+            's', data=['a', 'fàilte', '', 'xyz'], dtype=h5py.string_dtype())
+        v, o = dset.read_ragged()
+        assert v.dtype == np.uint8
+        assert v.tobytes() == 'afàiltexyz'.encode('utf-8')
+        np.testing.assert_array_equal(o, [0, 1, 8, 8, 11])
+        v, o = dset.read_ragged(np.s_[2:])
+        assert v.tobytes() == b'xyz'
+        np.testing.assert_array_equal(o, [0, 0, 3])
+
+
+class TestVlenStringsBulk:
+
+    """
+        Feature: Variable-length strings are read in bulk by asstr() and
+        astype() with fixed-width string dtypes
+    """
+
+    data = np.array([['a', 'fàilte', ''], ['xyz€', 'b', 'cd']], dtype=object)
+
+    @pytest.fixture
+    def dset(self, writable_file):
+        return writable_file.create_dataset(
+            's', data=self.data, dtype=h5py.string_dtype())
+
+    def test_asstr(self, dset):
+        out = dset.asstr()[()]
+        assert out.dtype == object
+        np.testing.assert_array_equal(out, self.data)
+        np.testing.assert_array_equal(dset.asstr()[:, 1], self.data[:, 1])
+        np.testing.assert_array_equal(dset.asstr()[1, [2, 0]], ['cd', 'xyz€'])
+        assert dset.asstr()[0, 1] == 'fàilte'
+        assert dset.asstr()[:0].shape == (0, 3)
+        assert dset.asstr('ascii', 'replace')[0, 1] == 'f\ufffd\ufffdilte'
+        with pytest.raises(UnicodeDecodeError):
+            dset.asstr('ascii')[()]
+
+    def test_astype_bytes(self, dset):
+        out = dset.astype('S')[()]
+        assert out.dtype == np.dtype('S7')
+        np.testing.assert_array_equal(out, np.char.encode(self.data.astype('U')))
+        np.testing.assert_array_equal(dset.astype('S')[1], [b'xyz\xe2\x82\xac', b'b', b'cd'])
+        assert dset.astype('S')[0, 0] == b'a'
+
+    def test_astype_unicode(self, dset):
+        out = dset.astype('U')[()]
+        assert out.dtype == np.dtype('U6')
+        np.testing.assert_array_equal(out, self.data.astype('U'))
+        out = dset.astype('U3')[0]
+        np.testing.assert_array_equal(out, ['a', 'fài', ''])
+        assert dset.astype('U')[1, 0] == 'xyz€'
+        assert np.asarray(dset.astype('U')).shape == (2, 3)
+
+    def test_astype_invalid_utf8(self, writable_file):
+        # One character split across two strings
+        dset = writable_file.create_dataset(
+            's', data=np.array([b'a\xc3', b'\xa9b'], dtype=object),
+            dtype=h5py.string_dtype())
+        with pytest.raises(UnicodeDecodeError):
+            dset.astype('U')[()]
+        with pytest.raises(UnicodeDecodeError):
+            dset.asstr()[()]
+
+
 class TestLowOpen(BaseDataset):
 
     def test_get_access_list(self):
@@ -1964,6 +2496,49 @@ def test_chunk_iter():
         dsid.chunk_iter(callback)
 
 
+def test_get_chunk_index(writable_file):
+    ds = writable_file.create_dataset('x', shape=(100, 100), chunks=(10, 30),
+                                      dtype='i4', compression='gzip')
+    ds[35:55, 70:] = 1
+    ds[95:, :5] = 2
+    index = ds.id.get_chunk_index()
+
+    assert index.dtype.names == ('chunk_offset', 'filter_mask', 'byte_offset', 'size')
+    assert len(index) == ds.id.get_num_chunks() == 7
+    offsets = [tuple(int(i) for i in o) for o in index['chunk_offset']]
+    assert offsets == sorted(offsets)
+    for row, offset in zip(index, offsets):
+        si = ds.id.get_chunk_info_by_coord(offset)
+        assert row['filter_mask'] == si.filter_mask
+        assert row['byte_offset'] == si.byte_offset
+        assert row['size'] == si.size
+
+    empty = writable_file.create_dataset('y', shape=(10,), chunks=(5,), dtype='i4')
+    assert empty.id.get_chunk_index().shape == (0,)
+
+
+def test_chunk_index_cached(writable_file):
+    ds = writable_file.create_dataset('x', shape=(20,), maxshape=(None,),
+                                      chunks=(5,), dtype='i4')
+    ds[:7] = 1
+    index = ds.chunk_index()
+    assert ds.chunk_index() is index
+    assert not index.flags.writeable
+    np.testing.assert_array_equal(index['chunk_offset'][:, 0], [0, 5])
+
+    ds[12] = 1
+    index = ds.chunk_index()
+    np.testing.assert_array_equal(index['chunk_offset'][:, 0], [0, 5, 10])
+
+    ds.resize((8,))
+    assert ds.chunk_index() is not index
+    assert len(ds.chunk_index()) == 2
+
+    contiguous = writable_file.create_dataset('y', shape=(10,), dtype='i4')
+    with pytest.raises(TypeError):
+        contiguous.chunk_index()
+
+
 def test_empty_shape(writable_file):
     ds = writable_file.create_dataset('empty', dtype='int32')
     assert ds.shape is None
@@ -469,21 +469,30 @@ class Test1DFloat(TestCase):
             self.dset[[100]]
 
     def test_indexlist_nonmonotonic(self):
-        """ we require index list values to be strictly increasing """
-        with self.assertRaises(TypeError):
-            self.dset[[1,3,2]]
+        """ index lists out of order are read and rearranged """
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[[1,3,2]],
+                                 skip_fast_reader=True)
 
     def test_indexlist_monotonic_negative(self):
-        # This should work: indices are logically increasing
         self.assertNumpyBehavior(self.dset, self.data,  np.s_[[0, 2, -2]])
-
-        with self.assertRaises(TypeError):
-            self.dset[[-2, -3]]
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[[-2, -3]],
+                                 skip_fast_reader=True)
 
     def test_indexlist_repeated(self):
-        """ we forbid repeated index values """
+        """ repeated index values are read once and repeated """
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[[1,1,2]],
+                                 skip_fast_reader=True)
+        self.assertNumpyBehavior(self.dset, self.data, np.s_[[5,1,-9,1,0]],
+                                 skip_fast_reader=True)
+
+    def test_indexlist_unordered_outofrange(self):
+        with self.assertRaises(IndexError):
+            self.dset[[3, 100]]
+
+    def test_indexlist_unordered_write(self):
+        """ writing still requires increasing indices """
         with self.assertRaises(TypeError):
-            self.dset[[1,1,2]]
+            self.dset[[1,3,2]] = 0
 
     def test_mask_true(self):
         self.assertNumpyBehavior(
@@ -574,6 +583,25 @@ class Test2DFloat(TestCase):
         self.assertNumpyBehavior(self.dset, self.data, np.s_[:, []])
         self.assertNumpyBehavior(self.dset, self.data, np.s_[[]])
 
+    def test_indexlist_unordered(self):
+        """ index lists in any order, along any axis, with other args """
+        data = np.arange(60).reshape(5, 3, 4)
+        dset = self.f.create_dataset('y', data=data, chunks=(2, 1, 4),
+                                     compression='gzip')
+        for args in [np.s_[:, [2, 0, 2]], np.s_[1:4, ..., [3, 0]],
+                     np.s_[[4, 0, 4], 1:], np.s_[..., 2, [-1, 1]]]:
+            np.testing.assert_array_equal(dset[args], data[args])
+        np.testing.assert_array_equal(
+            dset.astype('f4')[:, [1, 0]], data[:, [1, 0]].astype('f4'))
+
+    def test_indexlist_unordered_fields(self):
+        dt = np.dtype([('a', 'i4'), ('b', 'f8')])
+        data = np.zeros((6, 2), dtype=dt)
+        data['a'] = np.arange(12).reshape(6, 2)
+        dset = self.f.create_dataset('y', data=data)
+        np.testing.assert_array_equal(dset[[5, 0, 3], 'a'], data['a'][[5, 0, 3]])
+        np.testing.assert_array_equal(dset[[5, 0, 5]], data[[5, 0, 5]])
+
 
 class TestVeryLargeArray(TestCase):
 
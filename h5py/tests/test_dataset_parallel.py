@@ -0,0 +1,237 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for reading & writing chunked datasets with the filters applied
+    in Python threads (h5py._hl.chunks).
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py._hl.chunks import chunk_slices
+
+
+FILTERS = [
+    dict(),
+    dict(compression='gzip'),
+    dict(compression='gzip', shuffle=True, fletcher32=True),
+    dict(compression='lzf'),
+    dict(shuffle=True, fletcher32=True),
+]
+
+SELECTIONS = [
+    np.s_[...],
+    np.s_[3:47:3],
+    np.s_[5, 7:29],
+    np.s_[-1, -1],
+    np.s_[::7, ::-1][0],
+    np.s_[10:10],
+]
+
+
+@pytest.mark.parametrize('start, count, step, chunk', [
+    (0, 10, 1, 3), (2, 5, 4, 3), (7, 3, 10, 4), (5, 0, 1, 2), (0, 1, 1, 1),
+])
+def test_chunk_slices(start, count, step, chunk):
+    points = np.arange(start, start + count * step, step)
+    seen = []
+    for c0, chunk_sel, out_sel in chunk_slices(start, count, step, chunk):
+        in_chunk = np.arange(c0, c0 + chunk)[chunk_sel]
+        np.testing.assert_array_equal(in_chunk, points[out_sel])
+        seen.extend(range(count)[out_sel])
+    assert seen == list(range(count))
+
+
+@pytest.mark.parametrize('kwargs', FILTERS)
+@pytest.mark.parametrize('source_sel', SELECTIONS)
+def test_read_parallel(writable_file, kwargs, source_sel):
+    data = np.arange(50 * 30, dtype='f8').reshape(50, 30) % 13
+    ds = writable_file.create_dataset('x', data=data, chunks=(8, 7), **kwargs)
+    assert ds._direct_chunk_ok
+
+    res = ds.read_parallel(source_sel, max_workers=3)
+    expected = ds[source_sel]
+    assert res.shape == expected.shape
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_read_parallel_scalar_result(writable_file):
+    ds = writable_file.create_dataset('x', data=np.arange(100, dtype='>i2'),
+                                      chunks=(10,), compression='gzip')
+    res = ds.read_parallel(np.s_[42])
+    assert res == 42
+    assert isinstance(res, np.integer)
+
+
+def test_read_parallel_missing_chunks(writable_file):
+    ds = writable_file.create_dataset('x', shape=(40, 40), dtype='i4',
+                                      chunks=(10, 10), fillvalue=-3,
+                                      compression='gzip')
+    ds[12:18, 25:] = 1
+    np.testing.assert_array_equal(ds.read_parallel(), ds[()])
+
+
+def test_read_parallel_fallback(writable_file):
+    # Filters & types which can't be done in Python are read as normal
+    ds = writable_file.create_dataset('scaleoffset', data=np.arange(100),
+                                      chunks=(10,), scaleoffset=0)
+    assert not ds._direct_chunk_ok
+    np.testing.assert_array_equal(ds.read_parallel(np.s_[5:50]), np.arange(5, 50))
+
+    ds = writable_file.create_dataset('contiguous', data=np.arange(100))
+    assert not ds._direct_chunk_ok
+    np.testing.assert_array_equal(ds.read_parallel(), np.arange(100))
+
+    ds = writable_file.create_dataset('chunked', data=np.arange(100),
+                                      chunks=(10,))
+    np.testing.assert_array_equal(ds.read_parallel(np.s_[[1, 5, 90]]), [1, 5, 90])
+    mbs = h5py.MultiBlockSlice(start=0, stride=10, count=3, block=2)
+    np.testing.assert_array_equal(ds.read_parallel(np.s_[mbs]), ds[mbs])
+
+
+def test_read_parallel_checksum_error(writable_file):
+    ds = writable_file.create_dataset('x', data=np.arange(100), chunks=(10,),
+                                      fletcher32=True)
+    filter_mask, raw = ds.id.read_direct_chunk((30,))
+    raw = bytearray(raw)
+    raw[3] ^= 0xff
+    ds.id.write_direct_chunk((30,), bytes(raw), filter_mask)
+
+    with pytest.raises(OSError, match='fletcher32'):
+        ds.read_parallel(max_workers=2)
+
+
+def test_read_parallel_bad_workers(writable_file):
+    ds = writable_file.create_dataset('x', data=np.arange(100), chunks=(10,))
+    with pytest.raises(ValueError):
+        ds.read_parallel(max_workers=0)
+
+
+def test_read_parallel_skipped_filter(writable_file):
+    # An LZF chunk stored uncompressed, with the filter marked as skipped
+    data = np.random.default_rng(0).integers(0, 256, 128, dtype='u1')
+    ds = writable_file.create_dataset('x', shape=(128,), dtype='u1',
+                                      chunks=(64,), compression='lzf')
+    ds[64:] = data[64:]
+    ds.id.write_direct_chunk((0,), data[:64].tobytes(), filter_mask=1)
+    np.testing.assert_array_equal(ds.read_parallel(max_workers=2), data)
+
+
+@pytest.mark.parametrize('kwargs', FILTERS)
+@pytest.mark.parametrize('dest_sel', [
+    np.s_[...],
+    np.s_[8:40, 14:28],
+    np.s_[3:45, 2:29],
+    np.s_[17, :],
+    np.s_[10:10],
+])
+def test_write_parallel(writable_file, kwargs, dest_sel):
+    data = np.arange(50 * 30, dtype='f8').reshape(50, 30) % 13
+    ds = writable_file.create_dataset('x', shape=data.shape, dtype='f8',
+                                      chunks=(8, 7), fillvalue=-1, **kwargs)
+    ds.write_parallel(data[dest_sel], dest_sel, max_workers=3)
+
+    expected = np.full(data.shape, -1.)
+    expected[dest_sel] = data[dest_sel]
+    np.testing.assert_array_equal(ds[()], expected)
+
+
+def test_write_parallel_chunks_written_directly(writable_file):
+    data = np.arange(64 * 64, dtype='<i4').reshape(64, 64)
+    ds = writable_file.create_dataset('x', shape=data.shape, dtype='<i4',
+                                      chunks=(16, 16), compression='gzip')
+    ds.write_parallel(data, max_workers=2)
+
+    # Identical to what HDF5's own filter pipeline would write
+    ref = writable_file.create_dataset('ref', data=data, chunks=(16, 16),
+                                       compression='gzip')
+    for offset in [(0, 0), (16, 48), (48, 32)]:
+        assert ds.id.read_direct_chunk(offset) == ref.id.read_direct_chunk(offset)
+
+
+def test_write_parallel_broadcast_and_convert(writable_file):
+    ds = writable_file.create_dataset('x', shape=(20, 20), dtype='>i8',
+                                      chunks=(5, 5), compression='gzip')
+    ds.write_parallel(np.arange(20, dtype='u1'))
+    np.testing.assert_array_equal(ds[()], np.broadcast_to(np.arange(20), (20, 20)))
+
+    with pytest.raises(TypeError):
+        ds.write_parallel(np.arange(3), np.s_[:10, :10])
+
+
+def test_write_parallel_incompressible(writable_file):
+    # LZF skips chunks it can't shrink
+    data = np.random.default_rng(0).integers(0, 256, 256, dtype='u1')
+    ds = writable_file.create_dataset('x', shape=(256,), dtype='u1',
+                                      chunks=(64,), compression='lzf')
+    ds.write_parallel(data)
+    np.testing.assert_array_equal(ds[()], data)
+    np.testing.assert_array_equal(ds.read_parallel(), data)
+
+
+def test_write_parallel_fallback(writable_file):
+    ds = writable_file.create_dataset('scaleoffset', shape=(100,), dtype='i8',
+                                      chunks=(10,), scaleoffset=0)
+    ds.write_parallel(np.arange(100))
+    np.testing.assert_array_equal(ds[()], np.arange(100))
+
+    ds = writable_file.create_dataset('chunked', shape=(100,), dtype='i8',
+                                      chunks=(10,), compression='gzip')
+    ds.write_parallel(np.arange(50), np.s_[::2])
+    ds.write_parallel([7, 8], np.s_[[1, 3]])
+    expected = np.zeros(100, dtype='i8')
+    expected[::2] = np.arange(50)
+    expected[[1, 3]] = [7, 8]
+    np.testing.assert_array_equal(ds[()], expected)
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_parallel_io_doesnt_hold_phil(tmp_path, max_workers):
+    # While chunks are being (de)compressed, other threads can use h5py
+    with h5py.File(tmp_path / 'a.h5', 'w') as fa, \
+            h5py.File(tmp_path / 'b.h5', 'w') as fb:
+        ds = fa.create_dataset('x', data=np.arange(100), chunks=(10,),
+                               compression='gzip')
+        other = fb.create_dataset('y', data=np.arange(5))
+        pipeline = ds._filter_pipeline
+
+        for method in ('decode', 'encode'):
+            in_filter = threading.Event()
+            other_done = threading.Event()
+            orig = getattr(pipeline, method)
+
+            def slow_filter(*args):
+                in_filter.set()
+                other_done.wait(10)
+                return orig(*args)
+
+            pipeline.__dict__[method] = slow_filter
+            if method == 'decode':
+                io = threading.Thread(target=ds.read_parallel,
+                                      kwargs=dict(max_workers=max_workers))
+            else:
+                io = threading.Thread(target=ds.write_parallel,
+                                      args=(np.arange(100),),
+                                      kwargs=dict(max_workers=max_workers))
+            io.start()
+            assert in_filter.wait(10)
+
+            reader = threading.Thread(target=lambda: other[:] is not None and other_done.set())
+            reader.start()
+            reader.join(10)
+            assert other_done.is_set()
+            io.join(10)
+            assert not io.is_alive()
+            del pipeline.__dict__[method]
+
+        np.testing.assert_array_equal(ds[()], np.arange(100))
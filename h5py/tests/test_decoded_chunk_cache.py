@@ -0,0 +1,179 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the cache of decoded chunks (h5py.decoded_chunk_cache).
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py._hl import chunks as chunk_io
+from h5py._hl.chunks import DecodedChunkCache
+
+cache = h5py.decoded_chunk_cache
+
+
+@pytest.fixture
+def enabled():
+    cache.clear()
+    cache.reset_stats()
+    cache.resize(10 * 1024**2)
+    yield cache
+    cache.resize(0)
+    cache.clear()
+    cache.reset_stats()
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'data.h5'
+    with h5py.File(path, 'w') as f:
+        f.create_dataset('x', data=np.arange(1000, dtype='f8').reshape(100, 10),
+                         chunks=(10, 10), compression='gzip')
+        f.create_dataset('contiguous', data=np.arange(10))
+    return path
+
+
+def test_lru():
+    c = DecodedChunkCache(300)
+    a = np.zeros(100, dtype='u1')
+    for i in range(3):
+        c.put(('d', 0, (i,)), a.copy(), 0)
+    assert len(c) == 3 and c.nbytes == 300
+    assert c.get(('d', 0, (0,))) is not None
+    c.put(('d', 0, (3,)), a.copy(), 0)
+    assert c.evictions == 1
+    assert c.get(('d', 0, (1,))) is None  # Least recently used
+    assert c.get(('d', 0, (0,))) is not None
+    assert (c.hits, c.misses) == (2, 1)
+
+    # Too big to cache at all
+    c.put(('d', 0, (9,)), np.zeros(301, dtype='u1'), 0)
+    assert c.get(('d', 0, (9,))) is None
+
+    c.resize(100)
+    assert len(c) == 1 and c.nbytes == 100
+    with pytest.raises(ValueError):
+        c.resize(-1)
+
+
+def test_stale_put_ignored():
+    c = DecodedChunkCache(1000)
+    gen = c.generation('d')
+    c.invalidate('d')
+    c.put(('d', 0, (0,)), np.zeros(10), gen)
+    assert len(c) == 0
+
+
+def test_disabled_by_default(path):
+    assert cache.capacity == 0
+    with h5py.File(path, 'r') as f:
+        f['x'][:20]
+    assert len(cache) == 0
+
+
+def test_reopen(enabled, path):
+    with h5py.File(path, 'r') as f:
+        np.testing.assert_array_equal(f['x'][5:25, 3], np.arange(53, 253, 10))
+    assert len(cache) == 3
+    assert cache.misses == 3 and cache.hits == 0
+
+    with h5py.File(path, 'r') as f:
+        arr = f['x'][12:18]
+        np.testing.assert_array_equal(arr, np.arange(120, 180).reshape(6, 10))
+        arr[0] = 0  # The cached chunk can't be modified
+        np.testing.assert_array_equal(f['x'].read_parallel(np.s_[10:20]),
+                                      np.arange(100, 200).reshape(10, 10))
+    assert cache.hits == 2
+
+
+def test_unsupported(enabled, path):
+    with h5py.File(path, 'r') as f:
+        np.testing.assert_array_equal(f['contiguous'][2:5], [2, 3, 4])
+        np.testing.assert_array_equal(f['x'][[1, 3], 0], [10, 30])
+    assert len(cache) == 0
+
+
+def test_unsorted_index_list(enabled, path):
+    with h5py.File(path, 'r') as f:
+        ds = f['x']
+        np.testing.assert_array_equal(ds[[5, 1, 2], 0], [50, 10, 20])
+        np.testing.assert_array_equal(ds[[3, 3, 0], 1], [31, 31, 1])
+        np.testing.assert_array_equal(ds[12, [9, 0, 9]], [129, 120, 129])
+        np.testing.assert_array_equal(ds[[5, 1, 2]], ds[()][[5, 1, 2]])
+
+
+@pytest.mark.parametrize('change', [
+    lambda ds: ds.__setitem__(np.s_[15], -1),
+    lambda ds: ds.write_direct(np.full((1, 10), -1.), dest_sel=np.s_[15:16]),
+    lambda ds: ds.write_parallel(np.full((10, 10), -1.), np.s_[10:20]),
+])
+def test_invalidated_by_writes(enabled, path, change):
+    with h5py.File(path, 'a') as f:
+        ds = f['x']
+        ds[:]
+        assert len(cache) == 10
+        change(ds)
+        assert len(cache) == 0
+        np.testing.assert_array_equal(ds[15], -1)
+
+
+def test_invalidated_by_failed_write(enabled, path, monkeypatch):
+    # Some chunks may be written before the failure
+    def write_then_fail(dset, selection, source, max_workers=None):
+        dset.id.write_direct_chunk((10, 0), zlib.compress(b'\0' * 800))
+        raise OSError("Write failed")
+
+    monkeypatch.setattr(chunk_io, 'write_chunks', write_then_fail)
+    with h5py.File(path, 'a') as f:
+        ds = f['x']
+        ds[:]
+        with pytest.raises(OSError):
+            ds.write_parallel(np.full((20, 10), -1.), np.s_[10:30])
+        assert len(cache) == 0
+        np.testing.assert_array_equal(ds[15], 0)
+
+
+def test_recreated(enabled, tmp_path):
+    # A new dataset may be at the address of a deleted one
+    with h5py.File(tmp_path / 'r.h5', 'w') as f:
+        kw = dict(chunks=(4,), compression='gzip')
+        f.create_dataset('x', data=np.arange(8), **kw)
+        addr = h5py.h5o.get_info(f['x'].id).addr
+        f['x'][:]
+        del f['x']
+        ds = f.create_dataset('x', data=np.arange(8) + 10, **kw)
+        if h5py.h5o.get_info(ds.id).addr != addr:
+            pytest.skip("The address wasn't reused")
+        np.testing.assert_array_equal(ds[:], np.arange(8) + 10)
+
+
+def test_invalidated_by_resize(enabled, tmp_path):
+    with h5py.File(tmp_path / 'r.h5', 'w') as f:
+        ds = f.create_dataset('x', data=np.arange(10), chunks=(4,),
+                              maxshape=(None,), compression='gzip')
+        ds[:]
+        assert len(cache) == 3
+        ds.resize((6,))
+        assert len(cache) == 0
+        ds.resize((10,))
+        np.testing.assert_array_equal(ds[:], [0, 1, 2, 3, 4, 5, 0, 0, 0, 0])
+
+
+def test_other_dataset_object(enabled, path):
+    # Writes through another object for the same dataset are noticed
+    with h5py.File(path, 'a') as f:
+        f['x'][:10]
+        assert len(cache) == 1
+        f['x'][0] = -1
+        np.testing.assert_array_equal(f['x'][0], -1)
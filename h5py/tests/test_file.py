@@ -13,6 +13,7 @@
     Tests all aspects of File objects, including their creation.
 """
 
+import numpy
 import pytest
 import os
 import stat
@@ -470,6 +471,34 @@ class TestDrivers(TestCase):
             File(tf, 'w', driver='core')
         tf.close()
 
+    def test_mmap(self):
+        """ Memory map driver reads existing files """
+        fname = self.mktemp()
+        with File(fname, 'w') as f:
+            f['x'] = numpy.arange(1000)
+            f.create_group('a/b').attrs['y'] = 'z'
+        with File(fname, 'r', driver='mmap') as f:
+            self.assertEqual(f.driver, 'mmap')
+            self.assertArrayEqual(f['x'][::3], numpy.arange(0, 1000, 3))
+            self.assertEqual(f['a/b'].attrs['y'], 'z')
+            with self.assertRaises(ValueError):
+                f.create_group('c')
+
+    def test_mmap_readonly(self):
+        """ Memory map driver can't open files for writing """
+        fname = self.mktemp()
+        File(fname, 'w').close()
+        for mode in ('r+', 'a', 'w'):
+            with self.assertRaises(ValueError):
+                File(fname, mode, driver='mmap')
+
+    def test_mmap_empty(self):
+        """ Memory map driver fails normally for an empty file """
+        fname = self.mktemp()
+        open(fname, 'wb').close()
+        with self.assertRaises(OSError):
+            File(fname, 'r', driver='mmap')
+
     # TODO: family driver tests
 
 
@@ -259,6 +259,97 @@ class TestFileObj(TestCase):
         fileobj.readinto = None
         self.assertRaises(Exception, list, f['test'])
 
+    def test_positional_io(self):
+        class PositionalBytesIO(io.BytesIO):
+            seeks = 0
+
+            def seek(self, *args):
+                self.seeks += 1
+                return super().seek(*args)
+
+            def readinto_at(self, offset, buf):
+                with self.getbuffer() as data:
+                    n = len(data[offset:offset + len(buf)])
+                    buf[:n] = data[offset:offset + n]
+                return n
+
+            def write_at(self, offset, buf):
+                io.BytesIO.seek(self, offset)
+                return self.write(buf)
+
+        fileobj = PositionalBytesIO()
+        self.check_write(fileobj)
+        self.check_read(fileobj)
+        # Only to find the size of the file
+        self.assertLess(fileobj.seeks, 10)
+
+    def test_file_descriptor(self):
+        # Data buffered by the file object is flushed before reading the
+        # file descriptor directly
+        with io.BytesIO() as bio:
+            self.check_write(bio)
+            data = bio.getvalue()
+        fname = self.mktemp()
+        with open(fname, 'wb+') as fileobj:
+            fileobj.write(data)
+            self.check_read(fileobj)
+            # The file object is usable afterwards
+            fileobj.seek(0)
+            self.assertEqual(fileobj.read(), data)
+
+    def test_block_cache(self):
+        class CountingBytesIO(io.BytesIO):
+            reads = 0
+
+            def read(self, *args):
+                self.reads += 1
+                return super().read(*args)
+
+            def readinto(self, b):
+                self.reads += 1
+                return super().readinto(b)
+
+        with io.BytesIO() as fileobj:
+            with h5py.File(fileobj, 'w') as f:
+                for i in range(100):
+                    f.create_group('g%02d' % i).attrs['i'] = i
+            data = fileobj.getvalue()
+
+        fileobj = CountingBytesIO(data)
+        cache = h5py.h5fd.BlockCache(block_size=4096)
+        with h5py.File(fileobj, 'r', block_cache=cache) as f:
+            self.assertEqual([f[k].attrs['i'] for k in f], list(range(100)))
+        # Each block is read once, with read-ahead
+        self.assertEqual(fileobj.reads, cache.reads)
+        self.assertLessEqual(cache.reads, len(data) // 4096 + 1)
+        self.assertGreater(cache.hits, cache.misses)
+        self.assertEqual(len(cache), 0)  # Cleared when the file is closed
+
+    def test_block_cache_write(self):
+        fileobj = io.BytesIO()
+        cache = h5py.h5fd.BlockCache(block_size=512, max_bytes=2048)
+        with h5py.File(fileobj, 'w', block_cache=cache) as f:
+            f['x'] = list(range(1000))
+            f['x'][10:20] = -1
+            self.assertEqual(list(f['x'][8:22]), [8, 9] + [-1] * 10 + [20, 21])
+        with h5py.File(fileobj, 'r', block_cache=cache) as f:
+            self.assertEqual(list(f['x'][8:22]), [8, 9] + [-1] * 10 + [20, 21])
+            self.assertEqual(f['x'][-1], 999)
+            self.assertLessEqual(cache.nbytes, 2048)
+        self.assertGreater(cache.evictions, 0)
+
+    def test_block_cache_shared(self):
+        fileobj = io.BytesIO()
+        h5py.File(fileobj, 'w').close()
+        cache = h5py.h5fd.BlockCache()
+        with h5py.File(fileobj, 'r', block_cache=cache):
+            with self.assertRaises(ValueError):
+                h5py.File(io.BytesIO(fileobj.getvalue()), 'r', block_cache=cache)
+        # Free again once the first file is closed
+        h5py.File(fileobj, 'r', block_cache=cache).close()
+        with self.assertRaises(TypeError):
+            h5py.File(fileobj, 'r', block_cache=4096)
+
 
 class TestTrackOrder(TestCase):
     def populate(self, f):
@@ -13,6 +13,7 @@
 """
 import os
 import numpy as np
+import pytest
 import h5py
 
 from .common import ut, TestCase
@@ -92,3 +93,58 @@ def test_filters_available():
     assert 'gzip' in h5py.filters.encode
     assert 'lzf' in h5py.filters.decode
     assert 'lzf' in h5py.filters.encode
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(compression='gzip'),
+    dict(compression='gzip', compression_opts=9, shuffle=True, fletcher32=True),
+    dict(compression='lzf', shuffle=True),
+    dict(fletcher32=True),
+])
+def test_filter_pipeline_matches_hdf5(writable_file, kwargs):
+    data = np.arange(1000, dtype='<i4').reshape(10, 100) % 37
+    ds = writable_file.create_dataset('x', data=data, chunks=(5, 50), **kwargs)
+    pipeline = h5py.filters.FilterPipeline(ds.id.get_create_plist(), 4)
+    assert pipeline.supported
+
+    filter_mask, raw = ds.id.read_direct_chunk((5, 0))
+    chunk = pipeline.decode(raw, filter_mask, data[5:, :50].nbytes)
+    np.testing.assert_array_equal(
+        np.frombuffer(chunk, dtype='<i4').reshape(5, 50), data[5:, :50]
+    )
+
+    # Encoding must give the same bytes HDF5 writes
+    assert pipeline.encode(data[5:, :50].copy()) == (filter_mask, bytes(raw))
+
+
+def test_filter_pipeline_lzf_incompressible(tmp_path):
+    path = tmp_path / 'test.h5'
+    data = np.random.default_rng(0).integers(0, 256, 64, dtype='u1')
+    with h5py.File(path, 'w') as f:
+        ds = f.create_dataset('x', shape=(64,), dtype='u1',
+                              chunks=(64,), compression='lzf')
+        pipeline = h5py.filters.FilterPipeline(ds.id.get_create_plist(), 1)
+        filter_mask, raw = pipeline.encode(data)
+        assert filter_mask == 1
+        ds.id.write_direct_chunk((0,), raw, filter_mask)
+
+    # Reopen, as some HDF5 versions don't see the filter mask until then
+    with h5py.File(path, 'r') as f:
+        np.testing.assert_array_equal(f['x'][:], data)
+
+
+def test_filter_pipeline_fletcher32_error(writable_file):
+    ds = writable_file.create_dataset('x', data=np.arange(100), chunks=(100,),
+                                      fletcher32=True)
+    pipeline = h5py.filters.FilterPipeline(ds.id.get_create_plist(), 8)
+    filter_mask, raw = ds.id.read_direct_chunk((0,))
+    raw = bytearray(raw)
+    raw[0] ^= 1
+    with pytest.raises(OSError, match='fletcher32'):
+        pipeline.decode(raw, filter_mask, 800)
+
+
+def test_filter_pipeline_unsupported(writable_file):
+    ds = writable_file.create_dataset('x', data=np.arange(100.), chunks=(10,),
+                                      scaleoffset=2)
+    assert not h5py.filters.FilterPipeline(ds.id.get_create_plist(), 8).supported
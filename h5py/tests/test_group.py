@@ -747,6 +747,73 @@ class TestVisitLinks(TestCase):
         x = self.f.visititems_links(lambda x, y: l.append((x,y)) or -1)
         assert x == -1 and len(l) == 1
 
+class TestSnapshot(TestCase):
+
+    """
+        Feature: .snapshot() describes all links below a group as a table
+    """
+
+    def setUp(self):
+        self.f = File(self.mktemp(), 'w')
+        self.f.create_dataset('grp/chunked', data=np.arange(10), chunks=(5,))
+        self.f.create_dataset('grp/scalar', data=5.0)
+        self.f.create_dataset('empty', data=h5py.Empty('f4'))
+        self.f['grp/dtype'] = np.dtype('i2')
+        self.f['grp'].attrs['a'] = 1
+        self.f['hard'] = self.f['grp/chunked']
+        self.f['soft'] = SoftLink('/grp/chunked')
+        self.f['ext'] = ExternalLink('other.h5', '/x')
+
+    def tearDown(self):
+        self.f.close()
+
+    def test_snapshot(self):
+        snap = self.f.snapshot()
+        rows = {p: i for i, p in enumerate(snap['path'])}
+        self.assertEqual(list(snap['path']), sorted(rows))
+        self.assertEqual(set(rows), {
+            'empty', 'ext', 'grp', 'grp/chunked', 'grp/dtype', 'grp/scalar',
+            'hard', 'soft',
+        })
+        for col in snap.values():
+            self.assertEqual(len(col), len(rows))
+
+        def row(path):
+            return {k: v[rows[path]] for k, v in snap.items()}
+
+        grp = row('grp')
+        self.assertEqual((grp['link_type'], grp['type']), ('hard', 'group'))
+        self.assertEqual(grp['num_attrs'], 1)
+        self.assertIsNone(grp['shape'])
+
+        chunked = row('grp/chunked')
+        self.assertEqual(chunked['type'], 'dataset')
+        self.assertEqual(chunked['shape'], (10,))
+        self.assertEqual(chunked['dtype'], self.f['grp/chunked'].dtype)
+        self.assertEqual(chunked['layout'], 'chunked')
+        self.assertEqual(chunked['chunks'], (5,))
+        self.assertEqual(chunked['storage_size'], 80)
+        self.assertEqual(row('hard')['addr'], chunked['addr'])
+        self.assertNotEqual(grp['addr'], chunked['addr'])
+
+        scalar = row('grp/scalar')
+        self.assertEqual((scalar['shape'], scalar['layout']), ((), 'contiguous'))
+        self.assertIsNone(scalar['chunks'])
+        self.assertIsNone(row('empty')['shape'])
+        self.assertEqual(row('grp/dtype')['type'], 'datatype')
+        self.assertEqual(row('grp/dtype')['dtype'], np.dtype('i2'))
+
+        for path, kind in [('soft', 'soft'), ('ext', 'external')]:
+            link = row(path)
+            self.assertEqual((link['link_type'], link['type']), (kind, ''))
+            self.assertEqual((link['addr'], link['num_attrs']), (0, -1))
+
+    def test_subgroup(self):
+        snap = self.f['grp'].snapshot()
+        self.assertEqual(list(snap['path']), ['chunked', 'dtype', 'scalar'])
+        self.assertEqual(len(self.f.create_group('new').snapshot()['path']), 0)
+
+
 class Visitor:
     """ Class for exercise 'visit' and 'visititems' methods """
 
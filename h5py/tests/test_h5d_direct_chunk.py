@@ -1,9 +1,12 @@
+import threading
+
 import h5py
 import numpy
 import numpy.testing
 import pytest
 
 from .common import ut, TestCase
+from h5py._objects import phil
 
 
 class TestWriteDirectChunk(TestCase):
@@ -182,3 +185,30 @@ class TestReadDirectChunkToOut:
         out = array[:, :, ::2]  # Array is not contiguous
         with pytest.raises(ValueError):
             dataset.id.read_direct_chunk((0, 0), out=out)
+
+
+class TestDirectChunkLocking:
+    """Direct chunk I/O releases the GIL, so it must be serialized by phil"""
+
+    @pytest.mark.parametrize("op", ["read", "write"])
+    def test_waits_for_phil(self, writable_file, op):
+        ref_data = numpy.arange(16).reshape(4, 4)
+        dataset = writable_file.create_dataset(
+            "uncompressed", data=ref_data, chunks=ref_data.shape)
+        dsid = dataset.id
+        done = threading.Event()
+
+        def worker():
+            if op == "read":
+                dsid.read_direct_chunk((0, 0))
+            else:
+                dsid.write_direct_chunk((0, 0), ref_data.tobytes())
+            done.set()
+
+        with phil:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            # The worker can't enter HDF5 while another thread holds phil
+            assert not done.wait(0.2)
+        thread.join()
+        assert done.is_set()
@@ -56,6 +56,71 @@ class TestCompound(ut.TestCase):
         self.assertEqual(tid.dtype.itemsize, size)
 
 
+class TestPyCreateCached(ut.TestCase):
+
+    """
+        Feature: Memory types for reads & writes are cached
+    """
+
+    def setUp(self):
+        h5t.py_create_cache_clear()
+
+    def tearDown(self):
+        h5t.py_create_cache_clear()
+
+    def test_cached(self):
+        spec = {'names': ['a', 'b'], 'formats': ['<i4', '<f8'], 'offsets': [0, 8]}
+        tid = h5t.py_create_cached(np.dtype(spec))
+        self.assertEqual(tid, h5t.py_create(np.dtype(spec)))
+        self.assertIs(h5t.py_create_cached(np.dtype(spec)), tid)
+        # Same layout, but aligned
+        aligned = np.dtype([('a', '<i4'), ('b', '<f8')], align=True)
+        self.assertIsNot(h5t.py_create_cached(aligned), tid)
+        info = h5t.py_create_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+        self.assertEqual(info.maxsize, h5t.PY_CREATE_CACHE_SIZE)
+
+    def test_metadata(self):
+        """ Dtypes with h5py metadata, which equal plain dtypes, aren't cached
+        """
+        plain = h5t.py_create_cached(np.dtype([('a', '<i8')]), logical=True)
+        enum = np.dtype([('a', h5py.enum_dtype({'x': 0, 'y': 1}, basetype='<i8'))])
+        tid = h5t.py_create_cached(enum, logical=True)
+        self.assertIsInstance(tid.get_member_type(0), h5t.TypeEnumID)
+        self.assertNotIsInstance(plain.get_member_type(0), h5t.TypeEnumID)
+        self.assertEqual(h5t.py_create_cache_info().currsize, 1)
+
+    def test_bounded(self):
+        for n in range(1, h5t.PY_CREATE_CACHE_SIZE + 11):
+            h5t.py_create_cached('S%d' % n)
+        info = h5t.py_create_cache_info()
+        self.assertEqual(info.currsize, h5t.PY_CREATE_CACHE_SIZE)
+        self.assertEqual(info.misses, h5t.PY_CREATE_CACHE_SIZE + 10)
+        # Least recently used dropped first
+        h5t.py_create_cached('S1')
+        self.assertEqual(h5t.py_create_cache_info().misses,
+                         h5t.PY_CREATE_CACHE_SIZE + 11)
+
+    def test_dataset_read(self):
+        dt = np.dtype([('f%d' % i, '<f4') for i in range(20)])
+        with h5py.File('x.h5', 'w', driver='core', backing_store=False) as f:
+            dset = f.create_dataset('x', data=np.ones(10, dtype=dt))
+            dset[2:4]
+            dset[5:8]
+            self.assertGreaterEqual(h5t.py_create_cache_info().hits, 1)
+
+    def test_closed(self):
+        """ A cached type closed by a caller is made again """
+        dt = np.dtype([('a', '<i4'), ('b', '<f8')])
+        h5t.py_create_cached(dt).close()
+        tid = h5t.py_create_cached(dt)
+        self.assertTrue(tid.valid)
+        with h5py.File('x.h5', 'w', driver='core', backing_store=False) as f:
+            dset = f.create_dataset('x', data=np.ones(4, dtype=dt))
+            h5t.py_create_cached(dt).close()
+            self.assertEqual(dset[:2]['b'].tolist(), [1.0, 1.0])
+
+
 class TestTypeFloatID(TestCase):
     """Test TypeFloatID."""
 
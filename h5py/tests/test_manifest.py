@@ -0,0 +1,116 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2025 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for byte-range manifests (h5py.manifest).
+"""
+
+import io
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py import manifest
+
+SELECTIONS = [(), np.s_[1:3], np.s_[..., 1], np.s_[::2, 1:3], np.s_[-1], np.s_[2:2]]
+
+
+def make_file(path, **kwargs):
+    with h5py.File(path, 'w', **kwargs) as f:
+        f.create_dataset('gzip', data=np.arange(200.).reshape(20, 10), chunks=(6, 4),
+                         compression='gzip', shuffle=True, fletcher32=True)
+        ds = f.create_dataset('g/lzf', shape=(10, 10), chunks=(5, 5), dtype='>i4',
+                              fillvalue=7, compression='lzf')
+        ds[1:4, 2] = 1
+        f.create_dataset('g/contiguous', data=np.arange(60, dtype='>i2').reshape(3, 4, 5))
+        f.create_dataset('compound', data=np.array([(1, 2.5), (3, 4.5)],
+                                                   dtype=[('a', 'u1'), ('b', '<f4')]))
+        f.create_dataset('scalar', data=3.5)
+        f.create_dataset('unallocated', shape=(4,), dtype='f4', fillvalue=2)
+        f.create_dataset('strings', data=['a', 'bc'])
+        f.create_dataset('scaleoffset', data=np.arange(10), chunks=(5,), scaleoffset=0)
+
+        dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+        dcpl.set_layout(h5py.h5d.COMPACT)
+        h5py.h5d.create(f.id, b'compact', h5py.h5t.NATIVE_INT32,
+                        h5py.h5s.create_simple((6,)), dcpl=dcpl)
+        f['compact'][:] = np.arange(6)
+
+
+@pytest.mark.parametrize('userblock_size', [0, 512])
+def test_roundtrip(tmp_path, userblock_size):
+    path = tmp_path / 'data.h5'
+    make_file(path, **({'userblock_size': userblock_size} if userblock_size else {}))
+    unsupported = manifest.export(path, tmp_path / 'data.manifest')
+    assert sorted(unsupported) == ['/scaleoffset', '/strings']
+
+    with manifest.open(tmp_path / 'data.manifest') as mf, h5py.File(path, 'r') as f:
+        assert sorted(mf.keys()) == [
+            '/compact', '/compound', '/g/contiguous', '/g/lzf', '/gzip',
+            '/scalar', '/unallocated',
+        ]
+        for name in mf:
+            ds, mds = f[name], mf[name]
+            assert mds.shape == ds.shape
+            assert mds.dtype == ds.dtype
+            assert mds.chunks == ds.chunks
+            for sel in SELECTIONS:
+                try:
+                    expected = ds[sel]
+                except (ValueError, IndexError):
+                    continue
+                res = mds[sel]
+                assert type(res) is type(expected)
+                np.testing.assert_array_equal(res, expected)
+
+
+def test_file_objects(tmp_path):
+    path = tmp_path / 'data.h5'
+    make_file(path)
+    buf = io.BytesIO()
+    with h5py.File(path, 'a') as f:
+        f['gzip'][0] = -1
+        manifest.export(f, buf)  # Flushes the file first
+
+    buf.seek(0)
+    with pytest.raises(TypeError):
+        manifest.open(buf)
+    buf.seek(0)
+    with manifest.open(buf, path) as mf:
+        np.testing.assert_array_equal(mf['gzip'][0], -1)
+        np.testing.assert_array_equal(mf['/g/lzf'][:, 2], [7, 1, 1, 1, 7, 7, 7, 7, 7, 7])
+
+
+def test_errors(tmp_path):
+    path = tmp_path / 'data.h5'
+    make_file(path)
+    manifest.export(path, tmp_path / 'm.npz')
+
+    with manifest.open(tmp_path / 'm.npz', path) as mf:
+        with pytest.raises(TypeError):
+            mf['strings']
+        with pytest.raises(KeyError):
+            mf['nothing']
+        with pytest.raises(TypeError):
+            mf['gzip'][[1, 2]]
+        with pytest.raises(IndexError):
+            mf['gzip'][20]
+        with pytest.raises(ValueError):
+            mf['gzip'][::-1]
+
+    # The file has changed since the manifest was made
+    with h5py.File(path, 'a') as f:
+        f['more'] = np.arange(1000)
+    with pytest.raises(ValueError):
+        manifest.open(tmp_path / 'm.npz', path)
+
+    np.savez(tmp_path / 'other.npz', x=np.arange(3))
+    with pytest.raises(ValueError):
+        manifest.open(tmp_path / 'other.npz', path)
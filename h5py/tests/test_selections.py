@@ -140,3 +140,43 @@ class TestSelection(BaseSelection):
         # args is a single Selection instance, but args shape doesn't match Shape
         with self.assertRaises(TypeError):
             sel.select((100,), st3, dset)
+
+
+class TestFancySelection(BaseSelection):
+
+    """ Building hyperslab unions for fancy indexing
+    """
+
+    def check_blocks(self, shape, args, expected):
+        st = sel.select(shape, args)
+        self.assertIsInstance(st, sel.FancySelection)
+        sid = st.id
+        nblocks = sid.get_select_hyper_nblocks()
+        blocks = sid.get_select_hyper_blocklist().reshape(nblocks, 2, len(shape))
+        self.assertEqual(
+            [tuple(map(tuple, b)) for b in blocks.tolist()], expected
+        )
+
+    def test_runs_merged(self):
+        """ Consecutive indices become a single block """
+        self.check_blocks((20, 3), (np.array([1, 2, 3, 7, 9, 10]), slice(None)), [
+            ((1, 0), (3, 2)), ((7, 0), (7, 2)), ((9, 0), (10, 2)),
+        ])
+
+    def test_inner_axis(self):
+        self.check_blocks((2, 20), (slice(None), [0, 5, 6, 19]), [
+            ((0, 0), (1, 0)), ((0, 5), (1, 6)), ((0, 19), (1, 19)),
+        ])
+
+    def test_many_indices(self):
+        """ Enough runs to combine several groups of hyperslabs """
+        rng = np.random.default_rng(0)
+        idx = np.unique(rng.integers(0, 5000, 1500))
+        dset = self.f.create_dataset('dset', data=np.arange(10000).reshape(5000, 2))
+        np.testing.assert_array_equal(dset[idx, 1], idx * 2 + 1)
+        np.testing.assert_array_equal(dset[idx[:5]], dset[()][idx[:5]])
+
+    def test_empty(self):
+        st = sel.select((10, 3), (np.array([], dtype=int), slice(None)))
+        self.assertEqual(st.nselect, 0)
+        self.assertEqual(st.array_shape, (0, 3))
@@ -32,7 +32,7 @@ MODULES = ['defs', '_errors', '_objects', '_proxy', 'h5fd', 'h5z',
             'h5d', 'h5a', 'h5f', 'h5g',
             'h5l', 'h5o',
             'h5ds', 'h5ac',
-            'h5pl'] + MODULES_NUMPY2
+            'h5pl', '_filters'] + MODULES_NUMPY2
 
 COMPILER_SETTINGS = {
    'libraries'      : ['hdf5', 'hdf5_hl'],
@@ -46,19 +46,21 @@ COMPILER_SETTINGS = {
                       ]
 }
 
-EXTRA_SRC = {'h5z': [ localpath("lzf/lzf_filter.c") ]}
+EXTRA_SRC = {'h5z': [ localpath("lzf/lzf_filter.c") ], '_filters': []}
 
 # Set the environment variable H5PY_SYSTEM_LZF=1 if we want to
 # use the system lzf library
 if os.environ.get('H5PY_SYSTEM_LZF', '0') == '1':
     EXTRA_LIBRARIES = {
-       'h5z': [ 'lzf' ]
+       'h5z': [ 'lzf' ],
+       '_filters': [ 'lzf' ],
     }
 else:
     COMPILER_SETTINGS['include_dirs'] += [localpath('lzf/lzf')]
 
-    EXTRA_SRC['h5z'] += [localpath("lzf/lzf/lzf_c.c"),
-                  localpath("lzf/lzf/lzf_d.c")]
+    for module in ('h5z', '_filters'):
+        EXTRA_SRC[module] += [localpath("lzf/lzf/lzf_c.c"),
+                              localpath("lzf/lzf/lzf_d.c")]
 
     EXTRA_LIBRARIES = {}
 